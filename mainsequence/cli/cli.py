@@ -6052,6 +6052,64 @@ def _data_node_storage_run_query_impl(
         raise typer.Exit(1)
 
 
+def _data_node_storage_compact_local_impl(
+    *,
+    tables: list[str] | None,
+    db_path: str | None,
+    min_fragments: int,
+    target_file_rows: int,
+) -> None:
+    from ..client.data_sources_interfaces import get_duckdb_interface
+
+    try:
+        interface = get_duckdb_interface(db_path)
+    except ModuleNotFoundError as e:
+        error(str(e))
+        raise typer.Exit(1) from e
+
+    tables = tables or interface.stored_tables()
+    busy = [table for table in tables if interface.is_table_write_locked(table)]
+    if busy:
+        error(
+            "Another process is writing to "
+            f"{', '.join(busy)}; retry the compaction when that write has finished."
+        )
+        raise typer.Exit(1)
+
+    results = []
+    for table in tables:
+        try:
+            summary = interface.compact(
+                table,
+                min_fragments=min_fragments,
+                target_file_rows=target_file_rows,
+            )
+        except Exception as e:
+            error(f"Compaction failed for table {table}: {e}")
+            raise typer.Exit(1) from e
+        results.append({"table": table, **summary})
+
+    if _emit_json({"db_path": interface.db_path, "tables": results}):
+        return
+    if not results:
+        info(f"No local DuckDB tables found under {interface.db_path}")
+        return
+    print_table(
+        "Local DuckDB compaction",
+        ["Table", "Partitions", "Fragments merged", "Files written"],
+        [
+            [
+                item["table"],
+                str(item["partitions_compacted"]),
+                str(item["files_deleted"]),
+                str(item["files_written"]),
+            ]
+            for item in results
+        ],
+    )
+    success(f"Compacted {len(results)} local DuckDB table(s) under {interface.db_path}")
+
+
 def _data_node_storage_delete_impl(
     *,
     storage_uid: str,
@@ -6819,6 +6877,48 @@ def data_node_storage_column_search_cmd(
     )
 
 
+@data_node_storage_group.command("compact-local")
+def data_node_storage_compact_local_cmd(
+    tables: list[str] | None = typer.Option(
+        None, "--table", help="Physical table to compact. Repeat to select several; default is all."
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db-path",
+        help="DuckDB storage root. Defaults to DUCKDB_PATH or the local data path.",
+    ),
+    min_fragments: int = typer.Option(
+        2,
+        "--min-fragments",
+        min=1,
+        help="Only rewrite partitions holding at least this many files.",
+    ),
+    target_file_rows: int = typer.Option(
+        5_000_000, "--target-file-rows", min=1, help="Maximum rows per compacted Parquet file."
+    ),
+):
+    """
+    Merge small Parquet fragments of local DuckDB data node tables into sorted files.
+
+    Refuses to run while another process is writing one of the selected tables. Reads
+    running in other processes are not paused and may have to be retried.
+
+    Examples
+    --------
+    ```bash
+    mainsequence data-node compact-local
+    mainsequence data-node compact-local --table my_node_table --min-fragments 16
+    mainsequence data-node compact-local --db-path /data/duck_db --target-file-rows 1000000
+    ```
+    """
+    _data_node_storage_compact_local_impl(
+        tables=tables,
+        db_path=db_path,
+        min_fragments=min_fragments,
+        target_file_rows=target_file_rows,
+    )
+
+
 @data_node_storage_group.command("delete")
 def data_node_storage_delete_cmd(
     storage_uid: str = typer.Argument(..., help="Data node storage UID."),
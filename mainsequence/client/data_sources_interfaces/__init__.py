@@ -1,5 +1,26 @@
 from __future__ import annotations
 
+import atexit
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .partitioning import PartitionSpec
+
+# Streaming reads (`iter_batches`): rows per batch and the supported batch types.
+DEFAULT_BATCH_ROWS = 100_000
+BATCH_OUTPUTS = ("pandas", "arrow")
+# Whole-range reads (`get_df_between_dates`) can also hand back a Polars DataFrame.
+READ_OUTPUTS = ("pandas", "arrow", "polars")
+# `index_coordinates` / `dimension_range_map` lists at least this long are joined as a
+# temporary relation instead of being expanded into one OR branch per entry.
+COORDINATE_JOIN_MIN_ENTRIES = 64
+
+_INTERFACE_POOL: dict[tuple[str, str], Any] = {}
+_INTERFACE_POOL_LOCK = threading.Lock()
+
 
 def get_duckdb_interface_class():
     try:
@@ -22,4 +43,159 @@ def get_sqlite_interface_class():
     return SQLiteInterface
 
 
-__all__ = ["get_duckdb_interface_class", "get_sqlite_interface_class"]
+def _pooled_interface(interface_class: type, db_path: str | Path | None) -> Any:
+    resolved_path = interface_class.resolve_db_path(db_path)
+    key = (interface_class.__name__, resolved_path)
+    with _INTERFACE_POOL_LOCK:
+        interface = _INTERFACE_POOL.get(key)
+        if interface is None:
+            interface = interface_class(db_path=resolved_path)
+            _INTERFACE_POOL[key] = interface
+        return interface
+
+
+def get_duckdb_interface(db_path: str | Path | None = None):
+    """
+    Return the process-wide DuckDBInterface for *db_path*.
+
+    Interfaces are created once per resolved path and hand out thread-local
+    cursors, so repeated reads and writes reuse the warm catalog and object cache.
+    """
+    return _pooled_interface(get_duckdb_interface_class(), db_path)
+
+
+def get_sqlite_interface(db_path: str | Path | None = None):
+    """
+    Return the process-wide SQLiteInterface for *db_path*.
+    """
+    return _pooled_interface(get_sqlite_interface_class(), db_path)
+
+
+def close_local_data_interfaces() -> None:
+    """
+    Close and forget every pooled local-data interface.
+
+    Registered with `atexit`; call it explicitly to release database files early.
+    """
+    with _INTERFACE_POOL_LOCK:
+        interfaces = list(_INTERFACE_POOL.values())
+        _INTERFACE_POOL.clear()
+    for interface in interfaces:
+        try:
+            interface.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_local_data_interfaces)
+
+
+class _ThreadConnection:
+    """Thread-local holder whose collection, when its thread exits, releases the connection."""
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+
+
+def thread_connection(
+    local: threading.local,
+    connect: Callable[[], Any],
+    registry: dict[int, Any],
+    lock: threading.Lock,
+    close: Callable[[Any], None],
+) -> Any:
+    """
+    Return the calling thread's connection from *local*, opening it with *connect* if needed.
+
+    Open connections are tracked in *registry* so the interface can close them all; when the
+    owning thread exits, its entry is removed and the connection closed with *close*, so
+    long-lived pooled interfaces do not accumulate one connection per short-lived thread.
+    """
+    holder = getattr(local, "holder", None)
+    if holder is None:
+        holder = _ThreadConnection(connect())
+        local.holder = holder
+        key = id(holder)
+        with lock:
+            registry[key] = holder.connection
+        finalizer = weakref.finalize(holder, _release_thread_connection, registry, lock, key, close)
+        finalizer.atexit = False
+    return holder.connection
+
+
+def _release_thread_connection(
+    registry: dict[int, Any], lock: threading.Lock, key: int, close: Callable[[Any], None]
+) -> None:
+    with lock:
+        connection = registry.pop(key, None)
+    if connection is not None:
+        close(connection)
+
+
+def arrow_to_read_output(data: Any, output: str) -> Any:
+    """
+    Return a `pyarrow.Table` of read results as the requested `READ_OUTPUTS` type.
+
+    ``"polars"`` wraps the Arrow buffers without copying and needs the optional
+    `polars` package; ``"pandas"`` is not handled here because pandas reads are indexed.
+    """
+    if output == "arrow":
+        return data
+    if output == "polars":
+        try:
+            import polars as pl
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                'output="polars" requires the optional dependency `polars`.'
+            ) from exc
+        return pl.from_arrow(data)
+    raise ValueError(f"output must be one of {READ_OUTPUTS[1:]}, got {output!r}")
+
+
+def coordinate_join_groups(
+    entries: list[dict[str, Any]],
+) -> list[tuple[tuple[str, ...], str | None, str | None, list[list[Any]]]]:
+    """
+    Group `dimension_range_map`-style entries into relations that can be joined in one pass.
+
+    Entries are grouped by their pinned dimensions (sorted) and by the start / end operands
+    they bound with; each group is ``(dimensions, start_operand, end_operand, rows)``. A row
+    holds the coordinate values in `dimensions` order, then the start bound if
+    `start_operand` is set and the end bound if `end_operand` is. Entries that pin and bound
+    nothing are dropped, as the OR expansion drops them.
+    """
+    groups: dict[tuple[tuple[str, ...], str | None, str | None], list[list[Any]]] = {}
+    for entry in entries:
+        coordinate = entry.get("coordinate") or {}
+        dimensions = tuple(sorted(coordinate))
+        row = [coordinate[name] for name in dimensions]
+        start_operand = end_operand = None
+        if entry.get("start_date") is not None:
+            start_operand = entry.get("start_date_operand", ">=")
+            row.append(entry["start_date"])
+        if entry.get("end_date") is not None:
+            end_operand = entry.get("end_date_operand", "<=")
+            row.append(entry["end_date"])
+        if not row:
+            continue
+        groups.setdefault((dimensions, start_operand, end_operand), []).append(row)
+    return [(*key, rows) for key, rows in groups.items()]
+
+
+__all__ = [
+    "BATCH_OUTPUTS",
+    "COORDINATE_JOIN_MIN_ENTRIES",
+    "DEFAULT_BATCH_ROWS",
+    "PartitionSpec",
+    "READ_OUTPUTS",
+    "arrow_to_read_output",
+    "close_local_data_interfaces",
+    "coordinate_join_groups",
+    "get_duckdb_interface",
+    "get_duckdb_interface_class",
+    "get_sqlite_interface",
+    "get_sqlite_interface_class",
+    "thread_connection",
+]
@@ -1,29 +1,63 @@
 from __future__ import annotations
 
 import datetime
+import json
 import os
+import re
+import threading
+import time
 import uuid
+from calendar import monthrange
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 from pyarrow import fs
 
 from mainsequence.logconf import logger as base_logger
 
+try:
+    import fcntl
+except ImportError:  # Windows: writers are serialized in-process only
+    fcntl = None
+
 from ..dtype_codec import (
+    BOOL,
+    DATE,
+    FLOAT32,
+    FLOAT64,
+    INT16,
+    INT32,
+    INT64,
+    LOCAL_DATETIME_NAIVE,
+    NUMERIC,
+    STRING,
     TIMESTAMP_TZ,
+    UUID_TOKEN,
     backend_type_to_token,
+    normalize_dtype_token,
     pandas_dtype_to_token,
     token_to_backend_type,
     token_to_pandas_dtype,
     token_to_pandas_series,
 )
 from ..utils import DataFrequency
+from . import (
+    BATCH_OUTPUTS,
+    COORDINATE_JOIN_MIN_ENTRIES,
+    DEFAULT_BATCH_ROWS,
+    coordinate_join_groups,
+    thread_connection,
+)
 from .local_paths import local_data_path
+from .partitioning import PartitionSpec, partition_bucket_from_path
 
 
 def get_logger():
@@ -34,11 +68,371 @@ def get_logger():
 logger = get_logger()
 
 
+MANIFEST_FILE_NAME = "_manifest.json"
+MANIFEST_VERSION = 1
+# Seconds a manifest's file list is trusted before the next access re-lists the table
+# directory (DUCKDB_MANIFEST_RECONCILE_SECONDS overrides; 0 lists on every access).
+DEFAULT_MANIFEST_RECONCILE_SECONDS = 300
+# Partition columns of tables written before layouts were recorded in the manifest;
+# tables with a `partition_spec` hide the columns of that spec instead.
+PARTITION_COLUMNS = ("year", "month", "day")
+
+# Compaction defaults; the threshold policy after upsert is opt-in via
+# DUCKDB_COMPACT_MIN_FRAGMENTS (0/unset disables) and DUCKDB_COMPACT_BACKGROUND.
+DEFAULT_COMPACT_MIN_FRAGMENTS = 2
+DEFAULT_COMPACT_TARGET_FILE_ROWS = 5_000_000
+# Longest a compaction waits for in-flight reads before skipping a partition's swap.
+COMPACT_SWAP_TIMEOUT_SECONDS = 30
+
+# Advisory lock file serializing writers of one local table across processes.
+TABLE_WRITE_LOCK_FILE_NAME = "_write.lock"
+
+# Per-fragment key index: min/max per index column (in the manifest) plus a Bloom filter
+# over the full index tuple in a `<fragment>.keys` sidecar next to the Parquet file.
+KEY_INDEX_SUFFIX = ".keys"
+KEY_INDEX_BLOOM_BITS_PER_KEY = 10
+KEY_INDEX_BLOOM_HASHES = 7
+
+
 def _list_parquet_files(fs, dir_path: str) -> list[str]:
     infos = fs.get_file_info(pafs.FileSelector(dir_path, recursive=False))
     return [i.path for i in infos if i.type == pafs.FileType.File and i.path.endswith(".parquet")]
 
 
+def _index_key_frame(
+    df: pd.DataFrame,
+    index_names: list[str],
+) -> tuple[pd.DataFrame, list[str]] | None:
+    """
+    Normalize index columns so equal keys hash equally regardless of storage dtype.
+
+    Returns the normalized frame and one kind per column (`time`, `int`, `float`,
+    `bool`, `str`), or None when a column cannot be normalized safely.
+    """
+    columns: dict[str, pd.Series] = {}
+    kinds: list[str] = []
+    try:
+        for name in index_names:
+            series = df[name].reset_index(drop=True)
+            if pd.api.types.is_datetime64_any_dtype(series):
+                values = pd.to_datetime(series, utc=True)
+                if values.isna().any():
+                    return None
+                columns[name] = values.astype("datetime64[ns, UTC]").astype("int64")
+                kinds.append("time")
+            elif pd.api.types.is_bool_dtype(series):
+                columns[name] = series.astype("object").astype(str)
+                kinds.append("bool")
+            elif pd.api.types.is_integer_dtype(series) and not series.isna().any():
+                columns[name] = series.astype("int64")
+                kinds.append("int")
+            elif pd.api.types.is_float_dtype(series):
+                columns[name] = series.astype("float64")
+                kinds.append("float")
+            else:
+                values = series.astype("object")
+                columns[name] = values.where(values.notna(), "\x00null").astype(str)
+                kinds.append("str")
+    except (TypeError, ValueError):
+        return None
+    return pd.DataFrame(columns), kinds
+
+
+def _index_key_hashes(frame: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bloom_positions(hashes: np.ndarray, m: int, k: int) -> np.ndarray:
+    """Double hashing: k bit positions per key from one 64-bit hash."""
+    h1 = hashes & np.uint64(0xFFFFFFFF)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    steps = np.arange(k, dtype=np.uint64)[:, None]
+    return (h1[None, :] + steps * h2[None, :]) % np.uint64(m)
+
+
+def _bloom_build(hashes: np.ndarray) -> tuple[bytes, int, int]:
+    m = max(64, -(-len(hashes) * KEY_INDEX_BLOOM_BITS_PER_KEY // 8) * 8)
+    bits = np.zeros(m, dtype=bool)
+    bits[_bloom_positions(hashes, m, KEY_INDEX_BLOOM_HASHES).ravel()] = True
+    return np.packbits(bits).tobytes(), m, KEY_INDEX_BLOOM_HASHES
+
+
+def _bloom_may_contain(payload: bytes, m: int, k: int, hashes: np.ndarray) -> np.ndarray:
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8), count=m).astype(bool)
+    return bits[_bloom_positions(hashes, m, k)].all(axis=0)
+
+
+def _clustered_select(
+    select_sql: str,
+    *,
+    index_names: list[str],
+    time_index_name: str,
+    row_order: str = "time",
+) -> str:
+    """
+    Wrap `select_sql` so its rows come out in the fragment row order of a partition spec.
+
+    ``zorder`` interleaves the bits of each sort column's quantized percent rank (identity
+    dimensions, then time) into one 63-bit key; ties fall back to the index order.
+    """
+
+    def qident(name: str) -> str:
+        return '"' + str(name).replace('"', '""') + '"'
+
+    index_order = ", ".join(qident(name) for name in index_names)
+    identity = [name for name in index_names if name != time_index_name]
+    if row_order == "identity" and identity:
+        order = ", ".join(qident(name) for name in [*identity, time_index_name])
+        return f"SELECT * FROM ({select_sql}) ORDER BY {order}"
+    if row_order == "zorder" and identity:
+        dims = [*identity, time_index_name]
+        bits = 63 // len(dims)
+        ranks = ", ".join(
+            f"CAST(floor(PERCENT_RANK() OVER (ORDER BY {qident(name)}) * {(1 << bits) - 1}) "
+            f"AS UBIGINT) AS __ms_z{j}"
+            for j, name in enumerate(dims)
+        )
+        z_key = " + ".join(
+            f"(((__ms_z{j} >> {b}) & 1) << {b * len(dims) + j})"
+            for b in range(bits)
+            for j in range(len(dims))
+        )
+        helpers = ", ".join(f"__ms_z{j}" for j in range(len(dims)))
+        return (
+            f"SELECT * EXCLUDE ({helpers}) FROM (SELECT *, {ranks} FROM ({select_sql})) "
+            f"ORDER BY {z_key}, {index_order}"
+        )
+    return f"SELECT * FROM ({select_sql}) ORDER BY {index_order}"
+
+
+def _partition_bounds_from_path(
+    path: str,
+) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
+    """
+    Infer inclusive [partition_start, partition_end] purely from path components
+    like .../year=2024[/month=07[/day=03[/hour=14]]]/file.parquet.
+    Returns (p_start, p_end) as UTC tz-aware Timestamps, or (None, None) if not parsable.
+    """
+    m_year = re.search(r"/year=(\d{4})(/|$)", path)
+    m_month = re.search(r"/month=(\d{2})(/|$)", path)
+    m_day = re.search(r"/day=(\d{2})(/|$)", path)
+    m_hour = re.search(r"/hour=(\d{2})(/|$)", path)
+    if not m_year:
+        return None, None
+    y = int(m_year.group(1))
+    if not m_month:
+        start = pd.Timestamp(datetime.datetime(y, 1, 1, tzinfo=datetime.UTC))
+        end = pd.Timestamp(datetime.datetime(y + 1, 1, 1, tzinfo=datetime.UTC))
+        return start, end - pd.Timedelta(nanoseconds=1)
+    m = int(m_month.group(1))
+    if m_day:
+        d = int(m_day.group(1))
+        start = pd.Timestamp(datetime.datetime(y, m, d, 0, 0, 0, tzinfo=datetime.UTC))
+        span = pd.Timedelta(days=1)
+        if m_hour:
+            start += pd.Timedelta(hours=int(m_hour.group(1)))
+            span = pd.Timedelta(hours=1)
+        end = start + span - pd.Timedelta(nanoseconds=1)
+        return start, end
+    # month granularity
+    last_day = monthrange(y, m)[1]
+    start = pd.Timestamp(datetime.datetime(y, m, 1, 0, 0, 0, tzinfo=datetime.UTC))
+    end = pd.Timestamp(
+        datetime.datetime(y, m, last_day, 23, 59, 59, tzinfo=datetime.UTC)
+    ) + pd.Timedelta(seconds=0.999999999)  # inclusive
+    return start, end
+
+
+def _time_row_groups_from_footer(
+    pf: pq.ParquetFile,
+    time_index_name: str,
+) -> tuple[list[list[int]], bool]:
+    """
+    Return `[min_ns, max_ns, num_rows]` per row group for the temporal column.
+
+    The boolean is False when any row group lacks usable min/max statistics.
+    """
+    meta = pf.metadata
+    col_idx = None
+    if meta.num_row_groups:
+        first = meta.row_group(0)
+        for j in range(first.num_columns):
+            if str(first.column(j).path_in_schema).split(".")[-1] == time_index_name:
+                col_idx = j
+                break
+    if col_idx is None:
+        return [], False
+
+    try:
+        unit = getattr(pf.schema_arrow.field(time_index_name).type, "unit", "ns")
+    except Exception:
+        unit = "ns"
+
+    def to_ns(value: Any) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, int | float):
+            return pd.to_datetime(int(value), unit=unit, utc=True).value
+        try:
+            return pd.to_datetime(value, utc=True).value
+        except Exception:
+            return None
+
+    row_groups: list[list[int]] = []
+    complete = True
+    for i in range(meta.num_row_groups):
+        rg = meta.row_group(i)
+        stats = rg.column(col_idx).statistics
+        if not stats or not stats.has_min_max:
+            complete = False
+            continue
+        tmin, tmax = to_ns(stats.min), to_ns(stats.max)
+        if tmin is None or tmax is None:
+            complete = False
+            continue
+        if tmax < tmin:
+            tmin, tmax = tmax, tmin
+        row_groups.append([tmin, tmax, rg.num_rows])
+    return row_groups, complete
+
+
+# pandas dtypes for Arrow read results; Arrow types not listed convert with pandas defaults.
+_ARROW_PANDAS_DTYPES = {
+    pa.int64(): pd.Int64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+    pa.string(): pd.StringDtype(),
+    pa.large_string(): pd.StringDtype(),
+}
+
+
+def _arrow_read_type(token: str, current: pa.DataType) -> pa.DataType | None:
+    """Arrow type a read column of dtype `token` is cast to, or None to leave it as is."""
+    if token in {TIMESTAMP_TZ, LOCAL_DATETIME_NAIVE}:
+        unit = current.unit if pa.types.is_timestamp(current) else "us"
+        return pa.timestamp(unit, tz="UTC" if token == TIMESTAMP_TZ else None)
+    if token == DATE:
+        return pa.date32()
+    if token in {INT16, INT32, INT64}:
+        return pa.int64()
+    if token in {FLOAT32, FLOAT64, NUMERIC}:
+        return pa.float64()
+    if token == BOOL:
+        return pa.bool_()
+    if token in {STRING, UUID_TOKEN}:
+        return pa.string()
+    return None
+
+
+class _FragmentSwapLock:
+    """
+    Readers of one table's fragments share this lock; compaction takes it exclusively only
+    while it publishes merged files, deletes the fragments they replace and updates the
+    manifest, so a read never sees both sets nor plans against files that are then deleted.
+
+    Reads are reentrant per thread. A pending swap holds back new reads until it acquires
+    or times out; a swap never waits on a read held by its own thread.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers: dict[int, int] = {}
+        self._swap_pending = False
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        ident = threading.get_ident()
+        with self._condition:
+            if ident not in self._readers:
+                self._condition.wait_for(lambda: not self._swap_pending)
+            self._readers[ident] = self._readers.get(ident, 0) + 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                if self._readers[ident] == 1:
+                    del self._readers[ident]
+                else:
+                    self._readers[ident] -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def swapping(self, timeout: float) -> Iterator[bool]:
+        """Yield True once no read is in flight, or False after *timeout* seconds."""
+        with self._condition:
+            acquired = False
+            if threading.get_ident() not in self._readers and not self._swap_pending:
+                self._swap_pending = True
+                acquired = self._condition.wait_for(lambda: not self._readers, timeout)
+                if not acquired:
+                    self._swap_pending = False
+                    self._condition.notify_all()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with self._condition:
+                    self._swap_pending = False
+                    self._condition.notify_all()
+
+
+class _TableWriteLock:
+    """
+    Exclusive lock held by writers of one table (upsert, compaction, column removal,
+    repartitioning) around their fragment and manifest changes.
+
+    Reentrant for the owning thread. With a `lock_path` it additionally holds an advisory
+    `flock` on that file while owned, so writers in other processes — such as the
+    `compact-local` CLI — wait for each other. Without one (object-store tables, platforms
+    without `fcntl`) writers are serialized in this process only. Reads never take it.
+    """
+
+    def __init__(self, lock_path: str | None):
+        self._lock = threading.RLock()
+        self._lock_path = lock_path
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self) -> _TableWriteLock:
+        self._lock.acquire()
+        try:
+            if self._depth == 0 and self._lock_path is not None:
+                os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+                lock_file = open(self._lock_path, "a+b")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                except BaseException:
+                    lock_file.close()
+                    raise
+                self._file = lock_file
+        except BaseException:
+            self._lock.release()
+            raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._file is not None:
+            try:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+            finally:
+                self._file.close()
+                self._file = None
+        self._lock.release()
+
+    def held_by_another_process(self) -> bool:
+        """True when a writer outside this process holds the lock file."""
+        if self._lock_path is None or self._depth or not os.path.exists(self._lock_path):
+            return False
+        with open(self._lock_path, "a+b") as probe:
+            try:
+                fcntl.flock(probe, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(probe, fcntl.LOCK_UN)
+        return False
+
+
 class DuckDBInterface:
     """
     Persist/serve configured-index DataFrames in a DuckDB file.
@@ -54,12 +448,7 @@ class DuckDBInterface:
                                              environment variable or 'analytics.duckdb'
                                              in the current directory if the variable is not set.
         """
-        # ── choose default & normalise to string ───────────────────────────
-        default_path = os.getenv(
-            "DUCKDB_PATH",
-            os.fspath(local_data_path() / "duck_db"),
-        )
-        db_uri = str(db_path or default_path).rstrip("/")
+        db_uri = self.resolve_db_path(db_path)
 
         # ── FileSystem abstraction (works for local & S3) ──────────────────
         self._fs, self._object_path = fs.FileSystem.from_uri(db_uri)
@@ -69,22 +458,94 @@ class DuckDBInterface:
         #   • remote  → in‑memory DB; still works because all user data
         #               lives in Parquet on the object store
         if db_uri.startswith("s3://") or db_uri.startswith("gs://"):
-            self.con = duckdb.connect(":memory:")
+            self._root_con = duckdb.connect(":memory:")
             # duckdb needs the httpfs extension for S3
-            self.con.execute("INSTALL httpfs;")
-            self.con.execute("LOAD httpfs;")
+            self._root_con.execute("INSTALL httpfs;")
+            self._root_con.execute("LOAD httpfs;")
         else:
             meta_file = Path(db_uri) / "duck_meta.duckdb"
             meta_file.parent.mkdir(parents=True, exist_ok=True)
-            self.con = duckdb.connect(str(meta_file))
+            self._root_con = duckdb.connect(str(meta_file))
 
         # ── sane defaults ──────────────────────────────────────────────────
-        self.con.execute("PRAGMA threads = 4")
-        self.con.execute("PRAGMA enable_object_cache = true")
-        self.con.execute("SET TIMEZONE = 'UTC';")
+        self._root_con.execute("PRAGMA threads = 4")
+        self._root_con.execute("PRAGMA enable_object_cache = true")
+        self._root_con.execute("SET TIMEZONE = 'UTC';")
+
+        # ── per-thread cursors over the shared database instance ──────────
+        self._thread_local = threading.local()
+        self._cursors: dict[int, duckdb.DuckDBPyConnection] = {}
+        self._cursors_lock = threading.Lock()
+
+        # ── per-table Parquet manifests (see _table_manifest) ─────────────
+        self._manifest_lock = threading.RLock()
+        self._manifest_cache: dict[str, tuple[tuple[int | None, int | None], dict]] = {}
+
+        # ── per-table write serialization + optional background compaction ──
+        self._table_locks: dict[str, _TableWriteLock] = {}
+        self._swap_locks: dict[str, _FragmentSwapLock] = {}
+        self._table_locks_guard = threading.Lock()
+        self._compaction_executor = None
+        self._compaction_pending: set[tuple[str, str]] = set()
+        self._spec_warned: set[str] = set()
 
         self.db_path = db_uri  # keep the fully‑qualified URI
 
+    @staticmethod
+    def resolve_db_path(db_path: str | Path | None = None) -> str:
+        """
+        Return the fully-qualified storage URI used for *db_path*.
+        """
+        default_path = os.getenv(
+            "DUCKDB_PATH",
+            os.fspath(local_data_path() / "duck_db"),
+        )
+        return str(db_path or default_path).rstrip("/")
+
+    @property
+    def con(self) -> duckdb.DuckDBPyConnection:
+        """
+        Thread-local cursor over the shared DuckDB database.
+
+        Cursors share the catalog and object cache of the root connection, so
+        concurrent readers in one process reuse warm metadata instead of reconnecting.
+        A thread's cursor is closed when the thread exits.
+        """
+        return thread_connection(
+            self._thread_local,
+            self._open_cursor,
+            self._cursors,
+            self._cursors_lock,
+            self._close_cursor,
+        )
+
+    def _open_cursor(self) -> duckdb.DuckDBPyConnection:
+        cursor = self._root_con.cursor()
+        cursor.execute("SET TIMEZONE = 'UTC';")
+        return cursor
+
+    @staticmethod
+    def _close_cursor(cursor: duckdb.DuckDBPyConnection) -> None:
+        try:
+            cursor.close()
+        except duckdb.Error as e:
+            logger.debug(f"Closing DuckDB cursor failed: {e}")
+
+    def close(self) -> None:
+        """
+        Close every thread-local cursor and the root connection.
+        """
+        if self._compaction_executor is not None:
+            self._compaction_executor.shutdown(wait=True)
+            self._compaction_executor = None
+        with self._cursors_lock:
+            cursors = list(self._cursors.values())
+            self._cursors.clear()
+        for cursor in cursors:
+            self._close_cursor(cursor)
+        self._thread_local = threading.local()
+        self._root_con.close()
+
     def launch_gui(self, host="localhost", port=4213, timeout=0.5):
         import socket
 
@@ -146,33 +607,48 @@ class DuckDBInterface:
         src_rel = (
             qtbl
             if use_view
-            else f"parquet_scan('{file_glob}', hive_partitioning=TRUE, union_by_name=TRUE)"
+            else f"parquet_scan('{file_glob}', hive_partitioning=FALSE, union_by_name=TRUE)"
         )
 
         def to_ts(value):
             return pd.to_datetime(value, utc=True) if value is not None else None
 
-        global_min_raw = self.con.execute(f"SELECT MIN({qtime}) FROM {src_rel}").fetchone()[0]
-        global_min = to_ts(global_min_raw)
+        with self._swap_lock(table).reading():
+            # The manifest already holds footer statistics for every fragment; only scan
+            # when some fragment lacks complete min/max stats for the temporal column.
+            try:
+                manifest = self._table_manifest(table, time_index_name=time_index_name)
+            except Exception as e:
+                logger.warning(f"time_index_minima: manifest unavailable for '{table}': {e}")
+                manifest = {"files": {}}
+            entries = list(manifest["files"].values())
+            if entries and all(entry.get("stats_complete") for entry in entries):
+                minima = [rg[0] for entry in entries for rg in entry["row_groups"]]
+                global_min = pd.Timestamp(min(minima), tz="UTC") if minima else None
+            else:
+                global_min_raw = self.con.execute(f"SELECT MIN({qtime}) FROM {src_rel}").fetchone()[
+                    0
+                ]
+                global_min = to_ts(global_min_raw)
 
-        if not identity_dimensions:
-            return global_min, {}
+            if not identity_dimensions:
+                return global_min, {}
 
-        dimension_select = ", ".join(qident(name) for name in identity_dimensions)
-        rows = self.con.execute(
-            f"""
-            SELECT {dimension_select}, MIN({qtime}) AS min_val
-            FROM {src_rel}
-            GROUP BY {dimension_select}
-            """
-        ).fetchall()
+            dimension_select = ", ".join(qident(name) for name in identity_dimensions)
+            rows = self.con.execute(
+                f"""
+                SELECT {dimension_select}, MIN({qtime}) AS min_val
+                FROM {src_rel}
+                GROUP BY {dimension_select}
+                """
+            ).fetchall()
 
-        per_coordinate: dict[Any, pd.Timestamp | None] = {}
-        for row in rows:
-            values = row[: len(identity_dimensions)]
-            key = values[0] if len(values) == 1 else tuple(values)
-            per_coordinate[key] = to_ts(row[-1])
-        return global_min, per_coordinate
+            per_coordinate: dict[Any, pd.Timestamp | None] = {}
+            for row in rows:
+                values = row[: len(identity_dimensions)]
+                key = values[0] if len(values) == 1 else tuple(values)
+                per_coordinate[key] = to_ts(row[-1])
+            return global_min, per_coordinate
 
     def remove_columns(
         self,
@@ -186,14 +662,15 @@ class DuckDBInterface:
         Forcefully drop the given columns from the dataset backing `table`.
 
         Behavior:
-          • Rebuilds *every* partition directory (year=/month=/[day=]) into one new Parquet file.
+          • Rebuilds *every* partition directory (per the table's partition spec) into one new
+            Parquet file.
           • Drops the requested columns that exist in that partition (others are ignored).
           • Always deletes the old Parquet fragments after the new file is written.
           • Always refreshes the view to reflect the new schema.
 
         Notes:
           • Protected keys to keep storage model consistent:
-            configured index columns plus {'year','month','day'} are not dropped.
+            configured index columns plus the partition columns are not dropped.
           • If a requested column doesn’t exist in some partitions, those partitions are still rebuilt.
           • Destructive and idempotent.
         """
@@ -209,16 +686,25 @@ class DuckDBInterface:
             )
 
         requested = list(dict.fromkeys(columns or []))
-        protected = set(index_names) | {"year", "month", "day"}
 
         # Discover unified schema to know which requested columns actually exist
+        manifest = self._table_manifest(table, time_index_name=time_index_name, reconcile=True)
+        partition_columns = self._hidden_partition_columns(manifest)
+        protected = set(index_names) | set(partition_columns)
+        spec = PartitionSpec.parse(manifest.get("partition_spec")) or PartitionSpec()
+        manifest_schema = self._manifest_schema(manifest)
         file_glob = f"{self.db_path}/{table}/**/*.parquet"
         try:
-            desc_rows = self.con.execute(
-                f"DESCRIBE SELECT * FROM read_parquet('{file_glob}', "
-                f"union_by_name=TRUE, hive_partitioning=TRUE)"
-            ).fetchall()
-            present_cols = {r[0] for r in desc_rows}
+            if manifest_schema is not None:
+                present_cols = {name for name, _ in manifest_schema} | {
+                    key for key in partition_columns if f"{key}=" in "/".join(manifest["files"])
+                }
+            else:
+                desc_rows = self.con.execute(
+                    f"DESCRIBE SELECT * FROM read_parquet('{file_glob}', "
+                    f"union_by_name=TRUE, hive_partitioning=FALSE)"
+                ).fetchall()
+                present_cols = {r[0] for r in desc_rows}
         except duckdb.Error as e:
             logger.error(f"remove_columns: cannot scan files for '{table}': {e}")
             try:
@@ -242,13 +728,11 @@ class DuckDBInterface:
             )
 
         # Enumerate all partition directories that currently contain Parquet files
-        selector = fs.FileSelector(f"{self.db_path}/{table}", recursive=True)
-        infos = self._fs.get_file_info(selector)
+        table_root = f"{self.db_path}/{table}"
         part_dirs = sorted(
             {
-                info.path.rpartition("/")[0]
-                for info in infos
-                if info.type == fs.FileType.File and info.path.endswith(".parquet")
+                f"{table_root}/{relative_path.rpartition('/')[0]}".rstrip("/")
+                for relative_path in manifest["files"]
             }
         )
 
@@ -265,121 +749,447 @@ class DuckDBInterface:
                 "files_deleted": 0,
             }
 
-        partitions_rebuilt = 0
-        files_deleted = 0
+        with self._table_lock(table):
+            partitions_rebuilt = 0
+            files_deleted = 0
 
-        try:
-            for part_path in part_dirs:
-                # 1) Partition-local schema WITHOUT filename helper (stable "real" columns)
-                try:
-                    part_desc = self.con.execute(
-                        f"DESCRIBE SELECT * FROM parquet_scan('{part_path}/*.parquet', "
-                        f"                                      hive_partitioning=TRUE, union_by_name=TRUE)"
-                    ).fetchall()
-                    # Preserve order returned by DESCRIBE for deterministic output
-                    part_cols_ordered = [r[0] for r in part_desc]
-                    part_cols_set = set(part_cols_ordered)
-                except duckdb.Error as e:
-                    logger.warning(
-                        f"remove_columns: skipping partition due to scan error at {part_path}: {e}"
-                    )
-                    continue
+            try:
+                for part_path in part_dirs:
+                    # 1) Partition-local schema WITHOUT filename helper (stable "real" columns)
+                    try:
+                        part_desc = self.con.execute(
+                            f"DESCRIBE SELECT * FROM parquet_scan('{part_path}/*.parquet', "
+                            f"                                      hive_partitioning=TRUE, union_by_name=TRUE)"
+                        ).fetchall()
+                        # Preserve order returned by DESCRIBE for deterministic output
+                        part_cols_ordered = [r[0] for r in part_desc]
+                        part_cols_set = set(part_cols_ordered)
+                    except duckdb.Error as e:
+                        logger.warning(
+                            f"remove_columns: skipping partition due to scan error at {part_path}: {e}"
+                        )
+                        continue
+
+                    to_drop_here = [c for c in to_drop_global if c in part_cols_set]
+
+                    # 2) Columns to keep (explicit projection → safest)
+                    keep_cols = [c for c in part_cols_ordered if c not in to_drop_here]
+                    if not keep_cols:
+                        # Should not happen due to 'protected', but guard anyway
+                        logger.warning(
+                            f"remove_columns: nothing to write after drops in {part_path}; skipping"
+                        )
+                        continue
+                    keep_csv = ", ".join(qident(c) for c in keep_cols)
 
-                to_drop_here = [c for c in to_drop_global if c in part_cols_set]
+                    # 3) Detect the actual helper file-path column name added by filename=TRUE
+                    #    by comparing with/without filename=TRUE.
+                    try:
+                        fname_desc = self.con.execute(
+                            f"DESCRIBE SELECT * FROM parquet_scan('{part_path}/*.parquet', "
+                            f"                                      hive_partitioning=TRUE, union_by_name=TRUE, filename=TRUE)"
+                        ).fetchall()
+                        cols_with_fname = {r[0] for r in fname_desc}
+                        added_by_filename = (
+                            cols_with_fname - part_cols_set
+                        )  # usually {'filename'} or {'file_name', ...}
+                        file_col = next(iter(added_by_filename), None)
+                    except duckdb.Error:
+                        file_col = None
+
+                    missing_partition_index_columns = [
+                        name for name in index_names if name not in part_cols_set
+                    ]
+                    if missing_partition_index_columns:
+                        raise ValueError(
+                            "DuckDB remove_columns requires every configured index column in each "
+                            f"partition. Missing in {part_path}: {missing_partition_index_columns}"
+                        )
 
-                # 2) Columns to keep (explicit projection → safest)
-                keep_cols = [c for c in part_cols_ordered if c not in to_drop_here]
-                if not keep_cols:
-                    # Should not happen due to 'protected', but guard anyway
-                    logger.warning(
-                        f"remove_columns: nothing to write after drops in {part_path}; skipping"
+                    # 4) Decide ordering key for recency; fall back to temporal column if helper missing
+                    order_key = qident(file_col) if file_col else qident(time_index_name)
+                    partition_by = ", ".join(qident(name) for name in index_names)
+
+                    # 5) Rebuild partition with explicit projection + window de-dup
+                    tmp_file = f"{part_path}/rebuild-{uuid.uuid4().hex}.parquet"
+                    dedup_select = f"""
+                      SELECT {keep_csv}
+                      FROM (
+                        SELECT {keep_csv},
+                               ROW_NUMBER() OVER (
+                                 PARTITION BY {partition_by}
+                                 ORDER BY {order_key} DESC
+                               ) AS rn
+                        FROM parquet_scan('{part_path}/*.parquet',
+                                          hive_partitioning=TRUE,
+                                          union_by_name=TRUE,
+                                          filename=TRUE)
+                      )
+                      WHERE rn = 1
+                    """
+                    ordered_select = _clustered_select(
+                        dedup_select,
+                        index_names=index_names,
+                        time_index_name=time_index_name,
+                        row_order=spec.row_order,
                     )
-                    continue
-                keep_csv = ", ".join(qident(c) for c in keep_cols)
+                    copy_sql = f"""
+                    COPY ({ordered_select})
+                    TO '{tmp_file}'
+                    (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size})
+                    """
+                    try:
+                        self.con.execute(copy_sql)
+                    except duckdb.Error as e:
+                        logger.error(f"remove_columns: COPY failed for partition {part_path}: {e}")
+                        raise
+
+                    # 6) Delete all old fragments, keep only the new file
+                    try:
+                        current_infos = self._fs.get_file_info(fs.FileSelector(part_path))
+                        for fi in current_infos:
+                            if (
+                                fi.type == fs.FileType.File
+                                and fi.path.endswith(".parquet")
+                                and fi.path != tmp_file
+                            ):
+                                self._fs.delete_file(fi.path)
+                                files_deleted += 1
+                    except Exception as cleanup_e:
+                        logger.warning(
+                            f"remove_columns: cleanup failed in {part_path}: {cleanup_e}"
+                        )
+
+                    partitions_rebuilt += 1
 
-                # 3) Detect the actual helper file-path column name added by filename=TRUE
-                #    by comparing with/without filename=TRUE.
+            finally:
+                # Ensure manifest and logical schema match physical files
                 try:
-                    fname_desc = self.con.execute(
-                        f"DESCRIBE SELECT * FROM parquet_scan('{part_path}/*.parquet', "
-                        f"                                      hive_partitioning=TRUE, union_by_name=TRUE, filename=TRUE)"
-                    ).fetchall()
-                    cols_with_fname = {r[0] for r in fname_desc}
-                    added_by_filename = (
-                        cols_with_fname - part_cols_set
-                    )  # usually {'filename'} or {'file_name', ...}
-                    file_col = next(iter(added_by_filename), None)
-                except duckdb.Error:
-                    file_col = None
-
-                missing_partition_index_columns = [
-                    name for name in index_names if name not in part_cols_set
-                ]
-                if missing_partition_index_columns:
-                    raise ValueError(
-                        "DuckDB remove_columns requires every configured index column in each "
-                        f"partition. Missing in {part_path}: {missing_partition_index_columns}"
-                    )
+                    self._ensure_view(table, time_index_name, reconcile=True)
+                except Exception as ev:
+                    logger.warning(f"remove_columns: _ensure_view failed after rebuild: {ev}")
 
-                # 4) Decide ordering key for recency; fall back to temporal column if helper missing
-                order_key = qident(file_col) if file_col else qident(time_index_name)
-                partition_by = ", ".join(qident(name) for name in index_names)
-
-                # 5) Rebuild partition with explicit projection + window de-dup
-                tmp_file = f"{part_path}/rebuild-{uuid.uuid4().hex}.parquet"
-                copy_sql = f"""
-                COPY (
-                  SELECT {keep_csv}
-                  FROM (
-                    SELECT {keep_csv},
-                           ROW_NUMBER() OVER (
-                             PARTITION BY {partition_by}
-                             ORDER BY {order_key} DESC
-                           ) AS rn
-                    FROM parquet_scan('{part_path}/*.parquet',
-                                      hive_partitioning=TRUE,
-                                      union_by_name=TRUE,
-                                      filename=TRUE)
-                  )
-                  WHERE rn = 1
+        return {
+            "dropped": to_drop_global,
+            "skipped": skipped_global,
+            "partitions_rebuilt": partitions_rebuilt,
+            "files_deleted": files_deleted,
+        }
+
+    def compact(
+        self,
+        table: str,
+        *,
+        index_names: list[str] | None = None,
+        time_index_name: str | None = None,
+        partitions: list[str] | None = None,
+        min_fragments: int = DEFAULT_COMPACT_MIN_FRAGMENTS,
+        target_file_rows: int = DEFAULT_COMPACT_TARGET_FILE_ROWS,
+    ) -> dict[str, Any]:
+        """
+        Merge small Parquet fragments of `table` into sorted, target-sized files.
+
+        Behavior:
+          • Only partitions holding at least `min_fragments` fragments are rewritten.
+          • Each rewrite reads an explicit list of fragments, merges and sorts them once, and
+            stages files of at most `target_file_rows` rows under tmp names readers ignore.
+          • The staged files are moved into place, exactly the merged fragments deleted and the
+            manifest updated while reads of the table in this process are held off, so a read
+            sees either the old fragments or the new files. A partition whose reads do not
+            drain within COMPACT_SWAP_TIMEOUT_SECONDS is skipped and its staged files dropped.
+          • Duplicated index tuples keep the row from the most recently written fragment, by
+            the write sequence the manifest records.
+          • Writers of the same table are serialized with compaction, across processes for
+            local tables (a lock file in the table directory). Reads in other processes are
+            not held off: one planned before the swap can fail on a deleted fragment and has
+            to be retried.
+
+        Args:
+            index_names: Configured index columns; defaults to those recorded in the manifest.
+            time_index_name: Temporal column; defaults to the one recorded in the manifest.
+            partitions: Partition directories relative to the table (e.g. ``"year=2026/month=05"``);
+                all partitions when omitted.
+
+        Returns:
+            Summary with `partitions_compacted`, `files_deleted`, and `files_written`.
+        """
+
+        def qident(name: str) -> str:
+            return '"' + str(name).replace('"', '""') + '"'
+
+        if min_fragments < 1 or target_file_rows < 1:
+            raise ValueError("min_fragments and target_file_rows must be positive")
+
+        partitions_compacted = 0
+        files_deleted = 0
+        files_written = 0
+
+        with self._table_lock(table):
+            manifest = self._table_manifest(table, time_index_name=time_index_name, reconcile=True)
+            index_names = list(index_names or manifest.get("index_names") or [])
+            time_index_name = time_index_name or manifest.get("time_index_name")
+            sort_columns = index_names or ([time_index_name] if time_index_name else [])
+            spec = PartitionSpec.parse(manifest.get("partition_spec")) or PartitionSpec()
+
+            fragments_by_partition: dict[str, list[str]] = {}
+            for relative_path in manifest["files"]:
+                fragments_by_partition.setdefault(relative_path.rpartition("/")[0], []).append(
+                    relative_path
+                )
+            if partitions is not None:
+                wanted = {partition.strip("/") for partition in partitions}
+                fragments_by_partition = {
+                    partition: fragments
+                    for partition, fragments in fragments_by_partition.items()
+                    if partition in wanted
+                }
+
+            for partition, fragments in sorted(fragments_by_partition.items()):
+                if len(fragments) < max(min_fragments, 2):
+                    continue
+                # Duplicated keys keep the row of the most recently written fragment.
+                fragments = sorted(
+                    fragments,
+                    key=lambda path: (manifest["files"][path].get("written_ns") or 0, path),
+                )
+                part_path = f"{self.db_path}/{table}/{partition}".rstrip("/")
+                source_paths = [f"{self.db_path}/{table}/{path}" for path in fragments]
+                source_list = ", ".join(f"'{path}'" for path in source_paths)
+                source = (
+                    f"read_parquet([{source_list}], union_by_name=TRUE, "
+                    f"hive_partitioning=FALSE, filename=TRUE)"
+                )
+                suffix = uuid.uuid4().hex
+                order_relation = f"_ms_compact_order_{suffix}"
+                staging_table = f"_ms_compact_{suffix}"
+                dedup = ""
+                if index_names:
+                    source = (
+                        f"{source} JOIN {order_relation} USING (filename) "
+                        f"QUALIFY ROW_NUMBER() OVER (PARTITION BY "
+                        f"{', '.join(qident(name) for name in index_names)} "
+                        f"ORDER BY _ms_write_order DESC) = 1"
+                    )
+                    dedup = ", _ms_write_order"
+                merged_sql = f"SELECT * EXCLUDE (filename{dedup}) FROM {source}"
+                if index_names and time_index_name in index_names:
+                    merged_sql = _clustered_select(
+                        merged_sql,
+                        index_names=index_names,
+                        time_index_name=time_index_name,
+                        row_order=spec.row_order,
+                    )
+                elif sort_columns:
+                    merged_sql += f" ORDER BY {', '.join(qident(name) for name in sort_columns)}"
+
+                # Materialize the merged, sorted rows once and cut files by rowid (insertion
+                # order) instead of re-running the merge for every output file.
+                written: list[tuple[str, str]] = []
+                con = self.con
+                con.register(
+                    order_relation,
+                    pa.table(
+                        {"filename": source_paths, "_ms_write_order": list(range(len(fragments)))}
+                    ),
                 )
-                TO '{tmp_file}'
-                (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 512000)
-                """
                 try:
-                    self.con.execute(copy_sql)
-                except duckdb.Error as e:
-                    logger.error(f"remove_columns: COPY failed for partition {part_path}: {e}")
+                    con.execute(f"CREATE TEMP TABLE {staging_table} AS {merged_sql}")
+                    (total_rows,) = con.execute(f"SELECT COUNT(*) FROM {staging_table}").fetchone()
+                    for first_row in range(0, max(total_rows, 1), target_file_rows):
+                        ts = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
+                        final_path = f"{part_path}/part-{ts}-{uuid.uuid4().hex}.parquet"
+                        tmp_path = f"{final_path}.tmp"
+                        written.append((tmp_path, final_path))
+                        con.execute(
+                            f"""
+                            COPY (
+                                SELECT * FROM {staging_table}
+                                WHERE rowid >= {first_row}
+                                  AND rowid < {first_row + target_file_rows}
+                            )
+                            TO '{tmp_path}'
+                            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size});
+                            """
+                        )
+                except BaseException:
+                    self._discard_staged_files(tmp_path for tmp_path, _ in written)
                     raise
+                finally:
+                    con.execute(f"DROP TABLE IF EXISTS {staging_table}")
+                    con.unregister(order_relation)
 
-                # 6) Delete all old fragments, keep only the new file
-                try:
-                    current_infos = self._fs.get_file_info(fs.FileSelector(part_path))
-                    for fi in current_infos:
-                        if (
-                            fi.type == fs.FileType.File
-                            and fi.path.endswith(".parquet")
-                            and fi.path != tmp_file
-                        ):
-                            self._fs.delete_file(fi.path)
-                            files_deleted += 1
-                except Exception as cleanup_e:
-                    logger.warning(f"remove_columns: cleanup failed in {part_path}: {cleanup_e}")
-
-                partitions_rebuilt += 1
+                with self._swap_lock(table).swapping(COMPACT_SWAP_TIMEOUT_SECONDS) as swapped:
+                    if not swapped:
+                        logger.warning(
+                            f"compact: '{table}/{partition}' skipped, reads still in flight "
+                            f"after {COMPACT_SWAP_TIMEOUT_SECONDS}s"
+                        )
+                        self._discard_staged_files(tmp_path for tmp_path, _ in written)
+                        continue
+                    added_files: list[str] = []
+                    removed_files: list[str] = []
+                    try:
+                        for tmp_path, final_path in written:
+                            self._fs.move(tmp_path, final_path)
+                            added_files.append(final_path)
+                        for path in source_paths:
+                            try:
+                                self._fs.delete_file(path)
+                                removed_files.append(path)
+                            except Exception as e:
+                                logger.warning(
+                                    f"compact: cannot delete merged fragment {path}: {e}"
+                                )
+                    finally:
+                        # Merged files inherit the newest merged fragment's write sequence.
+                        self._update_manifest(
+                            table,
+                            added=added_files,
+                            removed=removed_files,
+                            time_index_name=time_index_name,
+                            written_ns=max(
+                                manifest["files"][path].get("written_ns") or 0 for path in fragments
+                            ),
+                        )
+                files_written += len(added_files)
+                files_deleted += len(removed_files)
+                partitions_compacted += 1
+            if partitions_compacted:
+                self._ensure_view(table, time_index_name)
+
+        logger.info(
+            f"compact: '{table}' rewrote {partitions_compacted} partitions "
+            f"({files_deleted} fragments → {files_written} files)"
+        )
+        return {
+            "partitions_compacted": partitions_compacted,
+            "files_deleted": files_deleted,
+            "files_written": files_written,
+        }
 
-        finally:
-            # Ensure logical schema matches physical files
+    def repartition(
+        self,
+        table: str,
+        partition_spec: PartitionSpec | str,
+        *,
+        index_names: list[str] | None = None,
+        time_index_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Rewrite every fragment of `table` into the layout of `partition_spec`.
+
+        Fragments are migrated one at a time: each is split by the new partition keys, the
+        pieces are published into their directories, and only then is the source fragment
+        deleted, so readers never miss rows. The spec is recorded in the manifest once every
+        fragment has moved and governs all later writes; an empty table just records it.
+
+        Args:
+            index_names: Configured index columns; defaults to those recorded in the manifest.
+            time_index_name: Temporal column; defaults to the one recorded in the manifest.
+
+        Returns:
+            Summary with `files_deleted`, `files_written`, and the new `partition_spec`.
+        """
+        spec = PartitionSpec.parse(partition_spec)
+        if spec is None:
+            raise ValueError(f"Unrecognized partition spec {partition_spec!r}")
+
+        files_deleted = 0
+        files_written = 0
+        added_files: list[str] = []
+        with self._table_lock(table):
+            manifest = self._table_manifest(table, time_index_name=time_index_name, reconcile=True)
+            index_names = list(index_names or manifest.get("index_names") or [])
+            time_index_name = time_index_name or manifest.get("time_index_name")
+            if not time_index_name:
+                raise ValueError(f"repartition: time_index_name is unknown for table '{table}'")
+            if spec.bucket_dimension is not None and (
+                spec.bucket_dimension not in index_names or spec.bucket_dimension == time_index_name
+            ):
+                raise ValueError(
+                    f"Partition bucket dimension {spec.bucket_dimension!r} must be one of the "
+                    f"identity dimensions in index_names {index_names!r}"
+                )
+            if manifest.get("partition_spec") == spec.to_dict():
+                return {"files_deleted": 0, "files_written": 0, "partition_spec": str(spec)}
+
+            stale_columns = set(self._hidden_partition_columns(manifest))
+            ordered_sub = _clustered_select(
+                "SELECT * FROM repartition_sub",
+                index_names=index_names or [time_index_name],
+                time_index_name=time_index_name,
+                row_order=spec.row_order,
+            )
+            removed_files: list[str] = []
+            completed = False
             try:
-                self._ensure_view(table)
-            except Exception as ev:
-                logger.warning(f"remove_columns: _ensure_view failed after rebuild: {ev}")
+                for relative_path in list(manifest["files"]):
+                    source_path = f"{self.db_path}/{table}/{relative_path}"
+                    frame = self.con.execute(
+                        f"SELECT * FROM read_parquet('{source_path}', hive_partitioning=FALSE)"
+                    ).fetch_df()
+                    frame = frame.drop(columns=[c for c in frame.columns if c in stale_columns])
+                    partitions = spec.partition_keys(frame, time_index_name)
+                    for col, values in partitions.items():
+                        frame[col] = values
+                    part_cols = list(partitions)
+
+                    for keys, sub in frame.groupby(part_cols, sort=False):
+                        part_path = self._partition_path(
+                            dict(zip(part_cols, keys, strict=False)), table=table
+                        )
+                        self._fs.create_dir(part_path, recursive=True)
+                        ts = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
+                        final_path = f"{part_path}/part-{ts}-{uuid.uuid4().hex}.parquet"
+                        tmp_path = f"{final_path}.tmp"
+                        self.con.register("repartition_sub", sub)
+                        try:
+                            self.con.execute(
+                                f"""
+                                COPY ({ordered_sub})
+                                TO '{tmp_path}'
+                                (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size});
+                                """
+                            )
+                        finally:
+                            self.con.unregister("repartition_sub")
+                        self._fs.move(tmp_path, final_path)
+                        added_files.append(final_path)
+                        files_written += 1
+
+                    self._fs.delete_file(source_path)
+                    removed_files.append(source_path)
+                    files_deleted += 1
+                completed = True
+            finally:
+                # A partial migration keeps the previous spec; rerunning finishes it.
+                self._update_manifest(
+                    table,
+                    added=added_files,
+                    removed=removed_files,
+                    time_index_name=time_index_name,
+                    index_names=index_names or None,
+                    partition_spec=spec if completed else None,
+                )
+                self._spec_warned.discard(table)
+                self._ensure_view(table, time_index_name)
 
+        logger.info(
+            f"repartition: '{table}' moved to '{spec}' "
+            f"({files_deleted} fragments → {files_written} files)"
+        )
+        self._maybe_compact(
+            table,
+            partitions={
+                self._relative_table_path(table, path).rpartition("/")[0] for path in added_files
+            },
+            index_names=index_names,
+            time_index_name=time_index_name,
+        )
         return {
-            "dropped": to_drop_global,
-            "skipped": skipped_global,
-            "partitions_rebuilt": partitions_rebuilt,
             "files_deleted": files_deleted,
+            "files_written": files_written,
+            "partition_spec": str(spec),
         }
 
     def upsert(
@@ -390,28 +1200,20 @@ class DuckDBInterface:
         index_names: list[str],
         time_index_name: str,
         data_frequency: DataFrequency = DataFrequency.one_m,
+        max_workers: int | None = None,
+        partition_spec: PartitionSpec | str | None = None,
     ) -> None:
         """
         Idempotently write a DataFrame into *table* using the configured index tuple.
-        """
-        import datetime
-        import os
 
-        from pyarrow import fs  # used for cleanup listing
-
-        def qident(name: str) -> str:
-            return '"' + str(name).replace('"', '""') + '"'
-
-        def aliased_key_predicate(left_alias: str, right_alias: str) -> str:
-            return " AND ".join(
-                f"{left_alias}.{qident(name)} IS NOT DISTINCT FROM {right_alias}.{qident(name)}"
-                for name in index_names
-            )
-
-        def order_by_clause(alias: str | None = None) -> str:
-            prefix = f"{alias}." if alias else ""
-            return ", ".join(f"{prefix}{qident(name)}" for name in index_names)
+        Partitions are independent directories, so with `max_workers > 1` (or env
+        DUCKDB_UPSERT_WORKERS) they are written concurrently, each worker on its own
+        DuckDB cursor. The manifest and view are refreshed once at the end.
 
+        `partition_spec` (a `PartitionSpec` or its string form) sets the layout of a new
+        table; existing tables keep the layout recorded in their manifest, see
+        `repartition` to change it.
+        """
         if df.empty:
             logger.warning(f"Attempted to upsert an empty DataFrame to table '{table}'. Skipping.")
             return
@@ -435,245 +1237,452 @@ class DuckDBInterface:
             is_time_index=True,
         )
 
-        # —— derive partition columns ——---------------------------------------
-        partitions = self._partition_keys(df[time_index_name], data_frequency=data_frequency)
-        for col, values in partitions.items():
-            df[col] = values
-        part_cols = list(partitions)
+        requested_spec = PartitionSpec.parse(partition_spec)
 
         logger.debug(f"Starting upsert of {len(df)} rows into table '{table}' in {self.db_path}")
 
         # —— de‑duplication inside *this* DataFrame ——--------------------------
         df = df.drop_duplicates(subset=index_names, keep="last")
 
-        # ──  Write each partition safely ─────────────────────────────────
-        for keys, sub in df.groupby(part_cols, sort=False):
-            part_path = self._partition_path(dict(zip(part_cols, keys, strict=False)), table=table)
-            self._fs.create_dir(part_path, recursive=True)
-
-            # Register incoming batch as a DuckDB relation
-            self.con.register("incoming_sub", sub)
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("DUCKDB_UPSERT_WORKERS") or 1)
+            except ValueError:
+                max_workers = 1
+
+        # ──  Writers of one table are serialized (see compact) ──────────────
+        with self._table_lock(table):
+            manifest = self._table_manifest(table, time_index_name=time_index_name)
+            spec = self._resolve_partition_spec(
+                table, manifest, requested_spec, data_frequency=data_frequency
+            )
+            if spec.bucket_dimension is not None and (
+                spec.bucket_dimension not in index_names or spec.bucket_dimension == time_index_name
+            ):
+                raise ValueError(
+                    f"Partition bucket dimension {spec.bucket_dimension!r} must be one of the "
+                    f"identity dimensions in index_names {index_names!r}"
+                )
 
-            # Detect presence of existing files and time-range overlap (cheap)
-            has_existing = False
-            time_overlap = False
+            # —— derive partition columns ——-----------------------------------
+            partitions = spec.partition_keys(df, time_index_name)
+            for col, values in partitions.items():
+                df[col] = values
+            part_cols = list(partitions)
+            partition_batches = [
+                (dict(zip(part_cols, keys, strict=False)), sub)
+                for keys, sub in df.groupby(part_cols, sort=False)
+            ]
+            manifest = self._reconcile_partitions(
+                table,
+                [
+                    self._relative_table_path(table, self._partition_path(keys, table=table))
+                    for keys, _ in partition_batches
+                ],
+                time_index_name=time_index_name,
+            )
+            max_workers = max(1, min(max_workers, len(partition_batches)))
+            added_files: list[str] = []
+            removed_files: list[str] = []
             try:
-                row = self.con.execute(
-                    f"""
-                    SELECT min({qident(time_index_name)}) AS mn, max({qident(time_index_name)}) AS mx
-                    FROM parquet_scan('{part_path}/*.parquet', hive_partitioning=TRUE)
-                    """
-                ).fetchone()
-                if row and row[0] is not None:
-                    has_existing = True
-                    mn = pd.to_datetime(row[0], utc=True)
-                    mx = pd.to_datetime(row[1], utc=True)
-                    smin = sub[time_index_name].min()
-                    smax = sub[time_index_name].max()
-                    time_overlap = not (smax < mn or smin > mx)
-            except Exception:
-                has_existing = False
+                if max_workers == 1:
+                    for keys, sub in partition_batches:
+                        added, removed = self._upsert_partition(
+                            self.con,
+                            table,
+                            keys,
+                            sub,
+                            index_names=index_names,
+                            time_index_name=time_index_name,
+                            manifest=manifest,
+                            partition_spec=spec,
+                        )
+                        added_files.extend(added)
+                        removed_files.extend(removed)
+                else:
+                    self._upsert_partitions_parallel(
+                        table,
+                        partition_batches,
+                        index_names=index_names,
+                        time_index_name=time_index_name,
+                        max_workers=max_workers,
+                        manifest=manifest,
+                        partition_spec=spec,
+                        added_files=added_files,
+                        removed_files=removed_files,
+                    )
+            finally:
+                # ──  Refresh manifest + view ─────────────────────────────────
+                if added_files or removed_files:
+                    self._update_manifest(
+                        table,
+                        added=added_files,
+                        removed=removed_files,
+                        time_index_name=time_index_name,
+                        index_names=index_names,
+                        partition_spec=spec,
+                    )
+                self._ensure_view(table=table, time_index_name=time_index_name)
+
+        self._maybe_compact(
+            table,
+            partitions={
+                self._relative_table_path(table, path).rpartition("/")[0] for path in added_files
+            },
+            index_names=index_names,
+            time_index_name=time_index_name,
+        )
 
-            # Exact PK overlap check (only if time windows overlap)
-            overlap_exists = False
-            if has_existing and time_overlap:
-                overlap_exists = bool(
-                    self.con.execute(
-                        f"""
-                    SELECT EXISTS (
-                      SELECT 1
-                      FROM incoming_sub i
-                      JOIN parquet_scan('{part_path}/*.parquet', hive_partitioning=TRUE) e
-                        ON {aliased_key_predicate("e", "i")}
-                      LIMIT 1
-                    );
-                    """
-                    ).fetchone()[0]
+    def _upsert_partitions_parallel(
+        self,
+        table: str,
+        partition_batches: list[tuple[dict, pd.DataFrame]],
+        *,
+        index_names: list[str],
+        time_index_name: str,
+        max_workers: int,
+        manifest: dict[str, Any] | None,
+        partition_spec: PartitionSpec | None,
+        added_files: list[str],
+        removed_files: list[str],
+    ) -> None:
+        """
+        Write partitions on a bounded pool of DuckDB cursors, collecting every written and
+        deleted fragment even when some partition fails. After the first failure no further
+        partition is started; partitions already running finish, and the failure is re-raised.
+        """
+        import queue
+        from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+
+        cursors: queue.Queue = queue.Queue()
+        opened = []
+        for _ in range(max_workers):
+            cursor = self._open_cursor()
+            opened.append(cursor)
+            cursors.put(cursor)
+
+        cancelled = threading.Event()
+
+        def run(keys: dict, sub: pd.DataFrame) -> tuple[list[str], list[str]]:
+            if cancelled.is_set():
+                return [], []
+            cursor = cursors.get()
+            try:
+                return self._upsert_partition(
+                    cursor,
+                    table,
+                    keys,
+                    sub,
+                    index_names=index_names,
+                    time_index_name=time_index_name,
+                    manifest=manifest,
+                    partition_spec=partition_spec,
                 )
+            finally:
+                cursors.put(cursor)
 
-            # -------------------- Append path (no PK collision) --------------------
-            if not has_existing or not time_overlap or not overlap_exists:
-                try:
-                    ts = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
-                    final_name = f"part-{ts}-{uuid.uuid4().hex}.parquet"
-                    tmp_name = final_name + ".tmp"
-                    tmp_path = f"{part_path}/{tmp_name}"
-                    final_path = f"{part_path}/{final_name}"
-
-                    if has_existing:
-                        # Keep dedup exact: write only rows not already present
-                        anti_join_select = f"""
-                            SELECT i.*
-                            FROM incoming_sub i
-                            WHERE NOT EXISTS (
-                              SELECT 1
-                              FROM parquet_scan('{part_path}/*.parquet', hive_partitioning=TRUE) e
-                              WHERE {aliased_key_predicate("e", "i")}
-                            )
-                            ORDER BY {order_by_clause("i")}
-                        """
-                        n_new = self.con.execute(
-                            f"SELECT COUNT(*) FROM ({anti_join_select})"
-                        ).fetchone()[0]
-                        if n_new == 0:
-                            continue
-                        self.con.execute(
-                            f"""
-                            COPY ({anti_join_select})
-                            TO '{tmp_path}'
-                            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 512000);
-                            """
-                        )
-                    else:
-                        # No existing files → safe to copy all incoming rows
-                        self.con.execute(
-                            f"""
-                            COPY (
-                              SELECT i.*
-                              FROM incoming_sub i
-                              ORDER BY {order_by_clause("i")}
-                            )
-                            TO '{tmp_path}'
-                            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 512000);
-                            """
-                        )
+        errors: list[BaseException] = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="duckdb-upsert"
+            ) as executor:
+                futures = [executor.submit(run, keys, sub) for keys, sub in partition_batches]
+                for future in as_completed(futures):
+                    try:
+                        added, removed = future.result()
+                    except CancelledError:
+                        continue
+                    except BaseException as e:
+                        errors.append(e)
+                        cancelled.set()
+                        for pending in futures:
+                            pending.cancel()
+                        continue
+                    added_files.extend(added)
+                    removed_files.extend(removed)
+        finally:
+            for cursor in opened:
+                cursor.close()
+        if errors:
+            raise errors[0]
 
-                    # Atomic move into place
-                    self._fs.move(tmp_path, final_path)
-                except Exception as e:
-                    logger.exception(f"Append path failed for partition {keys}: {e}")
-                    raise
-                continue
+    def _upsert_partition(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        table: str,
+        keys: dict,
+        sub: pd.DataFrame,
+        *,
+        index_names: list[str],
+        time_index_name: str,
+        manifest: dict[str, Any] | None = None,
+        partition_spec: PartitionSpec | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Append or rewrite one partition directory; returns (written, deleted) fragment paths.
+
+        With fragment key indexes in `manifest`, collisions are decided without reading
+        data and a rewrite only merges the fragments that may hold colliding keys. Written
+        fragments follow the row order and row-group size of `partition_spec`.
+        """
 
-            # -------------------- Rewrite path (true upsert) -----------------------
+        def qident(name: str) -> str:
+            return '"' + str(name).replace('"', '""') + '"'
+
+        def aliased_key_predicate(left_alias: str, right_alias: str) -> str:
+            return " AND ".join(
+                f"{left_alias}.{qident(name)} IS NOT DISTINCT FROM {right_alias}.{qident(name)}"
+                for name in index_names
+            )
+
+        spec = partition_spec or PartitionSpec()
+
+        def clustered(select_sql: str) -> str:
+            return _clustered_select(
+                select_sql,
+                index_names=index_names,
+                time_index_name=time_index_name,
+                row_order=spec.row_order,
+            )
+
+        part_cols = list(keys)
+        added_files: list[str] = []
+        removed_files: list[str] = []
+        part_path = self._partition_path(keys, table=table)
+        self._fs.create_dir(part_path, recursive=True)
+
+        # Register incoming batch as a DuckDB relation
+        con.register("incoming_sub", sub)
+
+        # Fragments that may collide, proven from key indexes (None → unknown)
+        rewrite_files = self._colliding_fragments(
+            table, part_path, sub, index_names=index_names, manifest=manifest
+        )
+        if rewrite_files is None:
+            existing_scan = f"parquet_scan('{part_path}/*.parquet', hive_partitioning=TRUE)"
+        else:
+            file_list = ", ".join(f"'{path}'" for path in rewrite_files)
+            existing_scan = (
+                f"parquet_scan([{file_list}], hive_partitioning=TRUE, union_by_name=TRUE)"
+            )
+
+        # Detect presence of existing files and time-range overlap (cheap)
+        has_existing = False
+        time_overlap = False
+        if rewrite_files is None:
             try:
-                # Discover existing/incoming schemas and build COALESCE projection
-                desc_rows = self.con.execute(
+                row = con.execute(
                     f"""
-                    DESCRIBE SELECT * FROM parquet_scan(
-                        '{part_path}/*.parquet',
-                        hive_partitioning=TRUE,
-                        union_by_name=TRUE
-                    )
+                    SELECT min({qident(time_index_name)}) AS mn, max({qident(time_index_name)}) AS mx
+                    FROM {existing_scan}
                     """
-                ).fetchall()
-                existing_cols = [r[0] for r in desc_rows]
-
-                # ADDED: also look at incoming schema so we can build a typed e-select
-                incoming_desc = self.con.execute(
-                    "DESCRIBE SELECT * FROM incoming_sub"
-                ).fetchall()  # ADDED
-                incoming_cols = [r[0] for r in incoming_desc]
-
-                all_cols = list(dict.fromkeys(incoming_cols + existing_cols))  # deterministic order
-
-                def qident(name: str) -> str:
-                    return '"' + str(name).replace('"', '""') + '"'
-
-                inc_set, ex_set = set(incoming_cols), set(existing_cols)
-
-                # CHANGED: Build merged projection with explicit BIGINT casts for partition cols
-                select_exprs = []
-                for c in all_cols:
-                    qc = qident(c)
-                    if c in inc_set and c in ex_set:
-                        if c in part_cols:
-                            select_exprs.append(
-                                f"COALESCE(CAST(i.{qc} AS BIGINT), CAST(e.{qc} AS BIGINT)) AS {qc}"
-                            )  # CHANGED
-                        else:
-                            select_exprs.append(f"COALESCE(i.{qc}, e.{qc}) AS {qc}")
-                    elif c in inc_set:
-                        if c in part_cols:
-                            select_exprs.append(f"CAST(i.{qc} AS BIGINT) AS {qc}")  # CHANGED
-                        else:
-                            select_exprs.append(f"i.{qc} AS {qc}")
-                    else:  # only in existing
-                        if c in part_cols:
-                            select_exprs.append(f"CAST(e.{qc} AS BIGINT) AS {qc}")  # CHANGED
-                        else:
-                            select_exprs.append(f"e.{qc} AS {qc}")
-                select_list = ", ".join(select_exprs)
-
-                # ADDED: Build a type-aligned projection of existing rows for the anti-join side
-                #        (so UNION ALL BY NAME sees identical types, esp. for partitions)
-                e_select_exprs = []
-                for c in all_cols:
-                    qc = qident(c)
-                    if c in ex_set:
-                        if c in part_cols:
-                            e_select_exprs.append(f"CAST(e.{qc} AS BIGINT) AS {qc}")  # ADDED
-                        else:
-                            e_select_exprs.append(f"e.{qc} AS {qc}")
-                    else:
-                        # Column exists only in incoming; let it be NULL here
-                        if c in part_cols:
-                            e_select_exprs.append(f"CAST(NULL AS BIGINT) AS {qc}")  # ADDED
-                        else:
-                            e_select_exprs.append(f"NULL AS {qc}")  # ADDED
-                e_select_list = ", ".join(e_select_exprs)
+                ).fetchone()
+                if row and row[0] is not None:
+                    has_existing = True
+                    mn = pd.to_datetime(row[0], utc=True)
+                    mx = pd.to_datetime(row[1], utc=True)
+                    smin = sub[time_index_name].min()
+                    smax = sub[time_index_name].max()
+                    time_overlap = not (smax < mn or smin > mx)
+            except Exception:
+                has_existing = False
+        elif rewrite_files:
+            # Fragments outside `rewrite_files` provably hold none of the incoming keys.
+            has_existing = time_overlap = True
+
+        # Exact PK overlap check (only if time windows overlap)
+        overlap_exists = False
+        if has_existing and time_overlap:
+            overlap_exists = bool(
+                con.execute(
+                    f"""
+                SELECT EXISTS (
+                  SELECT 1
+                  FROM incoming_sub i
+                  JOIN {existing_scan} e
+                    ON {aliased_key_predicate("e", "i")}
+                  LIMIT 1
+                );
+                """
+                ).fetchone()[0]
+            )
+        if rewrite_files and not overlap_exists:
+            # Bloom false positives only: nothing in the partition collides.
+            has_existing = False
 
+        # -------------------- Append path (no PK collision) --------------------
+        if not has_existing or not time_overlap or not overlap_exists:
+            try:
                 ts = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
                 final_name = f"part-{ts}-{uuid.uuid4().hex}.parquet"
                 tmp_name = final_name + ".tmp"
                 tmp_path = f"{part_path}/{tmp_name}"
                 final_path = f"{part_path}/{final_name}"
 
-                merge_sql = f"""
-                COPY (
-                  WITH existing AS (
-                    SELECT * FROM parquet_scan(
-                        '{part_path}/*.parquet',
-                        hive_partitioning=TRUE,
-                        union_by_name=TRUE
+                if has_existing:
+                    # Keep dedup exact: write only rows not already present
+                    anti_join_select = f"""
+                        SELECT i.*
+                        FROM incoming_sub i
+                        WHERE NOT EXISTS (
+                          SELECT 1
+                          FROM {existing_scan} e
+                          WHERE {aliased_key_predicate("e", "i")}
+                        )
+                    """
+                    n_new = con.execute(f"SELECT COUNT(*) FROM ({anti_join_select})").fetchone()[0]
+                    if n_new == 0:
+                        return added_files, removed_files
+                    con.execute(
+                        f"""
+                        COPY ({clustered(anti_join_select)})
+                        TO '{tmp_path}'
+                        (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size});
+                        """
+                    )
+                else:
+                    # No existing files → safe to copy all incoming rows
+                    con.execute(
+                        f"""
+                        COPY ({clustered("SELECT i.* FROM incoming_sub i")})
+                        TO '{tmp_path}'
+                        (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size});
+                        """
                     )
-                  ),
-                  merged_incoming AS (
-                    SELECT {select_list}
-                    FROM incoming_sub i
-                    LEFT JOIN existing e
-                      ON {aliased_key_predicate("e", "i")}
-                  )
-                  SELECT *
-                  FROM (
-                    -- rows with incoming (coalesced over existing)
-                    SELECT * FROM merged_incoming
-                    UNION ALL BY NAME  -- CHANGED: correct syntax order
-                    -- keep existing rows that do not collide on PK
-                    SELECT {e_select_list}  -- REPLACED: used to be 'SELECT e.*'
-                    FROM existing e
-                    ANTI JOIN incoming_sub i
-                      ON {aliased_key_predicate("e", "i")}
-                  )
-                  ORDER BY {order_by_clause()}
-                )
-                TO '{tmp_path}'
-                (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 512000);
-                """
-                try:
-                    self.con.execute(merge_sql)
-                except Exception as e:
-                    raise e
-                self._fs.move(tmp_path, final_path)
-
-                # Cleanup old parquet fragments, keep only the new file
-                try:
-                    for fi in self._fs.get_file_info(fs.FileSelector(part_path)):
-                        if (
-                            fi.type == fs.FileType.File
-                            and fi.path.endswith(".parquet")
-                            and os.path.basename(fi.path) != final_name
-                        ):
-                            self._fs.delete_file(fi.path)
-                except Exception as cleanup_e:
-                    logger.warning(f"Cleanup old parquet files failed in {part_path}: {cleanup_e}")
 
+                # Atomic move into place
+                self._fs.move(tmp_path, final_path)
+                added_files.append(final_path)
             except Exception as e:
-                logger.exception(f"Rewrite path failed for partition {keys}: {e}")
+                logger.exception(f"Append path failed for partition {keys}: {e}")
                 raise
+            return added_files, removed_files
 
-        # ──  Refresh view ────────────────────────────────────────────────
-        self._ensure_view(table=table)
+        # -------------------- Rewrite path (true upsert) -----------------------
+        if rewrite_files is None:
+            existing_scan = (
+                f"parquet_scan('{part_path}/*.parquet', hive_partitioning=TRUE, union_by_name=TRUE)"
+            )
+        try:
+            # Discover existing/incoming schemas and build COALESCE projection
+            desc_rows = con.execute(f"DESCRIBE SELECT * FROM {existing_scan}").fetchall()
+            existing_cols = [r[0] for r in desc_rows]
+
+            # ADDED: also look at incoming schema so we can build a typed e-select
+            incoming_desc = con.execute("DESCRIBE SELECT * FROM incoming_sub").fetchall()  # ADDED
+            incoming_cols = [r[0] for r in incoming_desc]
+
+            all_cols = list(dict.fromkeys(incoming_cols + existing_cols))  # deterministic order
+
+            def qident(name: str) -> str:
+                return '"' + str(name).replace('"', '""') + '"'
+
+            inc_set, ex_set = set(incoming_cols), set(existing_cols)
+
+            # CHANGED: Build merged projection with explicit BIGINT casts for partition cols
+            select_exprs = []
+            for c in all_cols:
+                qc = qident(c)
+                if c in inc_set and c in ex_set:
+                    if c in part_cols:
+                        select_exprs.append(
+                            f"COALESCE(CAST(i.{qc} AS BIGINT), CAST(e.{qc} AS BIGINT)) AS {qc}"
+                        )  # CHANGED
+                    else:
+                        select_exprs.append(f"COALESCE(i.{qc}, e.{qc}) AS {qc}")
+                elif c in inc_set:
+                    if c in part_cols:
+                        select_exprs.append(f"CAST(i.{qc} AS BIGINT) AS {qc}")  # CHANGED
+                    else:
+                        select_exprs.append(f"i.{qc} AS {qc}")
+                else:  # only in existing
+                    if c in part_cols:
+                        select_exprs.append(f"CAST(e.{qc} AS BIGINT) AS {qc}")  # CHANGED
+                    else:
+                        select_exprs.append(f"e.{qc} AS {qc}")
+            select_list = ", ".join(select_exprs)
+
+            # ADDED: Build a type-aligned projection of existing rows for the anti-join side
+            #        (so UNION ALL BY NAME sees identical types, esp. for partitions)
+            e_select_exprs = []
+            for c in all_cols:
+                qc = qident(c)
+                if c in ex_set:
+                    if c in part_cols:
+                        e_select_exprs.append(f"CAST(e.{qc} AS BIGINT) AS {qc}")  # ADDED
+                    else:
+                        e_select_exprs.append(f"e.{qc} AS {qc}")
+                else:
+                    # Column exists only in incoming; let it be NULL here
+                    if c in part_cols:
+                        e_select_exprs.append(f"CAST(NULL AS BIGINT) AS {qc}")  # ADDED
+                    else:
+                        e_select_exprs.append(f"NULL AS {qc}")  # ADDED
+            e_select_list = ", ".join(e_select_exprs)
+
+            ts = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
+            final_name = f"part-{ts}-{uuid.uuid4().hex}.parquet"
+            tmp_name = final_name + ".tmp"
+            tmp_path = f"{part_path}/{tmp_name}"
+            final_path = f"{part_path}/{final_name}"
+
+            merged_select = f"""
+              WITH existing AS (
+                SELECT * FROM {existing_scan}
+              ),
+              merged_incoming AS (
+                SELECT {select_list}
+                FROM incoming_sub i
+                LEFT JOIN existing e
+                  ON {aliased_key_predicate("e", "i")}
+              )
+              SELECT *
+              FROM (
+                -- rows with incoming (coalesced over existing)
+                SELECT * FROM merged_incoming
+                UNION ALL BY NAME  -- CHANGED: correct syntax order
+                -- keep existing rows that do not collide on PK
+                SELECT {e_select_list}  -- REPLACED: used to be 'SELECT e.*'
+                FROM existing e
+                ANTI JOIN incoming_sub i
+                  ON {aliased_key_predicate("e", "i")}
+              )
+            """
+            merge_sql = f"""
+            COPY ({clustered(merged_select)})
+            TO '{tmp_path}'
+            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {spec.row_group_size});
+            """
+            try:
+                con.execute(merge_sql)
+            except Exception as e:
+                raise e
+            self._fs.move(tmp_path, final_path)
+            added_files.append(final_path)
+
+            # Cleanup merged fragments (all old fragments without key indexes)
+            try:
+                if rewrite_files is not None:
+                    for path in rewrite_files:
+                        self._fs.delete_file(path)
+                        removed_files.append(path)
+                    return added_files, removed_files
+                for fi in self._fs.get_file_info(fs.FileSelector(part_path)):
+                    if (
+                        fi.type == fs.FileType.File
+                        and fi.path.endswith(".parquet")
+                        and os.path.basename(fi.path) != final_name
+                    ):
+                        self._fs.delete_file(fi.path)
+                        removed_files.append(fi.path)
+            except Exception as cleanup_e:
+                logger.warning(f"Cleanup old parquet files failed in {part_path}: {cleanup_e}")
+
+        except Exception as e:
+            logger.exception(f"Rewrite path failed for partition {keys}: {e}")
+            raise
+
+        return added_files, removed_files
 
     def table_exists(self, table):
         table_exists_result = (
@@ -733,8 +1742,8 @@ class DuckDBInterface:
 
         Behavior:
           • Computes an overall effective [start, end] across inputs (range_map, start/end).
-          • Reads Parquet footers under {self.db_path}/{table}/**/*.parquet to gather row-group
-            (min_time, max_time, num_rows).
+          • Reads row-group (min_time, max_time, num_rows) for {self.db_path}/{table}/**/*.parquet
+            from the table manifest, which caches the Parquet footer statistics.
           • If the estimated rows for [start, end] <= max_rows, returns inputs unchanged.
           • Otherwise finds the latest limit_dt so that estimated rows in [start, limit_dt] ~= max_rows,
             and tightens:
@@ -744,13 +1753,6 @@ class DuckDBInterface:
         Returns:
           adjusted_start, adjusted_end, adjusted_dimension_range_map, diagnostics
         """
-        import os
-        import re
-        from calendar import monthrange
-
-        import numpy as np
-        import pandas as pd
-        from pyarrow import fs as pa_fs
 
         # --- helpers -------------------------------------------------------------
 
@@ -792,129 +1794,6 @@ class DuckDBInterface:
                     ends.append(_to_utc_ts(e))
             return max(ends) if ends else None
 
-        def _parse_part_bounds_from_path(
-            path: str,
-        ) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
-            """
-            Infer inclusive [partition_start, partition_end] purely from path components
-            like .../year=2024/month=07[/day=03]/file.parquet.
-            Returns (p_start, p_end) as UTC tz-aware Timestamps, or (None, None) if not parsable.
-            """
-            m_year = re.search(r"/year=(\d{4})(/|$)", path)
-            m_month = re.search(r"/month=(\d{2})(/|$)", path)
-            m_day = re.search(r"/day=(\d{2})(/|$)", path)
-            if not (m_year and m_month):
-                return None, None
-            y = int(m_year.group(1))
-            m = int(m_month.group(1))
-            if m_day:
-                d = int(m_day.group(1))
-                start = pd.Timestamp(datetime.datetime(y, m, d, 0, 0, 0, tzinfo=datetime.UTC))
-                end = start + pd.Timedelta(days=1) - pd.Timedelta(nanoseconds=1)
-                return start, end
-            # month granularity
-            last_day = monthrange(y, m)[1]
-            start = pd.Timestamp(datetime.datetime(y, m, 1, 0, 0, 0, tzinfo=datetime.UTC))
-            end = pd.Timestamp(
-                datetime.datetime(y, m, last_day, 23, 59, 59, tzinfo=datetime.UTC)
-            ) + pd.Timedelta(seconds=0.999999999)  # inclusive
-            return start, end
-
-        def _collect_row_groups_meta(
-            file_path: str,
-        ) -> tuple[list[tuple[pd.Timestamp, pd.Timestamp, int]], str | None]:
-            """
-            Return list of (rg_min, rg_max, rg_rows) for the temporal column from Parquet footer.
-            If stats are missing, returns empty list and a reason.
-            """
-            try:
-                pf = pq.ParquetFile(file_path, filesystem=self._fs)
-            except Exception as e:
-                return [], f"open_error:{e}"
-
-            # Find Arrow time unit (ns/us/ms/s)
-            try:
-                arr_schema = pf.schema_arrow
-                tfield = arr_schema.field(time_index_name)
-                ttype = tfield.type  # pyarrow.TimestampType
-                unit = getattr(ttype, "unit", "ns")
-            except Exception:
-                # If schema isn't Arrow-resolvable, fall back to 'ns'
-                unit = "ns"
-
-            rg_list: list[tuple[pd.Timestamp, pd.Timestamp, int]] = []
-            try:
-                meta = pf.metadata
-                nrg = meta.num_row_groups
-                # Find column index by name (robust against nested/flat)
-                col_idx = None
-                # Try direct mapping via schema_arrow index first
-                try:
-                    idx = arr_schema.get_field_index(time_index_name)
-                    if idx != -1:
-                        col_idx = idx
-                except Exception:
-                    col_idx = None
-                for i in range(nrg):
-                    rg = meta.row_group(i)
-                    # choose the column chunk for time_index
-                    col = None
-                    if col_idx is not None and col_idx < rg.num_columns:
-                        col = rg.column(col_idx)
-                        # Verify we picked the right column name; if not, search by path
-                        try:
-                            name = str(col.path_in_schema)
-                            if name.split(".")[-1] != time_index_name:
-                                col = None
-                            # else ok
-                        except Exception:
-                            # fall back to search
-                            col = None
-                    if col is None:
-                        for j in range(rg.num_columns):
-                            cj = rg.column(j)
-                            try:
-                                name = str(cj.path_in_schema)
-                            except Exception:
-                                name = ""
-                            if name.split(".")[-1] == time_index_name:
-                                col = cj
-                                break
-                    if col is None:
-                        # can't find time_index column → skip this row group
-                        continue
-                    stats = getattr(col, "statistics", None)
-                    if not stats or not getattr(stats, "has_min_max", False):
-                        continue
-                    vmin, vmax = stats.min, stats.max
-
-                    # Convert min/max to UTC Timestamps
-                    def conv(v):
-                        if v is None:
-                            return None
-                        # numeric epoch in unit
-                        if isinstance(v, (int, np.integer)):
-                            return pd.to_datetime(int(v), unit=unit, utc=True)
-                        if isinstance(v, float):
-                            return pd.to_datetime(int(v), unit=unit, utc=True)
-                        # already datetime-like
-                        try:
-                            return pd.to_datetime(v, utc=True)
-                        except Exception:
-                            return None
-
-                    tmin = conv(vmin)
-                    tmax = conv(vmax)
-                    if tmin is None or tmax is None:
-                        continue
-                    # ensure ordering
-                    if tmax < tmin:
-                        tmin, tmax = tmax, tmin
-                    rg_list.append((tmin, tmax, rg.num_rows))
-            except Exception as e:
-                return [], f"meta_error:{e}"
-            return rg_list, None
-
         def _rows_estimate_until(
             T: pd.Timestamp,
             rgs: list[tuple[pd.Timestamp, pd.Timestamp, int]],
@@ -985,13 +1864,9 @@ class DuckDBInterface:
 
         # --- collect candidate files via partition pruning ---------------------
 
-        base = f"{self.db_path}/{table}"
-        selector = pa_fs.FileSelector(base, recursive=True)
-        files = [
-            info.path
-            for info in self._fs.get_file_info(selector)
-            if info.type == pa_fs.FileType.File and info.path.endswith(".parquet")
-        ]
+        # Footer statistics come from the table manifest; a periodic reconciliation only
+        # lists the directory and reads footers of fragments the manifest has not seen yet.
+        manifest = self._table_manifest(table, time_index_name=time_index_name)
 
         # Gather row-group metadata for relevant files
         row_groups: list[tuple[pd.Timestamp, pd.Timestamp, int]] = []
@@ -999,33 +1874,27 @@ class DuckDBInterface:
         files_skipped_part = 0
         files_meta_errors = 0
 
-        # Use partition bounds to prune before opening footers
-        for path in files:
-            p_start, p_end = _parse_part_bounds_from_path(path)
+        # Use partition bounds to prune before looking at row groups
+        for relative_path, entry in manifest["files"].items():
+            p_start, p_end = _partition_bounds_from_path(f"{table}/{relative_path}")
             # If we don't know start yet, we must not prune too aggressively; include all and tighten later
             if eff_start is not None and p_start is not None and p_end is not None:
                 if p_end < eff_start or p_start > eff_end:
                     files_skipped_part += 1
                     continue
-            rgs, err = _collect_row_groups_meta(path)
-            if err is not None:
+            if entry.get("num_rows") is None:
                 files_meta_errors += 1
-                # Fall back: if partition range overlaps, take whole file as one group
-                if p_start is not None and p_end is not None:
-                    # To avoid undercounting, include the file-level partition range as a single group
-                    # with the file's row count from footer if available; otherwise skip.
-                    try:
-                        pf = pq.ParquetFile(path, filesystem=self._fs)
-                        nrows_file = pf.metadata.num_rows
-                        row_groups.append(
-                            (p_start or eff_start or _to_utc_ts(now), p_end or eff_end, nrows_file)
-                        )
-                        files_considered += 1
-                    except Exception:
-                        pass
                 continue
-            if rgs:
-                row_groups.extend(rgs)
+            if not entry["stats_complete"] and p_start is not None and p_end is not None:
+                # To avoid undercounting, include the file-level partition range as a single group
+                row_groups.append((p_start, p_end, entry["num_rows"]))
+                files_considered += 1
+                continue
+            if entry["row_groups"]:
+                row_groups.extend(
+                    (pd.Timestamp(mn, tz="UTC"), pd.Timestamp(mx, tz="UTC"), rows)
+                    for mn, mx, rows in entry["row_groups"]
+                )
                 files_considered += 1
 
         if not row_groups:
@@ -1167,6 +2036,226 @@ class DuckDBInterface:
         Returns:
             pd.DataFrame: The queried data, or an empty DataFrame if the table doesn't exist.
         """
+        data, pending = self._read_arrow(
+            table,
+            start=start,
+            end=end,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+            data_frequency=data_frequency,
+        )
+        if data.num_rows == 0:
+            return pd.DataFrame()
+        df = self._arrow_to_pandas(data, pending)
+        logger.debug(f"Read {len(df)} rows from table '{table}'.")
+        return df
+
+    def read_arrow(
+        self,
+        table: str,
+        data_frequency: DataFrequency = DataFrequency.one_m,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """
+        Arrow-native `read`: the same rows as a `pyarrow.Table`, fetched without a pandas
+        round trip.
+
+        Column types are mapped at the schema level (UTC timestamps, int64, float64, bool,
+        string, date) to match the dtypes `read` returns. Missing tables or columns give an
+        empty table.
+        """
+        data, _ = self._read_arrow(
+            table,
+            start=start,
+            end=end,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+            data_frequency=data_frequency,
+        )
+        return data
+
+    def _read_arrow(
+        self,
+        table: str,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+        data_frequency: DataFrequency,
+    ) -> tuple[pa.Table, dict[str, str]]:
+        with self._swap_lock(table).reading():
+            planned = self._read_query(
+                table,
+                start=start,
+                end=end,
+                great_or_equal=great_or_equal,
+                less_or_equal=less_or_equal,
+                index_names=index_names,
+                time_index_name=time_index_name,
+                dimension_filters=dimension_filters,
+                index_coordinates=index_coordinates,
+                dimension_range_map=dimension_range_map,
+                columns=columns,
+            )
+            if planned is None:
+                return pa.table({}), {}
+            query, params, view_columns, relations = planned
+
+            con = self.con
+            try:
+                for name, relation in relations.items():
+                    con.register(name, relation)
+                result = con.execute(query, params)
+                # DuckDB 1.5 renamed fetch_arrow_table to to_arrow_table.
+                if hasattr(result, "to_arrow_table"):
+                    data = result.to_arrow_table()
+                else:
+                    data = result.fetch_arrow_table()
+                return self._cast_arrow_read(
+                    data, table=table, view_columns=view_columns, data_frequency=data_frequency
+                )
+
+            except duckdb.CatalogException as e:
+                logger.warning(
+                    f"CatalogException for table '{table}': {e}. Returning empty DataFrame."
+                )
+                return pa.table({}), {}
+            except duckdb.Error as e:
+                logger.error(f"Failed to read data from table '{table}': {e}")
+                raise
+            except Exception as e:
+                logger.exception(
+                    f"An unexpected error occurred during read from table '{table}': {e}"
+                )
+                raise
+            finally:
+                for name in relations:
+                    con.unregister(name)
+
+    def iter_batches(
+        self,
+        table: str,
+        data_frequency: DataFrequency = DataFrequency.one_m,
+        *,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        output: str = "pandas",
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """
+        Stream the rows `read` would return, in index order, `batch_rows` at a time.
+
+        Batches come from a DuckDB Arrow record-batch reader on a dedicated cursor, so only one
+        batch is materialized at a time and no `constrain_read` row cap applies. Each batch
+        is typed like `read_arrow`; ``output="pandas"`` converts it like `read`. Missing
+        tables or columns yield nothing.
+        """
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be positive, got {batch_rows}")
+        if output not in BATCH_OUTPUTS:
+            raise ValueError(f"output must be one of {BATCH_OUTPUTS}, got {output!r}")
+        # Held while batches are consumed: compaction must not delete fragments mid-stream.
+        with self._swap_lock(table).reading():
+            planned = self._read_query(
+                table,
+                start=start,
+                end=end,
+                great_or_equal=great_or_equal,
+                less_or_equal=less_or_equal,
+                index_names=index_names,
+                time_index_name=time_index_name,
+                dimension_filters=dimension_filters,
+                index_coordinates=index_coordinates,
+                dimension_range_map=dimension_range_map,
+                columns=columns,
+            )
+            if planned is None:
+                return
+            query, params, view_columns, relations = planned
+
+            # The open result pins its cursor; keep it off the thread-local one so the
+            # consumer can issue other queries between batches. Closing it drops `relations`.
+            cursor = self._root_con.cursor()
+            try:
+                cursor.execute("SET TIMEZONE = 'UTC';")
+                for name, relation in relations.items():
+                    cursor.register(name, relation)
+                result = cursor.execute(query, params)
+                # DuckDB 1.5 renamed fetch_record_batch to to_arrow_reader.
+                if hasattr(result, "to_arrow_reader"):
+                    reader = result.to_arrow_reader(batch_rows)
+                else:
+                    reader = result.fetch_record_batch(batch_rows)
+                for batch in reader:
+                    if batch.num_rows == 0:
+                        continue
+                    batch, pending = self._cast_arrow_read(
+                        batch, table=table, view_columns=view_columns, data_frequency=data_frequency
+                    )
+                    yield batch if output == "arrow" else self._arrow_to_pandas(batch, pending)
+            finally:
+                cursor.close()
+
+    def _read_query(
+        self,
+        table: str,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+    ) -> tuple[str, list[Any], list[tuple[str, str]] | None, dict[str, pa.Table]] | None:
+        """
+        SQL, parameters, (when known) view schema and the Arrow relations the SQL joins for
+        a filtered read, or None when the table or a requested column is missing.
+
+        Callers register the relations on the connection that runs the query. Long
+        `index_coordinates` / `dimension_range_map` lists become such relations, semi-joined
+        on the identity columns with per-row time bounds, so planning stays constant-size.
+        """
 
         def qident(name: str) -> str:
             return '"' + str(name).replace('"', '""') + '"'
@@ -1203,25 +2292,124 @@ class DuckDBInterface:
 
         if not self.table_exists(table):
             logger.warning(f"Table '{table}' does not exist in {self.db_path}.")
-            return pd.DataFrame()
+            return None
+
+        # --- Partition pruning: scan only fragments that can hold requested times ---
+        def as_utc_bound(value: Any) -> pd.Timestamp | None:
+            value = as_datetime_param(value)
+            return None if value is None else pd.Timestamp(value, tz="UTC")
+
+        base_window = (as_utc_bound(start), as_utc_bound(end))
+        time_windows = [base_window]
+        if dimension_range_map:
+            time_windows = []
+            for date_info in dimension_range_map:
+                lo = as_utc_bound(date_info.get("start_date"))
+                hi = as_utc_bound(date_info.get("end_date"))
+                if base_window[0] is not None:
+                    lo = base_window[0] if lo is None else max(lo, base_window[0])
+                if base_window[1] is not None:
+                    hi = base_window[1] if hi is None else min(hi, base_window[1])
+                time_windows.append((lo, hi))
+        dimension_constraints = []
+        if dimension_filters:
+            dimension_constraints.append(
+                {name: list(values) for name, values in dimension_filters.items()}
+            )
+        coordinate_branches = [
+            *([index_coordinates] if index_coordinates else []),
+            *(
+                [[info.get("coordinate") or {} for info in dimension_range_map]]
+                if dimension_range_map
+                else []
+            ),
+        ]
+        for branches in coordinate_branches:
+            # OR of coordinates: a dimension is constrained only if every branch pins it.
+            shared = set.intersection(*(set(coordinate) for coordinate in branches))
+            dimension_constraints.append(
+                {name: [coordinate[name] for coordinate in branches] for name in shared}
+            )
+        pruned = self._pruned_read_source(
+            table,
+            time_index_name=time_index_name,
+            windows=time_windows,
+            dimension_constraints=dimension_constraints,
+        )
+        source, view_columns = pruned if pruned is not None else (qident(table), None)
 
         if columns is not None:
-            df_cols = self.con.execute(f"SELECT * FROM {table} AS _q LIMIT 0").fetch_df()
+            if view_columns is not None:
+                available_columns = {name for name, _ in view_columns}
+            else:
+                available_columns = set(
+                    self.con.execute(f"SELECT * FROM {table} AS _q LIMIT 0").fetch_df().columns
+                )
             projected_columns = list(dict.fromkeys([*index_names, *columns]))
-            if any([c not in df_cols.columns for c in projected_columns]):
+            if any([c not in available_columns for c in projected_columns]):
                 logger.warning(
                     f"not all Columns '{projected_columns}' are present in table '{table}'. returning an empty DF"
                 )
-                return pd.DataFrame()
+                return None
 
         cols_select = "*"
         if columns:
             select_set = list(dict.fromkeys([*index_names, *columns]))
             cols_select = ", ".join(f'"{c}"' for c in select_set)
 
-        sql_parts = [f'SELECT {cols_select} FROM "{table}"']
+        sql_parts = [f"SELECT {cols_select} FROM {source}"]
         params = []
         where_clauses = []
+        join_clauses = []
+        relations: dict[str, pa.Table] = {}
+
+        def join_coordinates(entries: list[dict[str, Any]]) -> bool:
+            """
+            Filter on range-map style `entries` through registered Arrow relations. Returns
+            False, registering nothing, when a coordinate column has no single Arrow type.
+            """
+            source_name = qident(table)
+            branches = []
+            group_relations = {}
+            for dimensions, start_operand, end_operand, rows in coordinate_join_groups(entries):
+                name = f"_coordinates_{uuid.uuid4().hex}"
+                arrays, names, conditions = [], [], []
+                for position, dimension in enumerate(dimensions):
+                    validate_dimension_name(dimension)
+                    try:
+                        arrays.append(pa.array([row[position] for row in rows]))
+                    except (pa.ArrowInvalid, pa.ArrowTypeError):
+                        return False
+                    names.append(f"_c{position}")
+                    conditions.append(
+                        f"{name}._c{position} IS NOT DISTINCT FROM "
+                        f"{source_name}.{qident(dimension)}"
+                    )
+                position = len(dimensions)
+                for bound, operand in (("_start", start_operand), ("_end", end_operand)):
+                    if operand is None:
+                        continue
+                    arrays.append(
+                        pa.array(
+                            [as_datetime_param(row[position]) for row in rows],
+                            type=pa.timestamp("us"),
+                        )
+                    )
+                    names.append(bound)
+                    conditions.append(
+                        f"{source_name}.{qident(time_index_name)} {operand} {name}.{bound}"
+                    )
+                    position += 1
+                group_relations[name] = pa.table(arrays, names=names)
+                branches.append((name, " AND ".join(conditions) or "TRUE"))
+            relations.update(group_relations)
+            if len(branches) == 1:
+                name, condition = branches[0]
+                join_clauses.append(f"SEMI JOIN {name} ON {condition}")
+            elif branches:
+                exists = [f"EXISTS (SELECT 1 FROM {name} WHERE {on})" for name, on in branches]
+                where_clauses.append(f"({' OR '.join(exists)})")
+            return True
 
         # --- Build WHERE clauses ---
         if start is not None:
@@ -1240,7 +2428,10 @@ class DuckDBInterface:
                 placeholders = ", ".join("?" for _ in value_list)
                 where_clauses.append(f"{qident(dimension)} IN ({placeholders})")
                 params.extend(value_list)
-        if index_coordinates:
+        if index_coordinates and not (
+            len(index_coordinates) >= COORDINATE_JOIN_MIN_ENTRIES
+            and join_coordinates([{"coordinate": coordinate} for coordinate in index_coordinates])
+        ):
             coordinate_conditions = []
             for coordinate in index_coordinates:
                 parts = []
@@ -1252,7 +2443,10 @@ class DuckDBInterface:
                     coordinate_conditions.append(f"({' AND '.join(parts)})")
             if coordinate_conditions:
                 where_clauses.append(f"({' OR '.join(coordinate_conditions)})")
-        if dimension_range_map:
+        if dimension_range_map and not (
+            len(dimension_range_map) >= COORDINATE_JOIN_MIN_ENTRIES
+            and join_coordinates(dimension_range_map)
+        ):
             range_conditions = []
             for date_info in dimension_range_map:
                 coordinate = date_info.get("coordinate") or {}
@@ -1277,45 +2471,155 @@ class DuckDBInterface:
             if range_conditions:
                 where_clauses.append(f"({' OR '.join(range_conditions)})")
 
+        sql_parts.extend(join_clauses)
         if where_clauses:
             sql_parts.append("WHERE " + " AND ".join(where_clauses))
         order_by = ", ".join(qident(name) for name in index_names)
         sql_parts.append(f"ORDER BY {order_by}")
         query = " ".join(sql_parts)
         logger.debug(f"Executing read query: {query} with params: {params}")
+        return query, params, view_columns, relations
 
-        try:
-            df = self.con.execute(query, params).fetch_df()
-
-            if not df.empty:
-                schema = self.con.execute(f'PRAGMA table_info("{table}")').fetchall()
-                type_map = {
-                    name: self._duck_to_pandas(duck_type, data_frequency=data_frequency)
-                    for cid, name, duck_type, notnull, default, pk in schema
-                    if name in df.columns
-                }
-                for col, target_type in type_map.items():
+    def _cast_arrow_read(
+        self,
+        data: pa.Table | pa.RecordBatch,
+        *,
+        table: str,
+        view_columns: list[tuple[str, str]] | None,
+        data_frequency: DataFrequency,
+    ) -> tuple[pa.Table | pa.RecordBatch, dict[str, str]]:
+        """
+        Cast every column to the Arrow type of its declared DuckDB type.
+
+        Returns the cast data and the columns Arrow could not cast, mapped to the dtype
+        token `_arrow_to_pandas` should coerce them to after conversion.
+        """
+        if view_columns is None:
+            schema = self.con.execute(f'PRAGMA table_info("{table}")').fetchall()
+            view_columns = [(row[1], row[2]) for row in schema]
+        declared = dict(view_columns)
+        arrays, fields, pending = [], [], {}
+        for field, array in zip(data.schema, data.columns, strict=True):
+            if field.name in declared:
+                token = self._duck_to_pandas_token(declared[field.name], data_frequency)
+                target = _arrow_read_type(token, field.type)
+                if target is not None and target != field.type:
                     try:
-                        df[col] = token_to_pandas_series(df[col], target_type)
-                    except Exception as type_e:
-                        logger.warning(
-                            f"Could not coerce column '{col}' to type '{target_type}': {type_e}"
-                        )
+                        array = array.cast(target)
+                        field = field.with_type(target)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as cast_e:
+                        logger.debug(f"Arrow cast of column '{field.name}' failed: {cast_e}")
+                        pending[field.name] = token
+            arrays.append(array)
+            fields.append(field)
+        return type(data).from_arrays(arrays, schema=pa.schema(fields)), pending
 
-                logger.debug(f"Read {len(df)} rows from table '{table}'.")
-                return df
+    @staticmethod
+    def _arrow_to_pandas(
+        data: pa.Table | pa.RecordBatch, pending: dict[str, str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Convert read results to pandas once, with nullable (Arrow-backed where pandas
+        supports it) dtypes. `data` is consumed and must not be used afterwards.
+        """
+        df = data.to_pandas(
+            types_mapper=_ARROW_PANDAS_DTYPES.get, split_blocks=True, self_destruct=True
+        )
+        for col, token in (pending or {}).items():
+            try:
+                df[col] = token_to_pandas_series(df[col], token)
+            except Exception as type_e:
+                logger.warning(f"Could not coerce column '{col}' to type '{token}': {type_e}")
+        return df
 
-            return pd.DataFrame()
+    def _pruned_read_source(
+        self,
+        table: str,
+        *,
+        time_index_name: str,
+        windows: list[tuple[pd.Timestamp | None, pd.Timestamp | None]],
+        dimension_constraints: list[dict[str, list[Any]]] = (),
+    ) -> tuple[str, list[tuple[str, str]]] | None:
+        """
+        FROM-clause reading only the fragments whose partition path (and recorded row-group
+        time bounds) intersect one of `windows`, cast like the view, plus the view columns.
 
-        except duckdb.CatalogException as e:
-            logger.warning(f"CatalogException for table '{table}': {e}. Returning empty DataFrame.")
-            return pd.DataFrame()
-        except duckdb.Error as e:
-            logger.error(f"Failed to read data from table '{table}': {e}")
-            raise
+        For bucketed layouts, `dimension_constraints` (each mapping identity dimensions to
+        the values a filter allows; all must hold) also prunes bucket directories.
+
+        Returns None when pruning cannot narrow the scan; callers then read the view.
+        """
+
+        def qident(name: str) -> str:
+            return '"' + str(name).replace('"', '""') + '"'
+
+        time_bounded = any(lo is not None or hi is not None for lo, hi in windows)
+        if not time_bounded and not dimension_constraints:
+            return None
+        try:
+            manifest = self._table_manifest(table, time_index_name=time_index_name)
         except Exception as e:
-            logger.exception(f"An unexpected error occurred during read from table '{table}': {e}")
-            raise
+            logger.debug(f"read: manifest unavailable for '{table}', skipping pruning: {e}")
+            return None
+        files = manifest["files"]
+        if not files:
+            return None
+        stats_usable = manifest.get("time_index_name") == time_index_name
+
+        buckets = None
+        spec = PartitionSpec.parse(manifest.get("partition_spec"))
+        if spec is not None and spec.bucket_dimension is not None:
+            for constraint in dimension_constraints:
+                if spec.bucket_dimension in constraint:
+                    allowed = spec.buckets_for(constraint[spec.bucket_dimension])
+                    buckets = allowed if buckets is None else buckets & allowed
+        if not time_bounded and buckets is None:
+            return None
+
+        selected = []
+        for relative_path, entry in files.items():
+            if buckets is not None and partition_bucket_from_path(relative_path) not in buckets:
+                continue
+            if not time_bounded:
+                selected.append(relative_path)
+                continue
+            lo_f, hi_f = _partition_bounds_from_path(f"{table}/{relative_path}")
+            if stats_usable and entry.get("stats_complete") and entry["row_groups"]:
+                s_min = pd.Timestamp(min(rg[0] for rg in entry["row_groups"]), tz="UTC")
+                s_max = pd.Timestamp(max(rg[1] for rg in entry["row_groups"]), tz="UTC")
+                lo_f = s_min if lo_f is None else max(lo_f, s_min)
+                hi_f = s_max if hi_f is None else min(hi_f, s_max)
+            for lo, hi in windows:
+                if (lo is None or hi_f is None or hi_f >= lo) and (
+                    hi is None or lo_f is None or lo_f <= hi
+                ):
+                    selected.append(relative_path)
+                    break
+        if len(selected) == len(files):
+            return None
+        if any(files[path].get("columns") is None for path in selected):
+            return None
+
+        # Binding the view would open every fragment; take its columns from the manifest.
+        schema = self._manifest_schema(manifest)
+        if schema is None:
+            return None
+        hidden = self._hidden_partition_columns(manifest)
+        view_columns = [(name, coltype) for name, coltype in schema if name not in hidden]
+        present = {name for path in selected for name, _ in files[path]["columns"]}
+        select_list = ", ".join(
+            f"CAST({qident(name) if name in present else 'NULL'} AS {coltype}) AS {qident(name)}"
+            for name, coltype in view_columns
+        )
+        logger.debug(f"read: '{table}' pruned to {len(selected)} of {len(files)} fragments")
+        if not selected:
+            return f"(SELECT {select_list} WHERE FALSE) AS {qident(table)}", view_columns
+        file_list = ", ".join(f"'{self.db_path}/{table}/{path}'" for path in selected)
+        source = (
+            f"(SELECT {select_list} FROM read_parquet([{file_list}], "
+            f"union_by_name = TRUE, hive_partitioning = FALSE)) AS {qident(table)}"
+        )
+        return source, view_columns
 
     def drop_table(self, table: str) -> None:
         """
@@ -1354,19 +2658,45 @@ class DuckDBInterface:
             logger.error(f"Error listing tables/views in {self.db_path}: {e}")
             return []
 
+    def stored_tables(self) -> list[str]:
+        """
+        Returns names of table directories under db_path that hold Parquet data.
+
+        Unlike `list_tables`, this does not depend on the DuckDB catalog, so it also
+        covers tables written by other processes or stored on an object store.
+        """
+        selector = fs.FileSelector(self._object_path, recursive=False, allow_not_found=True)
+        return sorted(
+            info.base_name
+            for info in self._fs.get_file_info(selector)
+            if info.type == fs.FileType.Directory
+            and (
+                self._fs.get_file_info(self._manifest_fs_path(info.base_name)).type
+                == fs.FileType.File
+                or self._list_table_parquet_files(info.base_name)
+            )
+        )
+
     # ──────────────────────────────────────────────────────────────────────────────
     # Private helpers
     # ──────────────────────────────────────────────────────────────────────────────
 
-    def _ensure_view(self, table: str) -> None:
+    def _ensure_view(
+        self,
+        table: str,
+        time_index_name: str | None = None,
+        *,
+        reconcile: bool = False,
+    ) -> None:
         """
         CREATE OR REPLACE a view named `table` that:
           * reads all Parquet under self.db_path/table/**
-          * hides partition columns (year, month, day)
+          * hides partition columns (year, month, day, plus those of the table's spec)
           * locks column dtypes by explicit CASTs
-        Schema is derived by unifying schemas across all partitions.
+        Schema is the union of the per-file schemas recorded in the table manifest;
+        it falls back to unifying schemas across all partitions when the manifest
+        cannot describe every file.
         """
-        partition_cols = {"year", "month", "day"}
 
         def qident(name: str) -> str:
             """Helper to safely quote identifiers for SQL."""
@@ -1376,19 +2706,38 @@ class DuckDBInterface:
 
         # ✅ Key Change 1: Define a single, robust way to read the data.
         # This uses union_by_name=True to handle schema differences across files.
-        read_clause = f"read_parquet('{file_glob}', union_by_name = True, hive_partitioning = TRUE)"
+        # Fragments embed their partition columns, so path keys are not needed; reading them
+        # would fail while a repartition briefly leaves two layouts side by side.
+        read_clause = (
+            f"read_parquet('{file_glob}', union_by_name = True, hive_partitioning = FALSE)"
+        )
 
+        schema = None
+        manifest = None
         try:
-            # ✅ Key Change 2: Use the robust read_clause for schema discovery.
-            # This now correctly gets all columns from all partitions.
-            desc_rows = self.con.execute(f"DESCRIBE SELECT * FROM {read_clause}").fetchall()
-        except duckdb.Error as e:
-            # No files yet or glob fails — skip (keeps existing view if any)
-            logger.warning(f"_ensure_view: cannot scan files for '{table}': {e}")
-            return
+            manifest = self._table_manifest(
+                table,
+                time_index_name=time_index_name,
+                reconcile=reconcile,
+            )
+            schema = self._manifest_schema(manifest)
+        except Exception as e:
+            logger.warning(f"_ensure_view: manifest unavailable for '{table}': {e}")
+
+        if schema is None:
+            try:
+                # ✅ Key Change 2: Use the robust read_clause for schema discovery.
+                # This now correctly gets all columns from all partitions.
+                desc_rows = self.con.execute(f"DESCRIBE SELECT * FROM {read_clause}").fetchall()
+            except duckdb.Error as e:
+                # No files yet or glob fails — skip (keeps existing view if any)
+                logger.warning(f"_ensure_view: cannot scan files for '{table}': {e}")
+                return
+            schema = [(r[0], r[1]) for r in desc_rows if r]
 
         # Build CAST list, dropping partition columns
-        cols = [(r[0], r[1]) for r in desc_rows if r and r[0] not in partition_cols]
+        hidden = self._hidden_partition_columns(manifest)
+        cols = [(name, coltype) for name, coltype in schema if name not in hidden]
         if not cols:
             logger.warning(
                 f"_ensure_view: no non-partition columns for '{table}'. Skipping view refresh."
@@ -1411,18 +2760,621 @@ class DuckDBInterface:
 
         self._execute_transaction(ddl)
 
+    # ── Parquet manifest ─────────────────────────────────────────────────────
+    #
+    # Every table directory carries a `_manifest.json` sidecar describing its Parquet
+    # fragments: relative path → {num_rows, columns, row_groups, stats_complete}, where
+    # `row_groups` holds `[min_ns, max_ns, num_rows]` for the temporal column. Writers
+    # update it incrementally; readers use it instead of opening every footer.
+
+    def _table_fs_root(self, table: str) -> str:
+        return f"{self._object_path}/{table}"
+
+    def _manifest_fs_path(self, table: str) -> str:
+        return f"{self._table_fs_root(table)}/{MANIFEST_FILE_NAME}"
+
+    def _relative_table_path(self, table: str, path: str) -> str:
+        for root in (f"{self.db_path}/{table}/", f"{self._object_path}/{table}/"):
+            if path.startswith(root):
+                return path[len(root) :]
+        return path.rpartition(f"/{table}/")[2]
+
+    def _list_table_parquet_files(self, table: str) -> list[str]:
+        """Relative paths of every Parquet fragment currently under the table directory."""
+        selector = fs.FileSelector(self._table_fs_root(table), recursive=True, allow_not_found=True)
+        return sorted(
+            self._relative_table_path(table, info.path)
+            for info in self._fs.get_file_info(selector)
+            if info.type == fs.FileType.File and info.path.endswith(".parquet")
+        )
+
+    def _list_partition_parquet_files(self, table: str, partition: str) -> set[str]:
+        """Relative paths of the Parquet fragments directly under one partition directory."""
+        selector = fs.FileSelector(
+            f"{self._table_fs_root(table)}/{partition}".rstrip("/"),
+            recursive=False,
+            allow_not_found=True,
+        )
+        return {
+            self._relative_table_path(table, info.path)
+            for info in self._fs.get_file_info(selector)
+            if info.type == fs.FileType.File and info.path.endswith(".parquet")
+        }
+
+    def _arrow_schema_columns(self, schema) -> list[list[str]]:
+        """Map an Arrow schema to DuckDB `[name, type]` pairs without touching data."""
+        relation_name = f"_ms_schema_{uuid.uuid4().hex}"
+        self.con.register(relation_name, schema.empty_table())
+        try:
+            rows = self.con.execute(f'DESCRIBE SELECT * FROM "{relation_name}"').fetchall()
+        finally:
+            self.con.unregister(relation_name)
+        return [[row[0], row[1]] for row in rows]
+
+    def _parquet_manifest_entry(
+        self,
+        table: str,
+        relative_path: str,
+        time_index_name: str | None,
+        index_names: list[str] | None = None,
+    ) -> dict[str, Any]:
+        path = f"{self._table_fs_root(table)}/{relative_path}"
+        try:
+            pf = pq.ParquetFile(path, filesystem=self._fs)
+            entry = {
+                "num_rows": pf.metadata.num_rows,
+                "columns": self._arrow_schema_columns(pf.schema_arrow),
+                "row_groups": [],
+                "stats_complete": False,
+                # Fragments not recorded by a writer are ordered by modification time.
+                "written_ns": self._fs.get_file_info(path).mtime_ns,
+            }
+            if time_index_name:
+                entry["row_groups"], entry["stats_complete"] = _time_row_groups_from_footer(
+                    pf, time_index_name
+                )
+            if index_names:
+                entry["keys"] = self._build_key_index(table, relative_path, index_names)
+            return entry
+        except Exception as e:
+            logger.warning(f"manifest: cannot read footer of {table}/{relative_path}: {e}")
+            return {"num_rows": None, "columns": None, "row_groups": [], "stats_complete": False}
+
+    def _read_manifest(self, table: str) -> dict[str, Any] | None:
+        path = self._manifest_fs_path(table)
+        info = self._fs.get_file_info(path)
+        if info.type != fs.FileType.File:
+            self._manifest_cache.pop(table, None)
+            return None
+        stamp = (info.mtime_ns, info.size)
+        cached = self._manifest_cache.get(table)
+        if cached is not None and info.mtime_ns is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with self._fs.open_input_stream(path) as stream:
+                manifest = json.loads(stream.read())
+        except Exception as e:
+            logger.warning(f"manifest: cannot read {path}: {e}")
+            return None
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return None
+        self._manifest_cache[table] = (stamp, manifest)
+        return manifest
+
+    def _write_manifest(self, table: str, manifest: dict[str, Any]) -> None:
+        path = self._manifest_fs_path(table)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        self._fs.create_dir(self._table_fs_root(table), recursive=True)
+        with self._fs.open_output_stream(tmp_path) as stream:
+            stream.write(json.dumps(manifest, separators=(",", ":")).encode("utf-8"))
+        self._fs.move(tmp_path, path)
+        info = self._fs.get_file_info(path)
+        self._manifest_cache[table] = ((info.mtime_ns, info.size), manifest)
+
+    def _table_manifest(
+        self,
+        table: str,
+        *,
+        time_index_name: str | None = None,
+        reconcile: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Return the manifest for *table*, building it from the file tree when absent.
+
+        Writers record their fragments in the manifest, so a changed manifest file is
+        the signal for fragments written by other processes. The recorded file list is
+        additionally checked against a directory listing when `reconcile=True` or when
+        the last listing (`reconciled_at`) is older than DUCKDB_MANIFEST_RECONCILE_SECONDS,
+        which catches fragments written without a manifest update: unknown fragments are
+        added (one footer read each) and vanished ones dropped. Known footers are never
+        re-read.
+        """
+        with self._manifest_lock:
+            manifest = self._read_manifest(table)
+            carried: dict[str, Any] = {}
+            if (
+                manifest is not None
+                and time_index_name is not None
+                and manifest.get("time_index_name") != time_index_name
+            ):
+                # Row-group bounds were collected for a different temporal column;
+                # the table layout and index columns still hold.
+                carried = {
+                    key: manifest[key]
+                    for key in ("index_names", "partition_spec")
+                    if manifest.get(key) is not None
+                }
+                manifest = None
+            if manifest is None:
+                manifest = {
+                    "version": MANIFEST_VERSION,
+                    "time_index_name": time_index_name,
+                    **carried,
+                    "files": {},
+                }
+                reconcile = True
+            if not reconcile and not self._manifest_listing_stale(manifest):
+                return manifest
+
+            on_disk = self._list_table_parquet_files(table)
+            listed = set(on_disk)
+            files = {path: entry for path, entry in manifest["files"].items() if path in listed}
+            for path, entry in manifest["files"].items():
+                if path not in files and entry.get("keys"):
+                    self._delete_key_index(table, path)
+            for path in on_disk:
+                if path not in files:
+                    files[path] = self._parquet_manifest_entry(
+                        table, path, manifest["time_index_name"], manifest.get("index_names")
+                    )
+            manifest = {
+                **manifest,
+                "files": dict(sorted(files.items())),
+                "reconciled_at": time.time(),
+            }
+            if on_disk or self._read_manifest(table) is not None:
+                self._write_manifest(table, manifest)
+            return manifest
+
+    def _reconcile_partitions(
+        self,
+        table: str,
+        partitions: Iterable[str],
+        *,
+        time_index_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Reconcile the manifest entries of *partitions* with a listing of their directories.
+
+        Writers call this for the partitions they are about to touch, so fragments the
+        manifest lacks (written by another process or before a crash) are deduplicated
+        against and become visible to reads without waiting for the full-table listing.
+        """
+        with self._manifest_lock:
+            manifest = self._table_manifest(table, time_index_name=time_index_name)
+            files = dict(manifest["files"])
+            unknown: list[str] = []
+            vanished: list[str] = []
+            for partition in partitions:
+                on_disk = self._list_partition_parquet_files(table, partition)
+                recorded = {path for path in files if path.rpartition("/")[0] == partition}
+                unknown.extend(sorted(on_disk - recorded))
+                vanished.extend(sorted(recorded - on_disk))
+            if not unknown and not vanished:
+                return manifest
+            logger.info(
+                f"manifest: '{table}' had {len(unknown)} unrecorded and {len(vanished)} vanished "
+                "fragments in the partitions being written"
+            )
+            for path in vanished:
+                if files.pop(path).get("keys"):
+                    self._delete_key_index(table, path)
+            for path in unknown:
+                files[path] = self._parquet_manifest_entry(
+                    table, path, manifest["time_index_name"], manifest.get("index_names")
+                )
+            manifest = {**manifest, "files": dict(sorted(files.items()))}
+            self._write_manifest(table, manifest)
+            return manifest
+
+    @staticmethod
+    def _manifest_listing_stale(manifest: dict[str, Any]) -> bool:
+        try:
+            max_age = float(
+                os.getenv("DUCKDB_MANIFEST_RECONCILE_SECONDS") or DEFAULT_MANIFEST_RECONCILE_SECONDS
+            )
+        except ValueError:
+            max_age = DEFAULT_MANIFEST_RECONCILE_SECONDS
+        return time.time() - manifest.get("reconciled_at", 0) >= max_age
+
+    def _update_manifest(
+        self,
+        table: str,
+        *,
+        added: list[str] = (),
+        removed: list[str] = (),
+        time_index_name: str | None = None,
+        index_names: list[str] | None = None,
+        partition_spec: PartitionSpec | None = None,
+        written_ns: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Record fragments written/deleted by this process.
+
+        Added fragments get a `written_ns` write sequence, strictly above every recorded one
+        unless *written_ns* pins it; compaction keeps duplicated keys from the highest.
+        """
+        with self._manifest_lock:
+            manifest = self._table_manifest(table, time_index_name=time_index_name)
+            if index_names is not None:
+                manifest = {**manifest, "index_names": list(index_names)}
+            if partition_spec is not None:
+                manifest = {**manifest, "partition_spec": partition_spec.to_dict()}
+            index_names = manifest.get("index_names")
+            files = dict(manifest["files"])
+            for path in removed:
+                relative_path = self._relative_table_path(table, path)
+                if (files.pop(relative_path, None) or {}).get("keys"):
+                    self._delete_key_index(table, relative_path)
+            if written_ns is None:
+                written_ns = max(
+                    [time.time_ns()]
+                    + [(entry.get("written_ns") or 0) + 1 for entry in files.values()]
+                )
+            for path in added:
+                relative_path = self._relative_table_path(table, path)
+                entry = files.get(relative_path)
+                if entry is None or (index_names and entry.get("keys") is None):
+                    entry = self._parquet_manifest_entry(
+                        table, relative_path, manifest["time_index_name"], index_names
+                    )
+                files[relative_path] = {**entry, "written_ns": written_ns}
+            manifest = {**manifest, "files": dict(sorted(files.items()))}
+            self._write_manifest(table, manifest)
+            return manifest
+
+    def rebuild_manifest(self, table: str, *, time_index_name: str) -> dict[str, Any]:
+        """
+        Discard and rebuild the Parquet manifest of *table* from the file tree.
+
+        Returns a summary with the number of fragments and rows recorded.
+        """
+        with self._manifest_lock:
+            previous = self._read_manifest(table) or {}
+            path = self._manifest_fs_path(table)
+            if self._fs.get_file_info(path).type == fs.FileType.File:
+                self._fs.delete_file(path)
+            self._manifest_cache.pop(table, None)
+            manifest = self._table_manifest(table, time_index_name=time_index_name)
+            if previous.get("partition_spec") is not None:
+                # The bucket dimension cannot be recovered from paths; keep the recorded layout.
+                manifest = {**manifest, "partition_spec": previous["partition_spec"]}
+                self._write_manifest(table, manifest)
+        self._ensure_view(table, time_index_name)
+        return {
+            "files": len(manifest["files"]),
+            "rows": sum(entry.get("num_rows") or 0 for entry in manifest["files"].values()),
+        }
+
+    @staticmethod
+    def _manifest_schema(manifest: dict[str, Any]) -> list[tuple[str, str]] | None:
+        """
+        Union of per-file schemas in file order, or None when the manifest cannot
+        describe the table (unreadable footers or conflicting column types).
+        """
+        if not manifest["files"]:
+            return None
+        schema: dict[str, str] = {}
+        for entry in manifest["files"].values():
+            columns = entry.get("columns")
+            if columns is None:
+                return None
+            for name, coltype in columns:
+                if schema.setdefault(name, coltype) != coltype:
+                    return None
+        return list(schema.items())
+
+    # ── Key index (collision proofs for upsert) ─────────────────────────────
+
+    def _build_key_index(
+        self,
+        table: str,
+        relative_path: str,
+        index_names: list[str],
+    ) -> dict[str, Any] | None:
+        """
+        Read only the index columns of one fragment and persist its key index.
+
+        The Bloom filter goes to a `<fragment>.keys` sidecar; kinds and per-column
+        min/max are returned for the manifest entry.
+        """
+        path = f"{self._table_fs_root(table)}/{relative_path}"
+        key_df = pq.read_table(path, columns=list(index_names), filesystem=self._fs).to_pandas()
+        normalized = _index_key_frame(key_df, index_names)
+        if normalized is None:
+            return None
+        frame, kinds = normalized
+        payload, m, k = _bloom_build(_index_key_hashes(frame))
+
+        tmp_path = f"{path}{KEY_INDEX_SUFFIX}.{uuid.uuid4().hex}.tmp"
+        with self._fs.open_output_stream(tmp_path) as stream:
+            stream.write(payload)
+        self._fs.move(tmp_path, f"{path}{KEY_INDEX_SUFFIX}")
+
+        def bound(value: Any) -> Any:
+            if value is None or pd.isna(value):
+                return None
+            return value.item() if hasattr(value, "item") else value
+
+        return {
+            "kinds": kinds,
+            "min": [
+                None if kind == "bool" else bound(frame[c].min())
+                for c, kind in zip(frame, kinds, strict=True)
+            ],
+            "max": [
+                None if kind == "bool" else bound(frame[c].max())
+                for c, kind in zip(frame, kinds, strict=True)
+            ],
+            "m": m,
+            "k": k,
+        }
+
+    def _delete_key_index(self, table: str, relative_path: str) -> None:
+        try:
+            self._fs.delete_file(f"{self._table_fs_root(table)}/{relative_path}{KEY_INDEX_SUFFIX}")
+        except Exception as e:
+            logger.debug(f"key index: cannot delete sidecar of {table}/{relative_path}: {e}")
+
+    def _colliding_fragments(
+        self,
+        table: str,
+        part_path: str,
+        sub: pd.DataFrame,
+        *,
+        index_names: list[str],
+        manifest: dict[str, Any] | None,
+    ) -> list[str] | None:
+        """
+        Fragments of one partition that may hold keys of `sub`, proven from key indexes.
+
+        Returns [] when no fragment can collide and None when the proof is unavailable
+        (fragments on disk the manifest does not list, missing key index, dtype drift,
+        unreadable sidecar); callers then scan the data.
+        """
+        if manifest is None or manifest.get("index_names") != list(index_names):
+            return None
+        partition = self._relative_table_path(table, part_path)
+        entries = {
+            relative_path: entry
+            for relative_path, entry in manifest["files"].items()
+            if relative_path.rpartition("/")[0] == partition
+        }
+        if self._list_partition_parquet_files(table, partition) != set(entries):
+            return None
+        if not entries:
+            return []
+        if any(not entry.get("keys") for entry in entries.values()):
+            return None
+        normalized = _index_key_frame(sub, index_names)
+        if normalized is None:
+            return None
+        frame, kinds = normalized
+
+        incoming_bounds = []
+        for column, kind in zip(frame, kinds, strict=True):
+            values = frame[column]
+            if kind == "bool" or (kind == "float" and values.isna().any()):
+                incoming_bounds.append(None)
+            else:
+                incoming_bounds.append((values.min(), values.max()))
+
+        hashes = None
+        colliding: list[str] = []
+        for relative_path, entry in entries.items():
+            key_index = entry["keys"]
+            if key_index["kinds"] != kinds:
+                return None
+            disjoint = False
+            for bounds, lo, hi in zip(
+                incoming_bounds, key_index["min"], key_index["max"], strict=True
+            ):
+                if bounds is None or lo is None or hi is None:
+                    continue
+                try:
+                    if bounds[1] < lo or bounds[0] > hi:
+                        disjoint = True
+                        break
+                except TypeError:
+                    continue
+            if disjoint:
+                continue
+            try:
+                with self._fs.open_input_stream(
+                    f"{self._table_fs_root(table)}/{relative_path}{KEY_INDEX_SUFFIX}"
+                ) as stream:
+                    payload = stream.read()
+            except Exception as e:
+                logger.debug(f"key index: sidecar unavailable for {table}/{relative_path}: {e}")
+                return None
+            if hashes is None:
+                hashes = _index_key_hashes(frame)
+            if _bloom_may_contain(payload, key_index["m"], key_index["k"], hashes).any():
+                colliding.append(f"{part_path}/{relative_path.rpartition('/')[2]}")
+        return colliding
+
+    # ── Writers + compaction policy ─────────────────────────────────────────
+
+    def _discard_staged_files(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            try:
+                self._fs.delete_file(path)
+            except Exception as e:
+                logger.debug(f"compact: cannot delete staged file {path}: {e}")
+
+    def _table_lock(self, table: str) -> _TableWriteLock:
+        with self._table_locks_guard:
+            lock = self._table_locks.get(table)
+            if lock is None:
+                lock_path = None
+                if fcntl is not None and isinstance(self._fs, fs.LocalFileSystem):
+                    lock_path = f"{self._table_fs_root(table)}/{TABLE_WRITE_LOCK_FILE_NAME}"
+                lock = self._table_locks[table] = _TableWriteLock(lock_path)
+            return lock
+
+    def is_table_write_locked(self, table: str) -> bool:
+        """
+        True when a writer in another process (an upsert or a compaction) currently holds
+        *table*'s write lock. Always False for tables on an object store.
+        """
+        return self._table_lock(table).held_by_another_process()
+
+    def _swap_lock(self, table: str) -> _FragmentSwapLock:
+        with self._table_locks_guard:
+            return self._swap_locks.setdefault(table, _FragmentSwapLock())
+
+    def _maybe_compact(
+        self,
+        table: str,
+        *,
+        partitions: set[str],
+        index_names: list[str],
+        time_index_name: str,
+    ) -> None:
+        """
+        Opt-in threshold policy run after upsert.
+
+        When DUCKDB_COMPACT_MIN_FRAGMENTS is a positive integer, touched partitions holding
+        at least that many fragments are compacted — inline, or on a single background
+        worker when DUCKDB_COMPACT_BACKGROUND is truthy.
+        """
+        try:
+            min_fragments = int(os.getenv("DUCKDB_COMPACT_MIN_FRAGMENTS") or 0)
+        except ValueError:
+            min_fragments = 0
+        if min_fragments <= 0 or not partitions:
+            return
+
+        manifest = self._table_manifest(table, time_index_name=time_index_name)
+        counts: dict[str, int] = {}
+        for relative_path in manifest["files"]:
+            partition = relative_path.rpartition("/")[0]
+            counts[partition] = counts.get(partition, 0) + 1
+        due = sorted(p for p in partitions if counts.get(p, 0) >= max(min_fragments, 2))
+        if not due:
+            return
+
+        background = os.getenv("DUCKDB_COMPACT_BACKGROUND", "").strip().lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        if not background:
+            self.compact(
+                table,
+                index_names=index_names,
+                time_index_name=time_index_name,
+                partitions=due,
+                min_fragments=min_fragments,
+            )
+            return
+
+        with self._table_locks_guard:
+            due = [p for p in due if (table, p) not in self._compaction_pending]
+            if not due:
+                return
+            self._compaction_pending.update((table, p) for p in due)
+            if self._compaction_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._compaction_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="duckdb-compact"
+                )
+
+        def run() -> None:
+            try:
+                self.compact(
+                    table,
+                    index_names=index_names,
+                    time_index_name=time_index_name,
+                    partitions=due,
+                    min_fragments=min_fragments,
+                )
+            except Exception as e:
+                logger.exception(f"Background compaction of '{table}' failed: {e}")
+            finally:
+                with self._table_locks_guard:
+                    self._compaction_pending.difference_update((table, p) for p in due)
+
+        self._compaction_executor.submit(run)
+
     def _partition_path(self, keys: dict, table: str) -> str:
         parts = [
             f"{k}={int(v):02d}" if k != "year" else f"{k}={int(v):04d}" for k, v in keys.items()
         ]
         return f"{self.db_path}/{table}/" + "/".join(parts)
 
-    def _partition_keys(self, ts: pd.Series, data_frequency: DataFrequency) -> dict:
-        """Return a dict of partition column → Series."""
-        keys = {"year": ts.dt.year.astype(str), "month": ts.dt.month.astype(str)}
-        if data_frequency == "minute":
-            keys["day"] = ts.dt.day.astype(str)
-        return keys
+    def _resolve_partition_spec(
+        self,
+        table: str,
+        manifest: dict[str, Any],
+        requested: PartitionSpec | None,
+        *,
+        data_frequency: DataFrequency,
+    ) -> PartitionSpec:
+        """
+        Layout for the next write to *table*.
+
+        An existing table keeps its layout (directories, row order and row-group size): the
+        one recorded in the manifest, else the one implied by its fragment paths. New tables
+        use `requested`, falling back to daily partitions for sub-daily `data_frequency` and
+        monthly ones otherwise.
+        """
+        recorded = manifest.get("partition_spec")
+        if recorded is not None:
+            stored = PartitionSpec.from_dict(recorded)
+        else:
+            inferred = PartitionSpec.infer_from_paths(manifest["files"])
+            if inferred is None:
+                return requested or PartitionSpec.for_cadence(data_frequency)
+            granularity, bucketed = inferred
+            if not bucketed:
+                stored = PartitionSpec(granularity)
+                if requested is not None and requested.same_directories(stored):
+                    stored = requested
+            elif (
+                requested is not None
+                and requested.bucket_dimension is not None
+                and requested.time_granularity == granularity
+            ):
+                stored = requested
+            else:
+                raise ValueError(
+                    f"Table '{table}' holds bucketed fragments but its manifest records no "
+                    "partition spec; pass the partition_spec it was written with."
+                )
+        if requested is None or requested == stored:
+            return stored
+        if requested.same_directories(stored):
+            logger.debug(
+                f"Table '{table}' keeps its recorded row layout '{stored}' over '{requested}'"
+            )
+        elif table not in self._spec_warned:
+            self._spec_warned.add(table)
+            logger.warning(
+                f"Table '{table}' is stored as '{stored}', not the requested '{requested}'; "
+                "writes keep the stored layout until the table is repartitioned."
+            )
+        return stored
+
+    @staticmethod
+    def _hidden_partition_columns(manifest: dict[str, Any] | None) -> tuple[str, ...]:
+        """Partition columns embedded in fragments but hidden from the view."""
+        recorded = (manifest or {}).get("partition_spec")
+        if recorded is None:
+            return PARTITION_COLUMNS
+        columns = PartitionSpec.from_dict(recorded).partition_columns
+        return tuple(dict.fromkeys((*PARTITION_COLUMNS, *columns)))
 
     def _execute_transaction(self, sql: str) -> None:
         """
@@ -1449,6 +3401,15 @@ class DuckDBInterface:
         token = pandas_dtype_to_token(dtype, remote=False, allow_naive_datetime=True)
         return token_to_backend_type(token, "duckdb")
 
+    @staticmethod
+    def _duck_to_pandas_token(duck_type: str, data_frequency: DataFrequency) -> str:
+        """Dtype token of a DuckDB column type, normalized like `_duck_to_pandas`."""
+        return normalize_dtype_token(
+            backend_type_to_token(duck_type, "duckdb", allow_naive_datetime=True),
+            remote=False,
+            allow_naive_datetime=True,
+        )
+
     @staticmethod
     def _duck_to_pandas(duck_type: str, data_frequency: DataFrequency):
         """
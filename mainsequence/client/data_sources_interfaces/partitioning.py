@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+TIME_GRANULARITIES = ("hour", "day", "month", "year")
+ROW_ORDERS = ("time", "identity", "zorder")
+BUCKET_PARTITION_COLUMN = "bucket"
+DEFAULT_ROW_GROUP_SIZE = 512_000
+
+_GRANULARITY_COLUMNS = {
+    "year": ("year",),
+    "month": ("year", "month"),
+    "day": ("year", "month", "day"),
+    "hour": ("year", "month", "day", "hour"),
+}
+_SUB_DAILY_CADENCE_RE = re.compile(r"^\d+(s|m|min|h)$")
+
+
+def bucket_ids(values: Iterable[Any], bucket_count: int) -> np.ndarray:
+    """
+    Stable hash bucket per value; identical across processes and platforms.
+
+    Values are hashed by their string form (nulls share one bucket), so an integer
+    identifier and its string spelling land in the same bucket.
+    """
+    series = pd.Series(list(values) if not isinstance(values, pd.Series) else values)
+    series = series.astype("object")
+    text = series.where(series.notna(), "\x00null").astype(str).to_numpy(dtype=object)
+    if len(text) == 0:
+        return np.empty(0, dtype=np.int64)
+    return (pd.util.hash_array(text) % np.uint64(bucket_count)).astype(np.int64)
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """
+    Physical partition layout of a DuckDB-backed table.
+
+    Fragments live under ``year=YYYY[/month=MM[/day=DD[/hour=HH]]]`` down to
+    `time_granularity`, optionally followed by ``bucket=NN`` where the bucket is a stable
+    hash of `bucket_dimension` modulo `bucket_count`.
+
+    Inside each fragment rows are sorted by `row_order` and written in row groups of
+    `row_group_size` rows:
+
+    - ``time``: the configured index order (time first); row groups span every identity.
+    - ``identity``: identity dimensions first, then time, so each row group holds few
+      identities and its min/max statistics prune row groups on per-identity reads.
+    - ``zorder``: Z-order (bit interleaving) over the ranks of the identity dimensions and
+      time, a compromise between per-identity and per-time-range pruning.
+
+    The string form accepted by `parse` (and stored in a TimeIndexMetaTable's
+    `partition_strategy`) is ``"time:<granularity>[,bucket:<dimension>:<count>]
+    [,order:<row_order>][,row_group:<rows>]"``, e.g. ``"time:day,bucket:asset_uid:32"``.
+    """
+
+    time_granularity: str = "month"
+    bucket_dimension: str | None = None
+    bucket_count: int | None = None
+    row_order: str = "time"
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+
+    def __post_init__(self) -> None:
+        if self.time_granularity not in TIME_GRANULARITIES:
+            raise ValueError(
+                f"time_granularity must be one of {TIME_GRANULARITIES}, "
+                f"got {self.time_granularity!r}"
+            )
+        if (self.bucket_dimension is None) != (self.bucket_count is None):
+            raise ValueError("bucket_dimension and bucket_count must be given together")
+        if self.bucket_count is not None and self.bucket_count < 1:
+            raise ValueError(f"bucket_count must be positive, got {self.bucket_count}")
+        if self.row_order not in ROW_ORDERS:
+            raise ValueError(f"row_order must be one of {ROW_ORDERS}, got {self.row_order!r}")
+        if self.row_group_size < 1:
+            raise ValueError(f"row_group_size must be positive, got {self.row_group_size}")
+
+    # ── construction ────────────────────────────────────────────────────────
+
+    @classmethod
+    def parse(cls, value: PartitionSpec | Mapping[str, Any] | str | None) -> PartitionSpec | None:
+        """
+        Build a spec from a spec, a mapping (see `to_dict`) or the string form.
+
+        Returns None for empty values and for strategies this grammar does not describe
+        (such as ``"backend_default"``); raises ValueError for malformed specs.
+        """
+        if value is None or isinstance(value, PartitionSpec):
+            return value
+        if isinstance(value, Mapping):
+            return cls.from_dict(value)
+        text = str(value).strip()
+        if not text.lower().startswith("time:"):
+            return None
+
+        granularity = None
+        bucket_dimension = None
+        bucket_count = None
+        options: dict[str, Any] = {}
+        for part in text.split(","):
+            kind, _, rest = part.strip().partition(":")
+            kind = kind.lower()
+            if kind == "time" and granularity is None:
+                granularity = rest.strip().lower()
+            elif kind == "bucket" and bucket_dimension is None:
+                dimension, _, count = rest.rpartition(":")
+                if not dimension or not count.strip().isdigit():
+                    raise ValueError(
+                        f"Invalid bucket clause {part.strip()!r}; "
+                        "expected bucket:<dimension>:<count>"
+                    )
+                bucket_dimension, bucket_count = dimension.strip(), int(count)
+            elif kind == "order" and "row_order" not in options:
+                options["row_order"] = rest.strip().lower()
+            elif kind == "row_group" and "row_group_size" not in options:
+                if not rest.strip().isdigit():
+                    raise ValueError(f"Invalid row_group clause {part.strip()!r}")
+                options["row_group_size"] = int(rest)
+            else:
+                raise ValueError(f"Invalid partition spec clause {part.strip()!r} in {value!r}")
+        return cls(granularity, bucket_dimension, bucket_count, **options)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> PartitionSpec:
+        return cls(
+            time_granularity=str(data.get("time_granularity") or "month"),
+            bucket_dimension=data.get("bucket_dimension"),
+            bucket_count=data.get("bucket_count"),
+            row_order=str(data.get("row_order") or "time"),
+            row_group_size=int(data.get("row_group_size") or DEFAULT_ROW_GROUP_SIZE),
+        )
+
+    @classmethod
+    def for_cadence(cls, cadence: Any) -> PartitionSpec:
+        """Default layout for a cadence token: daily partitions below one day, else monthly."""
+        token = str(getattr(cadence, "value", cadence) or "").strip().lower()
+        return cls("day" if _SUB_DAILY_CADENCE_RE.fullmatch(token) else "month")
+
+    @classmethod
+    def infer_from_paths(cls, relative_paths: Iterable[str]) -> tuple[str, bool] | None:
+        """
+        Time granularity and bucketing implied by existing fragment paths, or None when
+        there are no fragments. The bucket dimension cannot be recovered from paths.
+        """
+        for path in relative_paths:
+            keys = {segment.partition("=")[0] for segment in path.split("/")[:-1]}
+            granularity = next(
+                (g for g in TIME_GRANULARITIES if set(_GRANULARITY_COLUMNS[g]) <= keys), "month"
+            )
+            return granularity, BUCKET_PARTITION_COLUMN in keys
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "time_granularity": self.time_granularity,
+            "bucket_dimension": self.bucket_dimension,
+            "bucket_count": self.bucket_count,
+            "row_order": self.row_order,
+            "row_group_size": self.row_group_size,
+        }
+
+    def __str__(self) -> str:
+        text = f"time:{self.time_granularity}"
+        if self.bucket_dimension is not None:
+            text += f",bucket:{self.bucket_dimension}:{self.bucket_count}"
+        if self.row_order != "time":
+            text += f",order:{self.row_order}"
+        if self.row_group_size != DEFAULT_ROW_GROUP_SIZE:
+            text += f",row_group:{self.row_group_size}"
+        return text
+
+    # ── layout ──────────────────────────────────────────────────────────────
+
+    def same_directories(self, other: PartitionSpec) -> bool:
+        """True when both specs place rows in the same partition directories."""
+        return (self.time_granularity, self.bucket_dimension, self.bucket_count) == (
+            other.time_granularity,
+            other.bucket_dimension,
+            other.bucket_count,
+        )
+
+    @property
+    def partition_columns(self) -> tuple[str, ...]:
+        columns = _GRANULARITY_COLUMNS[self.time_granularity]
+        if self.bucket_dimension is not None:
+            columns = (*columns, BUCKET_PARTITION_COLUMN)
+        return columns
+
+    def partition_keys(self, df: pd.DataFrame, time_index_name: str) -> dict[str, pd.Series]:
+        """Partition column values (as strings) for every row of `df`."""
+        ts = df[time_index_name].dt
+        time_parts = {"year": ts.year, "month": ts.month, "day": ts.day, "hour": ts.hour}
+        keys = {
+            name: time_parts[name].astype(str)
+            for name in _GRANULARITY_COLUMNS[self.time_granularity]
+        }
+        if self.bucket_dimension is not None:
+            if self.bucket_dimension not in df.columns:
+                raise ValueError(
+                    f"Partition bucket dimension {self.bucket_dimension!r} is not a column "
+                    "of the DataFrame"
+                )
+            keys[BUCKET_PARTITION_COLUMN] = pd.Series(
+                bucket_ids(df[self.bucket_dimension], self.bucket_count), index=df.index
+            ).astype(str)
+        return keys
+
+    def buckets_for(self, values: Iterable[Any]) -> set[int]:
+        """Buckets that may hold any of `values` of the bucket dimension."""
+        return set(bucket_ids(values, self.bucket_count).tolist())
+
+
+def partition_bucket_from_path(path: str) -> int | None:
+    match = re.search(rf"(^|/){BUCKET_PARTITION_COLUMN}=(\d+)(/|$)", path)
+    return int(match.group(2)) if match else None
+
+
+__all__ = [
+    "BUCKET_PARTITION_COLUMN",
+    "DEFAULT_ROW_GROUP_SIZE",
+    "ROW_ORDERS",
+    "TIME_GRANULARITIES",
+    "PartitionSpec",
+    "bucket_ids",
+    "partition_bucket_from_path",
+]
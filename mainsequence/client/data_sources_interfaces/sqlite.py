@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import os
 import sqlite3
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from mainsequence.logconf import logger as base_logger
@@ -16,6 +20,13 @@ from ..dtype_codec import (
     token_to_backend_type,
     token_to_pandas_series,
 )
+from . import (
+    BATCH_OUTPUTS,
+    COORDINATE_JOIN_MIN_ENTRIES,
+    DEFAULT_BATCH_ROWS,
+    coordinate_join_groups,
+    thread_connection,
+)
 from .local_paths import local_data_path
 
 
@@ -26,30 +37,145 @@ def get_logger():
 
 logger = get_logger()
 
+# Rows handed to one `executemany` call by `upsert`.
+UPSERT_BATCH_ROWS = 50_000
+
+# How a table stores its time index: ISO-8601 text or INTEGER nanoseconds since the epoch.
+TIME_STORAGE_ISO = "iso"
+TIME_STORAGE_EPOCH_NS = "epoch_ns"
+TIME_STORAGES = (TIME_STORAGE_ISO, TIME_STORAGE_EPOCH_NS)
+
+# Per-table settings (currently the time storage) live in this table of the same database.
+TABLE_META = "_mainsequence_table_meta"
+
+# Connection PRAGMAs per performance profile, chosen with `SQLITE_PRAGMA_PROFILE`. All keep
+# WAL journaling; "balanced" can lose the last commits on power loss but never corrupts.
+PRAGMA_PROFILES: dict[str, dict[str, Any]] = {
+    "safe": {"synchronous": "FULL"},
+    "balanced": {
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -64_000,
+        "mmap_size": 256 * 1024**2,
+    },
+    "fast": {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "cache_size": -256_000,
+        "mmap_size": 1024**3,
+    },
+}
+DEFAULT_PRAGMA_PROFILE = "balanced"
+
+# Rows upserted into a table since its last ANALYZE that trigger a new one.
+ANALYZE_MIN_ROWS = 100_000
+# Rows ANALYZE samples per index (`PRAGMA analysis_limit`), so refreshing statistics on the
+# write path costs the same on a large table as on a small one.
+ANALYSIS_LIMIT = 400
+
+_DAY_NS = 86_400 * 10**9
+_temp_table_ids = itertools.count()
+
 
 class SQLiteInterface:
     """
     Persist/serve configured-index DataFrames in a local SQLite database file.
     """
 
-    def __init__(self, db_path: str | Path | None = None):
+    def __init__(self, db_path: str | Path | None = None, pragma_profile: str | None = None):
+        db_file = Path(self.resolve_db_path(db_path))
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.db_file = db_file
+        self.db_path = str(db_file)
+        self.pragma_profile = self.resolve_pragma_profile(pragma_profile)
+        self._thread_local = threading.local()
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        self._time_storages: dict[str, str] = {}
+        self._time_storage_warned: set[str] = set()
+        self._indexed_tables: set[str] = set()
+        self._rows_since_analyze: dict[str, int] = {}
+        self._rows_since_analyze_lock = threading.Lock()
+
+    @staticmethod
+    def resolve_db_path(db_path: str | Path | None = None) -> str:
+        """
+        Return the SQLite database file used for *db_path*.
+        """
         default_path = os.getenv(
             "SQLITE_PATH",
             os.fspath(local_data_path() / "sqlite"),
         )
         raw_path = Path(str(db_path or default_path)).expanduser()
         if raw_path.suffix in {".db", ".sqlite", ".sqlite3"}:
-            db_file = raw_path
-        else:
-            db_file = raw_path / "mainsequence.sqlite"
+            return str(raw_path)
+        return str(raw_path / "mainsequence.sqlite")
 
-        db_file.parent.mkdir(parents=True, exist_ok=True)
-        self.db_file = db_file
-        self.db_path = str(db_file)
-        self.con = sqlite3.connect(str(db_file))
-        self.con.row_factory = sqlite3.Row
-        self.con.execute("PRAGMA foreign_keys = ON")
-        self.con.execute("PRAGMA journal_mode = WAL")
+    @staticmethod
+    def resolve_pragma_profile(pragma_profile: str | None = None) -> str:
+        """
+        Return *pragma_profile*, else `SQLITE_PRAGMA_PROFILE`, else the balanced profile.
+        """
+        profile = (
+            (pragma_profile or os.getenv("SQLITE_PRAGMA_PROFILE") or DEFAULT_PRAGMA_PROFILE)
+            .strip()
+            .lower()
+        )
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(
+                f"SQLite pragma profile must be one of {sorted(PRAGMA_PROFILES)}, got {profile!r}"
+            )
+        return profile
+
+    @property
+    def con(self) -> sqlite3.Connection:
+        """
+        Connection owned by the calling thread.
+
+        SQLite connections are not shareable across threads, so each thread gets
+        its own connection to the same database file, closed when the thread exits.
+        """
+        return thread_connection(
+            self._thread_local,
+            self._connect,
+            self._connections,
+            self._connections_lock,
+            self._close_connection,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.db_path, check_same_thread=False)
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA foreign_keys = ON")
+        con.execute("PRAGMA journal_mode = WAL")
+        con.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        for pragma, value in PRAGMA_PROFILES[self.pragma_profile].items():
+            con.execute(f"PRAGMA {pragma} = {value}")
+        return con
+
+    @staticmethod
+    def _close_connection(con: sqlite3.Connection) -> None:
+        try:
+            con.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug(f"PRAGMA optimize before closing SQLite connection failed: {e}")
+        try:
+            con.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Closing SQLite connection failed: {e}")
+
+    def close(self) -> None:
+        """
+        Close every per-thread connection opened by this interface.
+
+        Each connection runs `PRAGMA optimize` first, as SQLite recommends before closing.
+        """
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for con in connections:
+            self._close_connection(con)
+        self._thread_local = threading.local()
 
     @staticmethod
     def _qident(name: str) -> str:
@@ -69,19 +195,50 @@ class SQLiteInterface:
         return ts
 
     @classmethod
-    def _to_time_storage(cls, value: Any) -> str | None:
+    def _to_time_storage(cls, value: Any, time_storage: str = TIME_STORAGE_ISO) -> str | int | None:
         ts = cls._to_utc_timestamp(value)
         if ts is None:
             return None
+        if time_storage == TIME_STORAGE_EPOCH_NS:
+            return int(ts.as_unit("ns").value)
         fraction = (ts.microsecond * 1000) + ts.nanosecond
         return ts.strftime("%Y-%m-%dT%H:%M:%S") + f".{fraction:09d}Z"
 
     @classmethod
-    def _datetime_param(cls, value: Any) -> str | None:
-        return cls._to_time_storage(value)
+    def _datetime_param(cls, value: Any, time_storage: str = TIME_STORAGE_ISO) -> str | int | None:
+        return cls._to_time_storage(value, time_storage)
+
+    @staticmethod
+    def _from_time_storage(value: Any) -> pd.Timestamp | None:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return pd.Timestamp(value, unit="ns", tz="UTC")
+        return pd.to_datetime(value, utc=True)
+
+    @staticmethod
+    def _validate_time_storage(time_storage: str) -> str:
+        if time_storage not in TIME_STORAGES:
+            raise ValueError(f"time_storage must be one of {TIME_STORAGES}, got {time_storage!r}")
+        return time_storage
+
+    @classmethod
+    def default_time_storage(cls) -> str:
+        """
+        Time storage for new tables: `SQLITE_TIME_STORAGE` when set, else ISO text.
+        """
+        configured = (os.getenv("SQLITE_TIME_STORAGE") or TIME_STORAGE_ISO).strip().lower()
+        return cls._validate_time_storage(configured)
 
     @staticmethod
-    def _sqlite_type(series: pd.Series, *, is_time_index: bool = False) -> str:
+    def _sqlite_type(
+        series: pd.Series,
+        *,
+        is_time_index: bool = False,
+        time_storage: str = TIME_STORAGE_ISO,
+    ) -> str:
+        if is_time_index and time_storage == TIME_STORAGE_EPOCH_NS:
+            return "INTEGER"
         token = (
             TIMESTAMP_TZ
             if is_time_index
@@ -110,10 +267,108 @@ class SQLiteInterface:
             return value
         raise ValueError(f"Unsupported SQLite local-data value type: {type(value)!r}")
 
+    @classmethod
+    def _time_storage_values(
+        cls, series: pd.Series, time_storage: str = TIME_STORAGE_ISO
+    ) -> np.ndarray:
+        """
+        Vectorized `_to_time_storage`: one stored value (or None) per value of `series`.
+        """
+        try:
+            parsed = pd.to_datetime(series, utc=True)
+            ns = parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+        except (TypeError, ValueError, OverflowError):
+            return series.map(lambda value: cls._to_time_storage(value, time_storage)).to_numpy(
+                dtype=object
+            )
+        if time_storage == TIME_STORAGE_EPOCH_NS:
+            values = np.empty(len(ns), dtype=object)
+            values[:] = ns.view("int64").tolist()
+        else:
+            values = np.char.add(np.datetime_as_string(ns, unit="ns"), "Z").astype(object)
+        values[np.isnat(ns)] = None
+        return values
+
+    @classmethod
+    def _sqlite_column_values(cls, series: pd.Series) -> np.ndarray:
+        """
+        Vectorized `_sqlite_value` over a whole column, dispatched once on its dtype.
+
+        Object columns that are not uniformly strings or datetimes keep the per-value path,
+        so unsupported values still raise the same errors.
+        """
+        dtype = series.dtype
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return cls._time_storage_values(series)
+        if pd.api.types.is_bool_dtype(dtype):
+            series = series.astype("Int64")
+        elif pd.api.types.is_object_dtype(dtype):
+            inferred = pd.api.types.infer_dtype(series, skipna=True)
+            if inferred in {"datetime", "datetime64", "date"}:
+                return cls._time_storage_values(series)
+            if inferred not in {"string", "empty"}:
+                return series.map(cls._sqlite_value).to_numpy(dtype=object)
+        elif not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            return series.map(cls._sqlite_value).to_numpy(dtype=object)
+        # Casting to object yields Python ints/floats/strs, which sqlite3 binds directly.
+        values = series.to_numpy(dtype=object, copy=True)
+        values[series.isna().to_numpy()] = None
+        return values
+
     def _table_columns(self, table: str) -> dict[str, str]:
         rows = self.con.execute(f"PRAGMA table_info({self._qident(table)})").fetchall()
         return {row["name"]: row["type"] for row in rows}
 
+    def time_storage(self, table: str) -> str:
+        """
+        Time storage recorded for *table*; tables written before it was recorded are ISO.
+        """
+        cached = self._time_storages.get(table)
+        if cached is not None:
+            return cached
+        row = None
+        if self.table_exists(TABLE_META):
+            row = self.con.execute(
+                f"SELECT time_storage FROM {self._qident(TABLE_META)} WHERE table_name = ?",
+                (table,),
+            ).fetchone()
+        time_storage = row["time_storage"] if row is not None else TIME_STORAGE_ISO
+        if row is not None or self.table_exists(table):
+            self._time_storages[table] = time_storage
+        return time_storage
+
+    def _record_time_storage(self, table: str, time_storage: str) -> None:
+        self.con.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._qident(TABLE_META)} "
+            "(table_name TEXT PRIMARY KEY, time_storage TEXT NOT NULL)"
+        )
+        self.con.execute(
+            f"INSERT INTO {self._qident(TABLE_META)} (table_name, time_storage) VALUES (?, ?) "
+            "ON CONFLICT (table_name) DO UPDATE SET time_storage = excluded.time_storage",
+            (table, time_storage),
+        )
+        self._time_storages[table] = time_storage
+
+    def _resolve_time_storage(self, table: str, requested: str | None) -> str:
+        """
+        Time storage for the next write to *table*.
+
+        An existing table keeps the storage it was created with until it is migrated with
+        `migrate_time_storage`; new tables use `requested`, else `default_time_storage()`.
+        """
+        if requested is not None:
+            self._validate_time_storage(requested)
+        if not self.table_exists(table):
+            return requested or self.default_time_storage()
+        stored = self.time_storage(table)
+        if requested not in (None, stored) and table not in self._time_storage_warned:
+            self._time_storage_warned.add(table)
+            logger.warning(
+                f"Table '{table}' stores its time index as '{stored}', not the requested "
+                f"'{requested}'; writes keep '{stored}' until migrate_time_storage is run."
+            )
+        return stored
+
     def _ensure_table(
         self,
         *,
@@ -121,22 +376,27 @@ class SQLiteInterface:
         df: pd.DataFrame,
         index_names: list[str],
         time_index_name: str,
+        time_storage: str = TIME_STORAGE_ISO,
     ) -> None:
         table_columns = self._table_columns(table)
         if not table_columns:
-            columns_sql = []
-            for column in df.columns:
-                col_type = self._sqlite_type(
-                    df[column],
-                    is_time_index=column == time_index_name,
-                )
-                columns_sql.append(f"{self._qident(column)} {col_type}")
-            unique_sql = ", ".join(self._qident(name) for name in index_names)
-            sql = (
-                f"CREATE TABLE IF NOT EXISTS {self._qident(table)} "
-                f"({', '.join(columns_sql)}, UNIQUE ({unique_sql}))"
+            self._create_table(
+                table,
+                {
+                    column: self._sqlite_type(
+                        df[column],
+                        is_time_index=column == time_index_name,
+                        time_storage=time_storage,
+                    )
+                    for column in df.columns
+                },
+                index_names=index_names,
+            )
+            self._record_time_storage(table, time_storage)
+            self._indexed_tables.discard(table)
+            self._ensure_identity_index(
+                table, index_names=index_names, time_index_name=time_index_name
             )
-            self.con.execute(sql)
             return
 
         for column in df.columns:
@@ -158,6 +418,61 @@ class SQLiteInterface:
                 "SQLite table is missing configured index columns. "
                 f"Missing: {missing_index_columns}"
             )
+        self._ensure_identity_index(table, index_names=index_names, time_index_name=time_index_name)
+
+    def _create_table(
+        self, table: str, column_types: dict[str, str], *, index_names: list[str]
+    ) -> None:
+        columns_sql = [
+            f"{self._qident(column)} {col_type}" for column, col_type in column_types.items()
+        ]
+        unique_sql = ", ".join(self._qident(name) for name in index_names)
+        self.con.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._qident(table)} "
+            f"({', '.join(columns_sql)}, UNIQUE ({unique_sql}))"
+        )
+
+    @classmethod
+    def _identity_index_name(cls, table: str) -> str:
+        return f"{table}__identity_time"
+
+    def _ensure_identity_index(
+        self, table: str, *, index_names: list[str], time_index_name: str
+    ) -> None:
+        """
+        Create the `(identity..., time)` index that identity-filtered reads seek on.
+
+        The UNIQUE constraint leads with the time index, so it only serves time-range scans.
+        """
+        if table in self._indexed_tables:
+            return
+        identity_dimensions = [name for name in index_names if name != time_index_name]
+        if identity_dimensions:
+            columns_sql = ", ".join(
+                self._qident(name) for name in [*identity_dimensions, time_index_name]
+            )
+            self.con.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._qident(self._identity_index_name(table))} "
+                f"ON {self._qident(table)} ({columns_sql})"
+            )
+        self._indexed_tables.add(table)
+
+    def _analyze_after_upsert(self, table: str, rows: int) -> None:
+        """
+        Refresh planner statistics for *table* once `ANALYZE_MIN_ROWS` rows were written.
+
+        Connections cap ANALYZE at `ANALYSIS_LIMIT` sampled rows per index.
+        """
+        with self._rows_since_analyze_lock:
+            pending = self._rows_since_analyze.get(table, 0) + rows
+            if pending < ANALYZE_MIN_ROWS:
+                self._rows_since_analyze[table] = pending
+                return
+            self._rows_since_analyze[table] = 0
+        try:
+            self.con.execute(f"ANALYZE {self._qident(table)}")
+        except sqlite3.Error as e:
+            logger.debug(f"ANALYZE of table '{table}' failed: {e}")
 
     @staticmethod
     def _validate_index(index_names: list[str], time_index_name: str) -> None:
@@ -175,13 +490,23 @@ class SQLiteInterface:
 
     def list_tables(self) -> list[str]:
         rows = self.con.execute(
-            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' AND name != ? ORDER BY name",
+            (TABLE_META,),
         ).fetchall()
         return [row["name"] for row in rows]
 
     def drop_table(self, table: str) -> None:
-        self.con.execute(f"DROP TABLE IF EXISTS {self._qident(table)}")
-        self.con.commit()
+        with self.con:
+            self.con.execute(f"DROP TABLE IF EXISTS {self._qident(table)}")
+            if self.table_exists(TABLE_META):
+                self.con.execute(
+                    f"DELETE FROM {self._qident(TABLE_META)} WHERE table_name = ?", (table,)
+                )
+        self._time_storages.pop(table, None)
+        self._indexed_tables.discard(table)
+        with self._rows_since_analyze_lock:
+            self._rows_since_analyze.pop(table, None)
 
     def upsert(
         self,
@@ -190,7 +515,14 @@ class SQLiteInterface:
         *,
         index_names: list[str],
         time_index_name: str,
+        time_storage: str | None = None,
     ) -> None:
+        """
+        Insert or update rows of *df* keyed by `index_names`.
+
+        `time_storage` ("iso" or "epoch_ns") only applies when the table is created; existing
+        tables keep the storage recorded for them.
+        """
         self._validate_index(index_names, time_index_name)
         if df.empty:
             logger.warning(f"Attempted to upsert an empty DataFrame to table '{table}'. Skipping.")
@@ -203,8 +535,10 @@ class SQLiteInterface:
                 f"Missing: {missing_index_columns}"
             )
 
-        df = df.copy()
-        df[time_index_name] = df[time_index_name].map(self._to_time_storage)
+        time_storage = self._resolve_time_storage(table, time_storage)
+        df = df.assign(
+            **{time_index_name: self._time_storage_values(df[time_index_name], time_storage)}
+        )
         df = df.drop_duplicates(subset=index_names, keep="last")
 
         with self.con:
@@ -213,6 +547,7 @@ class SQLiteInterface:
                 df=df,
                 index_names=index_names,
                 time_index_name=time_index_name,
+                time_storage=time_storage,
             )
 
             columns = list(df.columns)
@@ -234,11 +569,86 @@ class SQLiteInterface:
                 f"VALUES ({placeholders}) "
                 f"ON CONFLICT ({conflict_columns}) {conflict_sql}"
             )
-            rows = [
-                tuple(self._sqlite_value(row[column]) for column in columns)
-                for _, row in df.iterrows()
+            column_values = [
+                (
+                    df[column].to_numpy(dtype=object)
+                    if column == time_index_name
+                    else self._sqlite_column_values(df[column])
+                )
+                for column in columns
             ]
-            self.con.executemany(sql, rows)
+            rows = zip(*column_values, strict=True)
+            while batch := list(itertools.islice(rows, UPSERT_BATCH_ROWS)):
+                self.con.executemany(sql, batch)
+        self._analyze_after_upsert(table, len(df))
+
+    def migrate_time_storage(
+        self,
+        table: str,
+        *,
+        index_names: list[str],
+        time_index_name: str,
+        time_storage: str = TIME_STORAGE_EPOCH_NS,
+    ) -> bool:
+        """
+        Rewrite *table* in place so its time index is stored as `time_storage`.
+
+        Rows are copied in batches into a new table, which then replaces the old one in the
+        same transaction. Returns False when the table already uses `time_storage`.
+        """
+        self._validate_index(index_names, time_index_name)
+        self._validate_time_storage(time_storage)
+        if not self.table_exists(table):
+            raise ValueError(f"Table '{table}' does not exist in {self.db_path}.")
+        current = self.time_storage(table)
+        if current == time_storage:
+            return False
+
+        column_types = self._table_columns(table)
+        column_types[time_index_name] = (
+            "INTEGER"
+            if time_storage == TIME_STORAGE_EPOCH_NS
+            else token_to_backend_type(TIMESTAMP_TZ, "sqlite")
+        )
+        columns = list(column_types)
+        staging = f"{table}__time_storage"
+        insert_sql = (
+            f"INSERT INTO {self._qident(staging)} "
+            f"({', '.join(self._qident(column) for column in columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        with self.con:
+            self.con.execute(f"DROP TABLE IF EXISTS {self._qident(staging)}")
+            self._create_table(staging, column_types, index_names=index_names)
+            cursor = self.con.execute(
+                f"SELECT {', '.join(self._qident(column) for column in columns)} "
+                f"FROM {self._qident(table)}"
+            )
+            try:
+                time_position = columns.index(time_index_name)
+                while rows := cursor.fetchmany(UPSERT_BATCH_ROWS):
+                    column_values = list(zip(*rows, strict=True))
+                    times = self._coerce_read_frame(
+                        pd.DataFrame({time_index_name: list(column_values[time_position])}),
+                        time_index_name=time_index_name,
+                        time_storage=current,
+                    )[time_index_name]
+                    column_values[time_position] = self._time_storage_values(times, time_storage)
+                    self.con.executemany(insert_sql, zip(*column_values, strict=True))
+            finally:
+                cursor.close()
+            self.con.execute(f"DROP TABLE {self._qident(table)}")
+            self.con.execute(f"ALTER TABLE {self._qident(staging)} RENAME TO {self._qident(table)}")
+            self._record_time_storage(table, time_storage)
+            self._indexed_tables.discard(table)
+            self._ensure_identity_index(
+                table, index_names=index_names, time_index_name=time_index_name
+            )
+            self.con.execute(f"ANALYZE {self._qident(table)}")
+        logger.info(
+            f"Migrated time storage of table '{table}' from '{current}' to '{time_storage}'."
+        )
+        return True
 
     def constrain_read(
         self,
@@ -259,19 +669,145 @@ class SQLiteInterface:
         list[dict[str, Any]] | None,
         dict[str, Any],
     ]:
+        """
+        Constrain a prospective read so that it returns at most about *max_rows* rows.
+
+        Same contract as `DuckDBInterface.constrain_read`: the row cap comes from *max_rows*,
+        else `MAX_READ_ROWS` / `TDAG_MAX_READ_ROWS`, else 10_000_000, and when the read would
+        exceed it the global `end` and every `dimension_range_map` end date are tightened to
+        the latest time that keeps the earliest rows under the cap.
+
+        `MAX(rowid)` bounds the table's row count for free, so small tables are never counted.
+        Otherwise one index-only `COUNT(*)` per UTC day, under the same filters as `read`,
+        locates the cut-off day, and the cut-off is interpolated linearly inside it.
+        """
         self._validate_index(index_names, time_index_name)
+        max_rows = self._max_read_rows(max_rows)
+        if now is None:
+            now = datetime.datetime.now(datetime.UTC)
+        start_ts = self._to_utc_timestamp(start)
+        end_ts = self._to_utc_timestamp(end)
         normalized_dimension_range_map = (
             None if dimension_range_map is None else [dict(item) for item in dimension_range_map]
         )
 
+        if not self.table_exists(table):
+            diagnostics = {"limited": False, "reason": "table_missing", "max_rows": max_rows}
+            return start_ts, end_ts, normalized_dimension_range_map, diagnostics
+
+        # Rowids are distinct positive integers, so the largest one bounds the row count.
+        max_rowid = self.con.execute(f"SELECT MAX(rowid) FROM {self._qident(table)}").fetchone()[0]
+        if (max_rowid or 0) <= max_rows:
+            diagnostics = {
+                "limited": False,
+                "reason": "table_rows_within_limit",
+                "estimated_rows": max_rowid or 0,
+                "max_rows": max_rows,
+                "mode": "sqlite_rowid_bound",
+            }
+            return start_ts, end_ts, normalized_dimension_range_map, diagnostics
+
+        if end_ts is not None:
+            eff_end = end_ts
+        elif normalized_dimension_range_map and all(
+            item.get("end_date") is not None for item in normalized_dimension_range_map
+        ):
+            eff_end = max(
+                self._to_utc_timestamp(item["end_date"]) for item in normalized_dimension_range_map
+            )
+        else:
+            eff_end = self._to_utc_timestamp(now)
+
+        time_storage = self.time_storage(table)
+        qtime = self._qident(time_index_name)
+        if time_storage == TIME_STORAGE_EPOCH_NS:
+            # Floor division: SQLite's integer division truncates toward zero, which
+            # would merge the last pre-1970 day into the first post-1970 one.
+            day_offset = f"((({qtime} % {_DAY_NS}) + {_DAY_NS}) % {_DAY_NS})"
+            bucket_sql = f"({qtime} - {day_offset}) / {_DAY_NS}"
+        else:
+            bucket_sql = f"substr({qtime}, 1, 10)"
+        where_sql, params, temp_tables = self._read_filters(
+            table,
+            start=start_ts,
+            end=eff_end,
+            great_or_equal=True,
+            less_or_equal=True,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=normalized_dimension_range_map,
+            time_storage=time_storage,
+        )
+        try:
+            buckets = self.con.execute(
+                f"SELECT {bucket_sql} AS bucket, COUNT(*) AS n FROM {self._qident(table)} "
+                f"{where_sql} GROUP BY bucket ORDER BY bucket",
+                params,
+            ).fetchall()
+        finally:
+            self._drop_temp_tables(temp_tables)
+        estimated_rows = sum(row["n"] for row in buckets)
+        if estimated_rows <= max_rows:
+            diagnostics = {
+                "limited": False,
+                "estimated_rows": estimated_rows,
+                "max_rows": max_rows,
+                "limit_dt": None,
+                "buckets_considered": len(buckets),
+                "mode": "sqlite_day_counts",
+            }
+            return start_ts, end_ts or eff_end, normalized_dimension_range_map, diagnostics
+
+        # Find the day where the cap is crossed and interpolate within it.
+        rows_before = 0
+        for row in buckets:
+            if rows_before + row["n"] > max_rows:
+                break
+            rows_before += row["n"]
+        if time_storage == TIME_STORAGE_EPOCH_NS:
+            day_start = pd.Timestamp(row["bucket"] * _DAY_NS, unit="ns", tz="UTC")
+        else:
+            day_start = pd.Timestamp(row["bucket"], tz="UTC")
+        lo = max(day_start, start_ts) if start_ts is not None else day_start
+        hi = min(day_start + pd.Timedelta(days=1), eff_end)
+        limit_dt = lo + (hi - lo) * ((max_rows - rows_before) / row["n"])
+
+        adjusted_end = min(end_ts or eff_end, limit_dt)
+        adjusted_dimension_range_map = None
+        if normalized_dimension_range_map is not None:
+            adjusted_dimension_range_map = []
+            for info in normalized_dimension_range_map:
+                new_info = dict(info)
+                cur_end = info.get("end_date")
+                cur_end_ts = self._to_utc_timestamp(cur_end) if cur_end is not None else eff_end
+                new_info["end_date"] = min(cur_end_ts, limit_dt).to_pydatetime()
+                if "end_date_operand" not in new_info:
+                    new_info["end_date_operand"] = "<="
+                adjusted_dimension_range_map.append(new_info)
+
         diagnostics = {
-            "limited": False,
-            "reason": "sqlite_no_metadata_row_limit",
+            "limited": True,
+            "limit_dt": str(limit_dt),
+            "estimated_rows_at_limit": max_rows,
+            "estimated_rows_full": estimated_rows,
             "max_rows": max_rows,
-            "dimension_filters": dimension_filters is not None,
-            "index_coordinates": index_coordinates is not None,
+            "buckets_considered": len(buckets),
+            "mode": "sqlite_day_counts",
+            "effective_window_after": [str(start_ts), str(adjusted_end)],
         }
-        return start, end, normalized_dimension_range_map, diagnostics
+        return start_ts, adjusted_end, adjusted_dimension_range_map, diagnostics
+
+    @staticmethod
+    def _max_read_rows(max_rows: int | None) -> int:
+        if max_rows is not None:
+            return max_rows
+        env_val = os.getenv("MAX_READ_ROWS") or os.getenv("TDAG_MAX_READ_ROWS")
+        try:
+            return int(str(env_val).replace(",", "_")) if env_val is not None else 10_000_000
+        except ValueError:
+            return 10_000_000
 
     def read(
         self,
@@ -288,11 +824,122 @@ class SQLiteInterface:
         dimension_range_map: list[dict[str, Any]] | None = None,
         columns: list[str] | None = None,
     ) -> pd.DataFrame:
+        planned = self._read_query(
+            table,
+            start=start,
+            end=end,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+        )
+        if planned is None:
+            return pd.DataFrame()
+        query, params, time_storage, temp_tables = planned
+
+        try:
+            df = pd.read_sql_query(query, self.con, params=params)
+        finally:
+            self._drop_temp_tables(temp_tables)
+        return self._coerce_read_frame(
+            df, time_index_name=time_index_name, time_storage=time_storage
+        )
+
+    def iter_batches(
+        self,
+        table: str,
+        *,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        output: str = "pandas",
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the rows `read` would return, in index order, `batch_rows` at a time.
+
+        Rows are pulled with `fetchmany` on a dedicated cursor, so only one batch is held in
+        memory. ``output="arrow"`` yields `pyarrow.RecordBatch` objects built from the
+        typed pandas batch (requires pyarrow).
+        """
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be positive, got {batch_rows}")
+        if output not in BATCH_OUTPUTS:
+            raise ValueError(f"output must be one of {BATCH_OUTPUTS}, got {output!r}")
+        planned = self._read_query(
+            table,
+            start=start,
+            end=end,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+        )
+        if planned is None:
+            return
+        query, params, time_storage, temp_tables = planned
+
+        cursor = self.con.cursor()
+        try:
+            cursor.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            while rows := cursor.fetchmany(batch_rows):
+                df = pd.DataFrame.from_records([tuple(row) for row in rows], columns=names)
+                df = self._coerce_read_frame(
+                    df, time_index_name=time_index_name, time_storage=time_storage
+                )
+                if output == "arrow":
+                    import pyarrow as pa
+
+                    yield pa.RecordBatch.from_pandas(df, preserve_index=False)
+                else:
+                    yield df
+        finally:
+            cursor.close()
+            self._drop_temp_tables(temp_tables)
+
+    def _read_query(
+        self,
+        table: str,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list[str] | None = None,
+    ) -> tuple[str, list[Any], str, list[str]] | None:
+        """
+        SQL, parameters, time storage and the TEMP tables the SQL joins for a filtered read,
+        or None when the table or a requested column is missing.
+
+        Callers drop the TEMP tables with `_drop_temp_tables` once the query has run.
+        """
         self._validate_index(index_names, time_index_name)
 
         if not self.table_exists(table):
             logger.warning(f"Table '{table}' does not exist in {self.db_path}.")
-            return pd.DataFrame()
+            return None
+        time_storage = self.time_storage(table)
 
         existing_columns = self._table_columns(table)
         projected_columns = (
@@ -305,12 +952,56 @@ class SQLiteInterface:
             logger.warning(
                 f"Columns '{missing_columns}' are not present in table '{table}'. returning an empty DF"
             )
-            return pd.DataFrame()
+            return None
 
         select_sql = ", ".join(self._qident(column) for column in projected_columns)
         sql_parts = [f"SELECT {select_sql} FROM {self._qident(table)}"]
+        where_sql, params, temp_tables = self._read_filters(
+            table,
+            start=start,
+            end=end,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            index_names=index_names,
+            time_index_name=time_index_name,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            time_storage=time_storage,
+        )
+        if where_sql:
+            sql_parts.append(where_sql)
+        order_by = ", ".join(self._qident(name) for name in index_names)
+        sql_parts.append(f"ORDER BY {order_by}")
+        query = " ".join(sql_parts)
+
+        return query, params, time_storage, temp_tables
+
+    def _read_filters(
+        self,
+        table: str,
+        *,
+        start: datetime.datetime | None,
+        end: datetime.datetime | None,
+        great_or_equal: bool,
+        less_or_equal: bool,
+        index_names: list[str],
+        time_index_name: str,
+        dimension_filters: dict[str, list[Any]] | None,
+        index_coordinates: list[dict[str, Any]] | None,
+        dimension_range_map: list[dict[str, Any]] | None,
+        time_storage: str,
+    ) -> tuple[str, list[Any], list[str]]:
+        """
+        WHERE clause (or ""), parameters and TEMP tables selecting the rows `read` returns.
+
+        Long `index_coordinates` / `dimension_range_map` lists are loaded into TEMP tables and
+        matched by a `rowid IN (...)` join on the identity index instead of one OR branch per
+        entry, which SQLite plans slowly and rejects past its expression-depth limit.
+        """
         where_clauses: list[str] = []
         params: list[Any] = []
+        temp_tables: list[str] = []
         identity_dimensions = [name for name in index_names if name != time_index_name]
 
         def validate_dimension_name(name: str) -> None:
@@ -322,11 +1013,11 @@ class SQLiteInterface:
         if start is not None:
             start_operator = ">=" if great_or_equal else ">"
             where_clauses.append(f"{self._qident(time_index_name)} {start_operator} ?")
-            params.append(self._datetime_param(start))
+            params.append(self._datetime_param(start, time_storage))
         if end is not None:
             end_operator = "<=" if less_or_equal else "<"
             where_clauses.append(f"{self._qident(time_index_name)} {end_operator} ?")
-            params.append(self._datetime_param(end))
+            params.append(self._datetime_param(end, time_storage))
         if dimension_filters:
             for dimension, values in dimension_filters.items():
                 validate_dimension_name(dimension)
@@ -337,7 +1028,46 @@ class SQLiteInterface:
                 placeholders = ", ".join("?" for _ in value_list)
                 where_clauses.append(f"{self._qident(dimension)} IN ({placeholders})")
                 params.extend(value_list)
-        if index_coordinates:
+
+        def join_coordinates(entries: list[dict[str, Any]]) -> None:
+            qtable = self._qident(table)
+            branches = []
+            for dimensions, start_operand, end_operand, rows in coordinate_join_groups(entries):
+                for dimension in dimensions:
+                    validate_dimension_name(dimension)
+                name = self._qident(f"_mainsequence_coordinates_{next(_temp_table_ids)}")
+                names = [f"_c{position}" for position in range(len(dimensions))]
+                conditions = [
+                    f"t.{self._qident(dimension)} IS c.{column}"
+                    for dimension, column in zip(dimensions, names, strict=True)
+                ]
+                bound_positions = []
+                for bound, operand in (("_start", start_operand), ("_end", end_operand)):
+                    if operand is None:
+                        continue
+                    bound_positions.append(len(names))
+                    conditions.append(f"t.{self._qident(time_index_name)} {operand} c.{bound}")
+                    names.append(bound)
+                for row in rows:
+                    for position in bound_positions:
+                        row[position] = self._datetime_param(row[position], time_storage)
+                with self.con:
+                    self.con.execute(f"CREATE TEMP TABLE {name} ({', '.join(names)})")
+                    self.con.executemany(
+                        f"INSERT INTO temp.{name} VALUES ({', '.join('?' for _ in names)})",
+                        rows,
+                    )
+                temp_tables.append(name)
+                branches.append(
+                    f"rowid IN (SELECT t.rowid FROM temp.{name} AS c JOIN {qtable} AS t "
+                    f"ON {' AND '.join(conditions) or 'TRUE'})"
+                )
+            if branches:
+                where_clauses.append(f"({' OR '.join(branches)})")
+
+        if index_coordinates and len(index_coordinates) >= COORDINATE_JOIN_MIN_ENTRIES:
+            join_coordinates([{"coordinate": coordinate} for coordinate in index_coordinates])
+        elif index_coordinates:
             coordinate_conditions = []
             for coordinate in index_coordinates:
                 parts = []
@@ -349,7 +1079,9 @@ class SQLiteInterface:
                     coordinate_conditions.append(f"({' AND '.join(parts)})")
             if coordinate_conditions:
                 where_clauses.append(f"({' OR '.join(coordinate_conditions)})")
-        if dimension_range_map:
+        if dimension_range_map and len(dimension_range_map) >= COORDINATE_JOIN_MIN_ENTRIES:
+            join_coordinates(dimension_range_map)
+        elif dimension_range_map:
             range_conditions = []
             for date_info in dimension_range_map:
                 coordinate = date_info.get("coordinate") or {}
@@ -362,30 +1094,45 @@ class SQLiteInterface:
                 if date_info.get("start_date") is not None:
                     s_op = date_info.get("start_date_operand", ">=")
                     range_parts.append(f"{self._qident(time_index_name)} {s_op} ?")
-                    range_params.append(self._datetime_param(date_info["start_date"]))
+                    range_params.append(self._datetime_param(date_info["start_date"], time_storage))
                 if date_info.get("end_date") is not None:
                     e_op = date_info.get("end_date_operand", "<=")
                     range_parts.append(f"{self._qident(time_index_name)} {e_op} ?")
-                    range_params.append(self._datetime_param(date_info["end_date"]))
+                    range_params.append(self._datetime_param(date_info["end_date"], time_storage))
                 if range_parts:
                     range_conditions.append(f"({' AND '.join(range_parts)})")
                 params.extend(range_params)
             if range_conditions:
                 where_clauses.append(f"({' OR '.join(range_conditions)})")
 
-        if where_clauses:
-            sql_parts.append("WHERE " + " AND ".join(where_clauses))
-        order_by = ", ".join(self._qident(name) for name in index_names)
-        sql_parts.append(f"ORDER BY {order_by}")
-        query = " ".join(sql_parts)
+        if not where_clauses:
+            return "", params, temp_tables
+        return "WHERE " + " AND ".join(where_clauses), params, temp_tables
+
+    def _drop_temp_tables(self, temp_tables: list[str]) -> None:
+        for name in temp_tables:
+            try:
+                with self.con:
+                    self.con.execute(f"DROP TABLE IF EXISTS temp.{name}")
+            except sqlite3.Error as e:
+                # Still in use by an open cursor; the connection drops it on close.
+                logger.debug(f"Dropping SQLite temp table {name} failed: {e}")
 
-        df = pd.read_sql_query(query, self.con, params=params)
+    @staticmethod
+    def _coerce_read_frame(
+        df: pd.DataFrame, *, time_index_name: str, time_storage: str = TIME_STORAGE_ISO
+    ) -> pd.DataFrame:
         if not df.empty and time_index_name in df.columns:
-            df[time_index_name] = token_to_pandas_series(
-                df[time_index_name],
-                TIMESTAMP_TZ,
-                is_time_index=True,
-            )
+            if time_storage == TIME_STORAGE_EPOCH_NS:
+                df[time_index_name] = pd.to_datetime(
+                    df[time_index_name].astype("Int64"), unit="ns", utc=True
+                )
+            else:
+                df[time_index_name] = token_to_pandas_series(
+                    df[time_index_name],
+                    TIMESTAMP_TZ,
+                    is_time_index=True,
+                )
         return df
 
     def time_index_minima(
@@ -403,9 +1150,7 @@ class SQLiteInterface:
         global_min_raw = self.con.execute(
             f"SELECT MIN({qtime}) AS min_val FROM {self._qident(table)}"
         ).fetchone()["min_val"]
-        global_min = (
-            pd.to_datetime(global_min_raw, utc=True) if global_min_raw is not None else None
-        )
+        global_min = self._from_time_storage(global_min_raw)
 
         identity_dimensions = [name for name in index_names if name != time_index_name]
         if not identity_dimensions:
@@ -425,7 +1170,5 @@ class SQLiteInterface:
             values = [row[name] for name in identity_dimensions]
             key = values[0] if len(values) == 1 else tuple(values)
             min_value = row["min_val"]
-            per_coordinate[key] = (
-                pd.to_datetime(min_value, utc=True) if min_value is not None else None
-            )
+            per_coordinate[key] = self._from_time_storage(min_value)
         return global_min, per_coordinate
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import json
 import math
 import re
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
@@ -50,7 +53,11 @@ def normalize_dtype_token(
     remote: bool = True,
     allow_naive_datetime: bool = False,
 ) -> str:
-    token = str(value or "").strip()
+    return _normalize_dtype_token(str(value or "").strip(), remote, allow_naive_datetime)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_dtype_token(token: str, remote: bool, allow_naive_datetime: bool) -> str:
     if not token:
         raise ValueError("DType token is required.")
 
@@ -264,6 +271,10 @@ def token_to_pandas_series(
             allow_naive_datetime=True,
         )
     )
+    return _decode_series(series, normalized, nullable=nullable)
+
+
+def _decode_series(series: pd.Series, normalized: str, *, nullable: bool = True) -> pd.Series:
     if normalized == TIMESTAMP_TZ:
         return pd.to_datetime(series, errors="coerce", utc=True)
     if normalized == LOCAL_DATETIME_NAIVE:
@@ -345,7 +356,10 @@ def _serialize_timestamp_tz_value(value: Any) -> str | None:
 
 
 def serialize_remote_value(value: Any, token: Any) -> Any:
-    normalized = normalize_dtype_token(token, remote=True)
+    return _serialize_remote_normalized(value, normalize_dtype_token(token, remote=True))
+
+
+def _serialize_remote_normalized(value: Any, normalized: str) -> Any:
     if normalized == DATE:
         return _serialize_date_value(value)
     if normalized == TIMESTAMP_TZ:
@@ -377,18 +391,280 @@ def prepare_dataframe_for_remote_write(
     column_dtypes_map: Mapping[str, Any],
     time_index_name: str,
 ) -> pd.DataFrame:
-    normalized_map = normalize_column_dtypes_map(column_dtypes_map, remote=True)
-    prepared = df.copy()
-    if time_index_name not in normalized_map:
-        normalized_map[time_index_name] = TIMESTAMP_TZ
-    for column_name, token in normalized_map.items():
-        if column_name not in prepared.columns:
-            continue
-        normalized = normalize_dtype_token(token, remote=True)
-        prepared[column_name] = [
-            serialize_remote_value(value, normalized) for value in prepared[column_name].tolist()
-        ]
-    return prepared
+    plan = compile_codec_plan(column_dtypes_map, time_index_name=time_index_name, remote=True)
+    return plan.encode_frame(df)
+
+
+@dataclass(frozen=True)
+class ColumnCodec:
+    """
+    One column of a compiled contract: its normalized token plus decode / encode kernels.
+    """
+
+    name: str
+    token: str
+    is_time_index: bool = False
+
+    @property
+    def pandas_dtype(self) -> Any:
+        return token_to_pandas_dtype(self.token)
+
+    def is_decoded(self, series: pd.Series) -> bool:
+        """Whether `series` already has the dtype `decode` would give it."""
+        if self.token == TIMESTAMP_TZ:
+            return isinstance(series.dtype, pd.DatetimeTZDtype) and str(series.dtype.tz) == "UTC"
+        expected = self.pandas_dtype
+        if expected in {"object", "datetime64[ns]"}:
+            # Dates, JSON and naive datetimes always go through the codec.
+            return False
+        # Compare dtype objects: `dtype == "string"` also matches pandas' NaN-backed str dtype.
+        return series.dtype == pd.api.types.pandas_dtype(expected)
+
+    def decode(self, series: pd.Series, *, nullable: bool = True) -> pd.Series:
+        """Raw read values to the pandas dtype of the token, as `token_to_pandas_series`."""
+        return _decode_series(series, self.token, nullable=nullable)
+
+    def encode(self, series: pd.Series) -> pd.Series | list[Any]:
+        """Values to their remote wire form, as `serialize_remote_value` gives them per value."""
+        return _encode_series(series, self.token)
+
+
+@dataclass(frozen=True)
+class CodecPlan:
+    """
+    A column-dtypes map compiled once into per-column codecs.
+
+    Build plans with `compile_codec_plan`, which caches them by contract, so read and write
+    paths apply a contract without re-parsing its dtype strings.
+    """
+
+    columns: tuple[ColumnCodec, ...]
+    time_index_name: str | None = None
+    _by_name: dict[str, ColumnCodec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_name", {codec.name: codec for codec in self.columns})
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __getitem__(self, name: str) -> ColumnCodec:
+        return self._by_name[name]
+
+    @property
+    def column_dtypes_map(self) -> dict[str, str]:
+        return {codec.name: codec.token for codec in self.columns}
+
+    def decode_frame(
+        self, df: pd.DataFrame, *, columns: Iterable[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Decode, in place, the time index and the plan columns of `df` (restricted to
+        `columns` when given), skipping columns that already hold their decoded dtype.
+        """
+        selected = None if columns is None else set(columns)
+        for codec in self.columns:
+            if codec.name not in df.columns:
+                continue
+            if selected is not None and not codec.is_time_index and codec.name not in selected:
+                continue
+            if not codec.is_decoded(df[codec.name]):
+                df[codec.name] = codec.decode(df[codec.name])
+        return df
+
+    def encode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """A copy of `df` with every plan column in its remote wire form."""
+        # Encoded columns are replaced wholesale, so the copy can share the input's buffers.
+        prepared = df.copy(deep=False)
+        for codec in self.columns:
+            if codec.name in prepared.columns:
+                prepared[codec.name] = codec.encode(prepared[codec.name])
+        return prepared
+
+    def encode_arrow(self, df: pd.DataFrame) -> Any:
+        """
+        `df` as a `pyarrow.Table` for the binary remote wire formats (requires pyarrow).
+
+        Plan columns take the Arrow type of their token and the values `encode` would send:
+        UTC timestamps, calendar dates, UUIDs as strings and JSON columns as JSON text.
+        Other columns keep the type Arrow infers for them.
+        """
+        import pyarrow as pa
+
+        arrays = []
+        for name in df.columns:
+            codec = self._by_name.get(name)
+            if codec is None:
+                series = df[name]
+                values = _encode_series(series, "") if series.dtype == object else series
+                arrays.append(pa.array(values, from_pandas=True))
+            else:
+                arrays.append(_encode_arrow_array(df[name], codec.token))
+        return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def _encode_series(series: pd.Series, normalized: str) -> pd.Series | list[Any]:
+    """
+    Column-at-a-time `_serialize_remote_normalized`.
+
+    Returns the column itself when serializing would round-trip it unchanged, otherwise a
+    list that the caller assigns back (so pandas infers the same dtype it did for the former
+    per-value lists). Object-typed dates and timestamps keep the per-value path, which
+    validates and parses mixed inputs.
+    """
+    dtype = series.dtype
+    if normalized == TIMESTAMP_TZ:
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            return _iso_utc_strings(series)
+    elif normalized == DATE:
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return _iso_date_strings(series)
+    elif isinstance(dtype, np.dtype) and (
+        dtype.kind == "b" or (dtype.kind in "if" and dtype.itemsize == 8)
+    ):
+        # NaN becomes None, which pandas reads back as NaN in the same dtype.
+        return series
+    else:
+        values = series.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = None
+        if pd.api.types.is_object_dtype(dtype):
+            is_uuid = np.fromiter(
+                (isinstance(value, UUID) for value in values), dtype=bool, count=len(values)
+            )
+            if is_uuid.any():
+                values[is_uuid] = [str(value) for value in values[is_uuid]]
+        return values.tolist()
+    return [_serialize_remote_normalized(value, normalized) for value in series.tolist()]
+
+
+def token_to_arrow_type(token: Any) -> Any:
+    """The Arrow type a contract token is sent as, or None when Arrow should infer it."""
+    import pyarrow as pa
+
+    normalized = normalize_dtype_token(token, remote=False, allow_naive_datetime=True)
+    if normalized == TIMESTAMP_TZ:
+        return pa.timestamp("ns", tz="UTC")
+    if normalized == LOCAL_DATETIME_NAIVE:
+        return pa.timestamp("ns")
+    if normalized == DATE:
+        return pa.date32()
+    if normalized in {STRING, UUID_TOKEN, JSON, JSONB}:
+        return pa.string()
+    return {
+        BOOL: pa.bool_(),
+        INT16: pa.int16(),
+        INT32: pa.int32(),
+        INT64: pa.int64(),
+        FLOAT32: pa.float32(),
+        FLOAT64: pa.float64(),
+        NUMERIC: pa.float64(),
+    }.get(normalized)
+
+
+def _encode_arrow_array(series: pd.Series, normalized: str) -> Any:
+    """Column-at-a-time Arrow counterpart of `_encode_series`."""
+    import pyarrow as pa
+
+    arrow_type = token_to_arrow_type(normalized)
+    if normalized == TIMESTAMP_TZ:
+        if not isinstance(series.dtype, pd.DatetimeTZDtype):
+            # Per-value serialization validates offsets exactly as the JSON path does.
+            series = pd.to_datetime(
+                pd.Series(_encode_series(series, normalized), dtype=object),
+                utc=True,
+                format="ISO8601",
+            )
+        return pa.array(series.dt.tz_convert("UTC"), type=arrow_type, from_pandas=True)
+    if normalized == DATE:
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                series = series.dt.tz_localize(None)
+            days = series.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+            return pa.array(days, type=arrow_type, from_pandas=True)
+        return pa.array(_encode_series(series, normalized), type=pa.string()).cast(arrow_type)
+    if normalized in {JSON, JSONB}:
+        values = _encode_series(series, normalized)
+        return pa.array(
+            [None if value is None else json.dumps(value, default=str) for value in values],
+            type=arrow_type,
+        )
+    if normalized in {STRING, UUID_TOKEN}:
+        if isinstance(series.dtype, pd.StringDtype):
+            return pa.array(series, type=arrow_type, from_pandas=True)
+        values = _encode_series(series, normalized)
+        return pa.array(
+            [value if value is None or isinstance(value, str) else str(value) for value in values],
+            type=arrow_type,
+        )
+    if normalized == NUMERIC and series.dtype == object:
+        series = pd.to_numeric(series)
+    return pa.array(series, type=arrow_type, from_pandas=True)
+
+
+def _iso_utc_strings(series: pd.Series) -> list[Any]:
+    """ISO-8601 UTC strings ending in Z, with the fraction `pd.Timestamp.isoformat` prints."""
+    values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    fraction = values.view("i8") % 1_000_000_000
+    strings = np.char.add(np.datetime_as_string(values, unit="s"), "Z").astype(object)
+    for unit, mask in (
+        ("us", (fraction != 0) & (fraction % 1_000 == 0)),
+        ("ns", fraction % 1_000 != 0),
+    ):
+        if mask.any():
+            strings[mask] = np.char.add(np.datetime_as_string(values[mask], unit=unit), "Z")
+    strings[np.isnat(values)] = None
+    return strings.tolist()
+
+
+def _iso_date_strings(series: pd.Series) -> list[Any]:
+    """ISO dates of datetime values, taken in each value's own time zone."""
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+    values = series.to_numpy(dtype="datetime64[ns]")
+    strings = np.datetime_as_string(values.astype("datetime64[D]"), unit="D").astype(object)
+    strings[np.isnat(values)] = None
+    return strings.tolist()
+
+
+def compile_codec_plan(
+    column_dtypes_map: Mapping[str, Any],
+    *,
+    time_index_name: str | None = None,
+    remote: bool = False,
+    allow_naive_datetime: bool | None = None,
+) -> CodecPlan:
+    """
+    Compile (or fetch from cache) the `CodecPlan` of a column-dtypes map.
+
+    The time index column is always a UTC timestamp and is added to the plan when the map
+    omits it. `allow_naive_datetime` defaults to the opposite of `remote`, matching how
+    read (local) and write (remote) paths normalize contracts.
+    """
+    if allow_naive_datetime is None:
+        allow_naive_datetime = not remote
+    contract = tuple((str(name), str(dtype or "")) for name, dtype in column_dtypes_map.items())
+    return _compile_codec_plan(contract, time_index_name, remote, allow_naive_datetime)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_codec_plan(
+    contract: tuple[tuple[str, str], ...],
+    time_index_name: str | None,
+    remote: bool,
+    allow_naive_datetime: bool,
+) -> CodecPlan:
+    codecs = []
+    for name, dtype in contract:
+        token = normalize_dtype_token(
+            dtype, remote=remote, allow_naive_datetime=allow_naive_datetime
+        )
+        if name == time_index_name:
+            codecs.append(ColumnCodec(name=name, token=TIMESTAMP_TZ, is_time_index=True))
+        else:
+            codecs.append(ColumnCodec(name=name, token=token))
+    if time_index_name is not None and all(name != time_index_name for name, _ in contract):
+        codecs.append(ColumnCodec(name=time_index_name, token=TIMESTAMP_TZ, is_time_index=True))
+    return CodecPlan(columns=tuple(codecs), time_index_name=time_index_name)
 
 
 def token_to_backend_type(token: Any, backend: str) -> str:
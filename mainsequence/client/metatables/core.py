@@ -12,9 +12,10 @@ import pathlib
 import re
 import subprocess
 import time
+import zlib
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
-from threading import RLock
+from threading import Event, RLock, get_ident
 from typing import Any, ClassVar, Literal, TypedDict
 from uuid import UUID
 
@@ -34,17 +35,25 @@ from mainsequence.logconf import logger
 from mainsequence.runtime_context import _get_backend_runtime_project_context_state
 
 from ..base import BaseObjectOrm, BasePydanticModel, LabelableObjectMixin, ShareableObjectMixin
-from ..data_sources_interfaces import get_duckdb_interface_class, get_sqlite_interface_class
+from ..data_sources_interfaces import (
+    BATCH_OUTPUTS,
+    DEFAULT_BATCH_ROWS,
+    READ_OUTPUTS,
+    arrow_to_read_output,
+    get_duckdb_interface,
+    get_sqlite_interface,
+)
+from ..data_sources_interfaces.partitioning import PartitionSpec
 from ..dtype_codec import (
     DATE,
     TIMESTAMP_TZ,
+    compile_codec_plan,
     normalize_column_dtypes_map,
     normalize_dtype_token,
     pandas_dtypes_to_column_map,
     prepare_dataframe_for_remote_write,
     record_definitions_to_column_dtypes_map,
     serialize_remote_parameters,
-    token_to_pandas_series,
 )
 from ..exceptions import AuthenticationError, PermissionDeniedError, raise_for_response
 from ..utils import (
@@ -82,12 +91,36 @@ def _normalize_time_indexed_cadence(value: Any) -> str | None:
     return normalized
 
 
+def _storage_partition_spec(storage: Any) -> PartitionSpec | None:
+    """
+    DuckDB layout explicitly declared by a TimeIndexMetaTable's `partition_strategy`, or
+    None when it declares none in the `PartitionSpec` grammar.
+
+    Only a profile already loaded on *storage* is consulted so the write path never
+    triggers a metadata lookup; without an explicit spec the DuckDB interface keeps the
+    layout of existing tables and picks the cadence default for new ones.
+    """
+    if isinstance(storage, Mapping):
+        profile = storage.get("time_indexed_profile")
+    else:
+        profile = getattr(storage, "__dict__", {}).get("time_indexed_profile")
+    if isinstance(profile, Mapping):
+        strategy = profile.get("partition_strategy")
+    else:
+        strategy = getattr(profile, "partition_strategy", None)
+    try:
+        return PartitionSpec.parse(strategy)
+    except ValueError as exc:
+        logger.warning(f"Ignoring partition_strategy {strategy!r}: {exc}")
+        return None
+
+
 def _duckdb_interface():
-    return get_duckdb_interface_class()()
+    return get_duckdb_interface()
 
 
 def _sqlite_interface():
-    return get_sqlite_interface_class()()
+    return get_sqlite_interface()
 
 
 def _local_data_interface(class_type: str):
@@ -138,6 +171,21 @@ def _storage_time_indexed_contract(storage: Any) -> tuple[str, list[str], dict[s
     )
 
 
+def _type_time_indexed_frame(
+    df: pd.DataFrame,
+    storage: Any,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Apply a TimeIndexMetaTable's column contract to raw rows and index them by its
+    index_names.
+    """
+    time_index_name, index_names, column_dtypes_map = _storage_time_indexed_contract(storage)
+    plan = compile_codec_plan(column_dtypes_map, time_index_name=time_index_name)
+    plan.decode_frame(df, columns=set(columns or column_dtypes_map.keys()) | set(index_names))
+    return df.set_index(index_names)
+
+
 MetaTableManagementMode = Literal["external_registered", "platform_managed"]
 MetaTableSchemaManagementMode = Literal[
     "backend_managed",
@@ -1123,14 +1171,21 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
         index_names: list,
         grouped_dates: dict,
         column_dtypes_map: Mapping[str, Any] | None = None,
+        ingest_stats: IngestStats | None = None,
     ):
         if self.class_type in LOCAL_DATA_SOURCE_CLASS_TYPES:
             storage = data_node_update.data_node_storage
+            layout_kwargs = {}
+            if self.class_type == DUCK_DB:
+                partition_spec = _storage_partition_spec(storage)
+                if partition_spec is not None:
+                    layout_kwargs["partition_spec"] = partition_spec
             _local_data_interface(self.class_type).upsert(
                 df=serialized_data_frame,
                 table=_storage_physical_table_name(storage),
                 index_names=index_names,
                 time_index_name=time_index_name,
+                **layout_kwargs,
             )
         else:
             DataNodeUpdate.post_data_frame_in_chunks(
@@ -1141,6 +1196,7 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
                 time_index_name=time_index_name,
                 overwrite=overwrite,
                 column_dtypes_map=column_dtypes_map,
+                ingest_stats=ingest_stats,
             )
 
     def insert_data_into_local_table(
@@ -1165,7 +1221,17 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
         dimension_filters: dict[str, list[Any]] | None = None,
         index_coordinates: list[dict[str, Any]] | None = None,
         dimension_range_map: list[dict[str, Any]] | None = None,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+    ) -> Any:
+        """
+        Read rows of a time-indexed table as `output` ("pandas", "arrow" or "polars").
+
+        Pandas frames are typed by the table contract and indexed by its index_names.
+        Arrow and Polars results keep the index columns as plain columns; DuckDB tables
+        serve them straight from the Arrow read path without a pandas round trip.
+        """
+        if output not in READ_OUTPUTS:
+            raise ValueError(f"output must be one of {READ_OUTPUTS}, got {output!r}")
         if self.class_type in LOCAL_DATA_SOURCE_CLASS_TYPES:
             db_interface = _local_data_interface(self.class_type)
             storage = data_node_update.data_node_storage
@@ -1185,7 +1251,7 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
                 )
             )
 
-            df = db_interface.read(
+            read_kwargs = dict(
                 table=table_name,
                 start=adjusted_start,
                 end=adjusted_end,
@@ -1198,6 +1264,9 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
                 dimension_range_map=adjusted_dimension_range_map,
                 columns=columns,
             )
+            if output != "pandas" and self.class_type == DUCK_DB:
+                return arrow_to_read_output(db_interface.read_arrow(**read_kwargs), output)
+            df = db_interface.read(**read_kwargs)
 
         else:
             df = data_node_update.get_data_between_dates_from_api(
@@ -1212,31 +1281,86 @@ class DataSource(BasePydanticModel, BaseObjectOrm):
             )
         if len(df) == 0:
             logger.warning(f"No data returned from remote API for {data_node_update.update_hash}")
+        else:
+            df = _type_time_indexed_frame(df, data_node_update.data_node_storage, columns)
+        if output == "pandas":
             return df
 
-        time_index_name, index_names, column_dtypes_map = _storage_time_indexed_contract(
-            data_node_update.data_node_storage
+        import pyarrow as pa
+
+        if len(df) == 0:
+            return arrow_to_read_output(pa.table({}), output)
+        return arrow_to_read_output(
+            pa.Table.from_pandas(df.reset_index(), preserve_index=False), output
         )
-        try:
-            df[time_index_name] = token_to_pandas_series(
-                df[time_index_name],
-                TIMESTAMP_TZ,
-                is_time_index=True,
+
+    def iter_data_by_time_index(
+        self,
+        data_node_update: Any,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        columns: list[str] | None = None,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        output: str = "pandas",
+    ):
+        """
+        Stream `get_data_by_time_index` in batches of at most `batch_rows` rows.
+
+        Unlike `get_data_by_time_index`, local reads are not capped by `constrain_read`:
+        the whole requested range is delivered, one batch in memory at a time. Pandas
+        batches are typed and indexed like `get_data_by_time_index`; ``output="arrow"``
+        yields `pyarrow.RecordBatch` objects with the index columns as plain columns.
+        """
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be positive, got {batch_rows}")
+        if output not in BATCH_OUTPUTS:
+            raise ValueError(f"output must be one of {BATCH_OUTPUTS}, got {output!r}")
+        storage = data_node_update.data_node_storage
+        filters = dict(
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            columns=columns,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+        )
+
+        if self.class_type in LOCAL_DATA_SOURCE_CLASS_TYPES:
+            time_index_name, index_names, _ = _storage_time_indexed_contract(storage)
+            batches = _local_data_interface(self.class_type).iter_batches(
+                table=_storage_physical_table_name(storage),
+                start=start_date,
+                end=end_date,
+                index_names=index_names,
+                time_index_name=time_index_name,
+                batch_rows=batch_rows,
+                output=output,
+                **filters,
             )
-        except Exception as e:
-            raise e
-        columns_to_loop = set(columns or column_dtypes_map.keys()) | set(index_names)
-        for c, c_type in column_dtypes_map.items():
-            if c not in columns_to_loop:
-                continue
-            if c in df.columns:
-                df[c] = token_to_pandas_series(
-                    df[c],
-                    c_type,
-                    is_time_index=c == time_index_name,
-                )
-        df = df.set_index(index_names)
-        return df
+            if output == "arrow":
+                yield from batches
+                return
+        else:
+            batches = data_node_update.iter_data_between_dates_from_api(
+                start_date=start_date,
+                end_date=end_date,
+                batch_rows=batch_rows,
+                **filters,
+            )
+
+        for df in batches:
+            df = _type_time_indexed_frame(df, storage, columns)
+            if output == "arrow":
+                import pyarrow as pa
+
+                yield pa.RecordBatch.from_pandas(df.reset_index(), preserve_index=False)
+            else:
+                yield df
 
     def get_earliest_value(
         self,
@@ -1975,6 +2099,236 @@ class MetaTable(BasePydanticModel, LabelableObjectMixin, ShareableObjectMixin, B
 # Global executor (or you could define one on your class)
 _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
 
+# Chunk body formats of `DataNodeUpdate.post_data_frame_in_chunks`: gzip+base64 JSON records,
+# or a zstd-compressed Arrow IPC stream / Parquet file posted as a multipart file.
+UPLOAD_WIRE_FORMATS = ("json", "arrow", "parquet")
+_UPLOAD_CONTENT_TYPES = {
+    "arrow": ("chunk.arrows", "application/vnd.apache.arrow.stream"),
+    "parquet": ("chunk.parquet", "application/vnd.apache.parquet"),
+}
+# Endpoints that answered a binary chunk with 415; later uploads to them go as JSON.
+_JSON_ONLY_UPLOAD_ENDPOINTS: set[str] = set()
+
+
+def _encode_binary_upload_chunk(
+    df_chunk: pd.DataFrame,
+    *,
+    wire_format: str,
+    column_dtypes_map: Mapping[str, Any] | None,
+    time_index_name: str,
+) -> bytes:
+    """One upload chunk as a zstd Arrow IPC stream or Parquet file typed by the codec plan."""
+    import pyarrow as pa
+
+    plan = compile_codec_plan(column_dtypes_map or {}, time_index_name=time_index_name, remote=True)
+    table = plan.encode_arrow(df_chunk)
+    sink = pa.BufferOutputStream()
+    if wire_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        options = pa.ipc.IpcWriteOptions(compression="zstd")
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Uncompressed JSON targeted per record slice when streaming a chunk into gzip.
+_STREAM_SLICE_BYTES = 2**18
+
+
+def _gzip_json_records(
+    df_chunk: pd.DataFrame,
+    *,
+    column_dtypes_map: Mapping[str, Any] | None,
+    time_index_name: str,
+) -> memoryview:
+    """
+    `df_chunk` as gzip-compressed JSON records, encoded and compressed a row slice at a time.
+
+    Only one slice, about `_STREAM_SLICE_BYTES` of JSON sized from the slices before it, is
+    prepared for the remote write and serialized at once next to the compressed output.
+    """
+    # Compressed output accumulates in place and is returned as a view, never copied.
+    compressed = bytearray()
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    compressed += compressor.compress(b"[")
+    start, rows = 0, min(len(df_chunk), 1_024)
+    while start < len(df_chunk):
+        records = df_chunk.iloc[start : start + rows]
+        if column_dtypes_map is not None:
+            records = prepare_dataframe_for_remote_write(
+                records, column_dtypes_map=column_dtypes_map, time_index_name=time_index_name
+            )
+        text = records.to_json(orient="records", date_format="iso")[1:-1]
+        if start:
+            compressed += compressor.compress(b",")
+        compressed += compressor.compress(text.encode("utf-8"))
+        start += len(records)
+        rows = max(1, int(rows * _STREAM_SLICE_BYTES / max(len(text), 1)))
+    compressed += compressor.compress(b"]")
+    compressed += compressor.flush()
+    return memoryview(compressed)
+
+
+class _JSONUploadBody:
+    """
+    The JSON body `{"data": <base64 of compressed>, **fields}`, produced while it is sent.
+
+    Base64 text is encoded a piece at a time as requests iterates the body, so the compressed
+    bytes are the only large buffer held. `len()` gives requests the Content-Length, and
+    each iteration starts over, so retried requests resend the whole body.
+    """
+
+    _PIECE_BYTES = 3 * 2**16
+
+    def __init__(self, compressed: memoryview, fields: Mapping[str, Any]):
+        self._compressed = compressed
+        self._prefix = b'{"data": "'
+        self._suffix = b'", ' + json.dumps(fields, allow_nan=False)[1:].encode("utf-8")
+
+    def __len__(self) -> int:
+        encoded_bytes = 4 * math.ceil(len(self._compressed) / 3)
+        return len(self._prefix) + encoded_bytes + len(self._suffix)
+
+    def __iter__(self):
+        yield self._prefix
+        for start in range(0, len(self._compressed), self._PIECE_BYTES):
+            yield base64.b64encode(self._compressed[start : start + self._PIECE_BYTES])
+        yield self._suffix
+
+
+DEFAULT_UPLOAD_CHUNK_BYTES = 8 * 2**20
+# Rows encoded to estimate bytes per row when a table has no persisted sizing yet.
+UPLOAD_SIZING_SAMPLE_ROWS = 2_000
+
+
+_UPLOAD_SIZING_SAVE_LOCK = RLock()
+
+
+def _upload_sizing_path() -> pathlib.Path:
+    tdag_base_path = pathlib.Path(os.getenv("TDAG_ROOT_PATH", pathlib.Path.home() / ".tdag"))
+    return tdag_base_path / "upload_sizing.json"
+
+
+@dataclass
+class _UploadChunkSizer:
+    """
+    Byte-budget sizing of the chunks of one upload.
+
+    Bytes per row start from the value persisted for the table (or a sample encoding) and
+    are refined by every encoded chunk. After a 413 the budget drops to the largest body the
+    backend accepted below the rejected size (half the rejected size until one is accepted).
+    A body at least as large as the rejected one that later succeeds lifts the limit. All of
+    it persists for the next upload.
+    """
+
+    key: str
+    byte_budget: int
+    bytes_per_row: float | None = None
+    request_limit: int | None = None
+    largest_accepted: int | None = None
+    requests: int = 0
+    bytes_sent: int = 0
+    retries: int = 0
+    splits: int = 0
+    _lock: RLock = field(default_factory=RLock, repr=False)
+
+    # Encoded chunks may overshoot the budget by this factor before they are split unsent.
+    OVERSHOOT: ClassVar[float] = 1.25
+
+    @staticmethod
+    def _read_stored() -> dict[str, Any]:
+        try:
+            return json.loads(_upload_sizing_path().read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def load(cls, key: str, byte_budget: int) -> _UploadChunkSizer:
+        stored = cls._read_stored().get(key) or {}
+        return cls(
+            key=key,
+            byte_budget=byte_budget,
+            bytes_per_row=stored.get("bytes_per_row"),
+            request_limit=stored.get("request_limit"),
+            largest_accepted=stored.get("largest_accepted"),
+        )
+
+    @property
+    def budget(self) -> int:
+        if self.request_limit is None:
+            return self.byte_budget
+        return min(self.byte_budget, self.largest_accepted or self.request_limit // 2)
+
+    def rows_per_chunk(self, default: int) -> int:
+        if not self.bytes_per_row:
+            return default
+        return max(1, int(self.budget / self.bytes_per_row))
+
+    def observe(self, rows: int, body_bytes: int) -> None:
+        with self._lock:
+            per_row = body_bytes / rows
+            if self.bytes_per_row is None:
+                self.bytes_per_row = per_row
+            else:
+                self.bytes_per_row = (self.bytes_per_row + per_row) / 2
+
+    def too_large(self, rows: int, body_bytes: int) -> bool:
+        if rows <= 1:
+            return False
+        if self.request_limit is not None and body_bytes >= self.request_limit:
+            return True
+        return body_bytes > self.budget * self.OVERSHOOT
+
+    def record_sent(self, body_bytes: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += body_bytes
+            if self.request_limit is not None and body_bytes >= self.request_limit:
+                self.request_limit = None
+            if self.largest_accepted is None or body_bytes > self.largest_accepted:
+                self.largest_accepted = body_bytes
+
+    def record_rejected(self, body_bytes: int) -> None:
+        with self._lock:
+            self.retries += 1
+            if self.request_limit is None or body_bytes < self.request_limit:
+                self.request_limit = body_bytes
+                if self.largest_accepted is not None and self.largest_accepted >= body_bytes:
+                    self.largest_accepted = None
+
+    def record_split(self) -> None:
+        with self._lock:
+            self.splits += 1
+
+    def save(self) -> None:
+        """
+        Merges this table's sizing into the shared sizing file.
+
+        Saves within a process are serialized. Processes saving at the same moment can still
+        drop one another's update, since the file is read and replaced without a file lock.
+        That is accepted: sizing is only a starting estimate, and a lost entry is learned
+        again on that table's next upload.
+        """
+        path = _upload_sizing_path()
+        with _UPLOAD_SIZING_SAVE_LOCK, self._lock:
+            stored = self._read_stored()
+            stored[self.key] = {
+                "bytes_per_row": self.bytes_per_row,
+                "request_limit": self.request_limit,
+                "largest_accepted": self.largest_accepted,
+            }
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+                tmp_path.write_text(json.dumps(stored))
+                os.replace(tmp_path, path)
+            except OSError as exc:
+                logger.debug(f"Could not persist upload sizing to {path}: {exc}")
+
+
 _POD_PROJECT_RESOLUTION_LOCK = RLock()
 _POD_PROJECT_RESOLUTION_CACHE = None
 _POD_PROJECT_RESOLUTION_CACHE_KEY: tuple[str, str, str] | None = None
@@ -2198,11 +2552,11 @@ def _column_contracts_from_dtype_map(
     remote: bool,
     allow_naive_datetime: bool,
 ) -> list[dict[str, Any]]:
-    normalized_dtypes = normalize_column_dtypes_map(
+    normalized_dtypes = compile_codec_plan(
         column_dtypes_map,
         remote=remote,
         allow_naive_datetime=allow_naive_datetime,
-    )
+    ).column_dtypes_map
     index_name_set = {str(name) for name in (index_names or [])}
     return [
         {
@@ -2681,34 +3035,133 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
     def get_data_between_dates_from_api(self, *args, **kwargs):
         return self.data_node_storage.get_data_between_dates_from_api(*args, **kwargs)
 
+    def iter_data_between_dates_from_api(self, *args, **kwargs):
+        return self.data_node_storage.iter_data_between_dates_from_api(*args, **kwargs)
+
     @classmethod
     def post_data_frame_in_chunks(
         cls,
         serialized_data_frame: pd.DataFrame,
-        chunk_size: int = 50_000,
+        chunk_size: int | None = None,
         data_node_update: DataNodeUpdate = None,
         data_source: str = None,
         index_names: list = None,
         time_index_name: str = "timestamp",
         overwrite: bool = False,
         column_dtypes_map: Mapping[str, Any] | None = None,
+        ingest_stats: IngestStats | None = None,
+        max_in_flight: int | None = None,
+        wire_format: str | None = None,
+        chunk_bytes: int | None = None,
     ):
         """
         Sends a large DataFrame to a Django backend in multiple chunks.
         If a chunk is too large (HTTP 413), it's automatically split in half and retried.
+
+        Without `chunk_size`, chunks are sized to a `chunk_bytes` budget per request body
+        (default `MAINSEQUENCE_UPLOAD_CHUNK_BYTES`, else 8 MiB). Bytes per row come from the
+        sizing persisted for the table under `TDAG_ROOT_PATH`, or from encoding a sample.
+        While the first chunk encodes over the budget, or over a size the backend rejected
+        with 413, the chunks are planned again before anything is sent. Halves of a rejected
+        chunk are likewise split unsent. The learned sizing is saved for the next upload.
+
+        `ingest_stats`, when computed for `serialized_data_frame` by `compute_ingest_stats`,
+        supplies each chunk's stats by row range instead of recomputing them per chunk.
+
+        Up to `max_in_flight` chunks (default `MAINSEQUENCE_UPLOAD_CONCURRENCY`, else 4) are
+        encoded and posted at once, so serializing one chunk overlaps the upload of others
+        and at most that many encoded payloads are held in memory. The first chunk is sent
+        before and the last chunk after all the others. The first failure stops the chunks
+        that have not been posted yet and is raised.
+
+        `wire_format` (default `MAINSEQUENCE_UPLOAD_WIRE_FORMAT`, else "json") picks the chunk
+        body from `UPLOAD_WIRE_FORMATS`. "arrow" and "parquet" post the chunk as a zstd Arrow
+        IPC stream or Parquet file, typed by the codec plan, in a multipart `data` file with
+        the other fields as form values (`chunk_stats` as JSON text). They require pyarrow.
+        A backend that answers 415 gets that chunk and every later upload as JSON.
         """
         s = cls.build_session()
         update_uid = _require_public_uid(data_node_update, "DataNodeUpdate")
         url = cls.get_object_url() + f"/{update_uid}/insert-data-into-table/"
+        if ingest_stats is not None and len(ingest_stats) != len(serialized_data_frame):
+            raise ValueError("ingest_stats must be computed for serialized_data_frame.")
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv("MAINSEQUENCE_UPLOAD_CONCURRENCY") or 4)
+        if wire_format is None:
+            wire_format = os.getenv("MAINSEQUENCE_UPLOAD_WIRE_FORMAT") or "json"
+        wire_format = wire_format.strip().lower()
+        if wire_format not in UPLOAD_WIRE_FORMATS:
+            raise ValueError(
+                f"Unsupported upload wire format {wire_format!r}; expected one of "
+                f"{', '.join(UPLOAD_WIRE_FORMATS)}."
+            )
+        if wire_format != "json":
+            try:
+                import pyarrow  # noqa: F401
+            except ModuleNotFoundError as exc:
+                raise ModuleNotFoundError(
+                    f"The {wire_format!r} upload wire format requires pyarrow, from the "
+                    "optional dependency group `mainsequence[local-data]`."
+                ) from exc
+        if chunk_bytes is None:
+            chunk_bytes = int(
+                os.getenv("MAINSEQUENCE_UPLOAD_CHUNK_BYTES") or DEFAULT_UPLOAD_CHUNK_BYTES
+            )
+        endpoint = cls.get_object_url()
+        cancelled = Event()
+
+        def _encode_body(df_chunk: pd.DataFrame, chunk_format: str) -> tuple[Any, int]:
+            if chunk_format != "json":
+                body = _encode_binary_upload_chunk(
+                    df_chunk,
+                    wire_format=chunk_format,
+                    column_dtypes_map=column_dtypes_map,
+                    time_index_name=time_index_name,
+                )
+                return body, len(body)
+            compressed = _gzip_json_records(
+                df_chunk, column_dtypes_map=column_dtypes_map, time_index_name=time_index_name
+            )
+            return compressed, 4 * math.ceil(len(compressed) / 3)
+
+        def _send_halves(
+            df_chunk: pd.DataFrame, chunk_idx: int, total_chunks: int, row_offset: int
+        ):
+            mid_point = len(df_chunk) // 2
+            first_half = df_chunk.iloc[:mid_point]
+            second_half = df_chunk.iloc[mid_point:]
+
+            # Recursively call for each half, marking them as sub-chunks.
+            _send_chunk_recursively(
+                first_half,
+                chunk_idx,
+                total_chunks,
+                is_sub_chunk=True,
+                row_offset=row_offset,
+            )
+            _send_chunk_recursively(
+                second_half,
+                chunk_idx,
+                total_chunks,
+                is_sub_chunk=True,
+                row_offset=row_offset + mid_point,
+            )
 
         def _send_chunk_recursively(
-            df_chunk: pd.DataFrame, chunk_idx: int, total_chunks: int, is_sub_chunk: bool = False
+            df_chunk: pd.DataFrame,
+            chunk_idx: int,
+            total_chunks: int,
+            is_sub_chunk: bool = False,
+            row_offset: int = 0,
+            encoded: tuple[str, Any, int] | None = None,
         ):
             """
             Internal helper to send a chunk. If it receives a 413 error, it splits
             the chunk and calls itself on the two halves.
+
+            `encoded` is a `(format, body, body_bytes)` already encoded for `df_chunk`.
             """
-            if df_chunk.empty:
+            if df_chunk.empty or cancelled.is_set():
                 return
 
             part_label = (
@@ -2717,30 +3170,52 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
                 else f"sub-chunk of {chunk_idx + 1}"
             )
 
-            # Prepare the payload
-            chunk_stats, _ = get_index_progress_chunk_stats(
-                chunk_df=df_chunk, index_names=index_names, time_index_name=time_index_name
-            )
-            if column_dtypes_map is not None:
-                df_chunk = prepare_dataframe_for_remote_write(
-                    df_chunk,
-                    column_dtypes_map=column_dtypes_map,
-                    time_index_name=time_index_name,
+            chunk_format = "json" if endpoint in _JSON_ONLY_UPLOAD_ENDPOINTS else wire_format
+            if encoded is not None and encoded[0] == chunk_format:
+                _, data, body_bytes = encoded
+            else:
+                data, body_bytes = _encode_body(df_chunk, chunk_format)
+                sizer.observe(len(df_chunk), body_bytes)
+            # Sub-chunks are uploads of their own, so one already known to be too large is
+            # split unsent. Planned chunks keep their place in the upload and rely on 413.
+            if is_sub_chunk and sizer.too_large(len(df_chunk), body_bytes):
+                logger.info(
+                    f"Chunk {part_label} ({len(df_chunk)} rows, {body_bytes} bytes) is over the "
+                    f"{sizer.budget}-byte budget. Splitting in half before upload."
                 )
-            chunk_json_str = df_chunk.to_json(orient="records", date_format="iso")
-            compressed = gzip.compress(chunk_json_str.encode("utf-8"))
-            compressed_b64 = base64.b64encode(compressed).decode("utf-8")
+                sizer.record_split()
+                _send_halves(df_chunk, chunk_idx, total_chunks, row_offset)
+                return
 
+            # Prepare the payload
+            if ingest_stats is not None:
+                chunk_stats = ingest_stats.chunk_stats(row_offset, row_offset + len(df_chunk))
+            else:
+                chunk_stats, _ = get_index_progress_chunk_stats(
+                    chunk_df=df_chunk, index_names=index_names, time_index_name=time_index_name
+                )
             # For sub-chunks, we treat it as a new, single-chunk upload.
-            payload = dict(
-                json={
-                    "data": compressed_b64,
-                    "chunk_stats": serialize_to_json(chunk_stats),
-                    "overwrite": overwrite,
-                    "chunk_index": 0 if is_sub_chunk else chunk_idx,
-                    "total_chunks": 1 if is_sub_chunk else total_chunks,
-                }
-            )
+            fields = {
+                "chunk_stats": serialize_to_json(chunk_stats),
+                "overwrite": overwrite,
+                "chunk_index": 0 if is_sub_chunk else chunk_idx,
+                "total_chunks": 1 if is_sub_chunk else total_chunks,
+            }
+            if chunk_format == "json":
+                payload = dict(
+                    data=_JSONUploadBody(data, fields),
+                    headers={"Content-Type": "application/json"},
+                )
+            else:
+                file_name, content_type = _UPLOAD_CONTENT_TYPES[chunk_format]
+                fields.update(
+                    format=chunk_format,
+                    chunk_stats=json.dumps(fields["chunk_stats"]),
+                    overwrite=json.dumps(overwrite),
+                )
+                payload = dict(json=fields, files={"data": (file_name, data, content_type)})
+            if cancelled.is_set():
+                return
 
             try:
                 r = make_request(
@@ -2748,10 +3223,23 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
                 )
 
                 if r.status_code in [200, 204]:
+                    sizer.record_sent(body_bytes)
                     logger.info(f"Chunk {part_label} ({len(df_chunk)} rows) uploaded successfully.")
                     return
 
+                if r.status_code == 415 and chunk_format != "json":
+                    logger.warning(
+                        f"Backend does not accept {chunk_format} chunks (415); "
+                        f"uploading as JSON instead."
+                    )
+                    _JSON_ONLY_UPLOAD_ENDPOINTS.add(endpoint)
+                    _send_chunk_recursively(
+                        df_chunk, chunk_idx, total_chunks, is_sub_chunk, row_offset
+                    )
+                    return
+
                 if r.status_code == 413:
+                    sizer.record_rejected(body_bytes)
                     logger.warning(
                         f"Chunk {part_label} ({len(df_chunk)} rows) is too large (413). "
                         f"Splitting in half and retrying as new uploads."
@@ -2764,13 +3252,7 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
                             f"A single row from chunk {part_label} is too large to upload."
                         )
 
-                    mid_point = len(df_chunk) // 2
-                    first_half = df_chunk.iloc[:mid_point]
-                    second_half = df_chunk.iloc[mid_point:]
-
-                    # Recursively call for each half, marking them as sub-chunks.
-                    _send_chunk_recursively(first_half, chunk_idx, total_chunks, is_sub_chunk=True)
-                    _send_chunk_recursively(second_half, chunk_idx, total_chunks, is_sub_chunk=True)
+                    _send_halves(df_chunk, chunk_idx, total_chunks, row_offset)
                     return
 
                 logger.warning(f"Error in request for chunk {part_label}: {r.text}")
@@ -2787,15 +3269,97 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
             logger.info("DataFrame is empty, nothing to upload.")
             return
 
+        initial_format = "json" if endpoint in _JSON_ONLY_UPLOAD_ENDPOINTS else wire_format
+        # data_node_storage is the storage uid itself until the update is expanded.
+        storage = getattr(data_node_update, "data_node_storage", None)
+        storage_uid = storage if isinstance(storage, str | UUID) else getattr(storage, "uid", None)
+        sizer = _UploadChunkSizer.load(
+            f"{storage_uid or update_uid}:{initial_format}",
+            byte_budget=chunk_bytes,
+        )
+        first_encoded = None
+        if chunk_size is None:
+            if sizer.bytes_per_row is None and total_rows > UPLOAD_SIZING_SAMPLE_ROWS:
+                positions = np.linspace(0, total_rows - 1, UPLOAD_SIZING_SAMPLE_ROWS).astype(int)
+                _, sample_bytes = _encode_body(
+                    serialized_data_frame.iloc[positions], initial_format
+                )
+                sizer.observe(len(positions), sample_bytes)
+            chunk_size = sizer.rows_per_chunk(default=total_rows)
+            # The first chunk tests the estimate before anything is sent. While it encodes over
+            # the budget, chunk_size is planned again from the refined bytes per row, so the
+            # rows still go out as indexed chunks of the same upload.
+            while True:
+                first_rows = min(chunk_size, total_rows)
+                first_data, first_bytes = _encode_body(
+                    serialized_data_frame.iloc[:first_rows], initial_format
+                )
+                sizer.observe(first_rows, first_bytes)
+                if not sizer.too_large(first_rows, first_bytes):
+                    first_encoded = (initial_format, first_data, first_bytes)
+                    break
+                logger.info(
+                    f"First chunk ({first_rows} rows, {first_bytes} bytes) is over the "
+                    f"{sizer.budget}-byte budget. Planning smaller chunks before upload."
+                )
+                sizer.record_split()
+                chunk_size = max(1, min(sizer.rows_per_chunk(default=total_rows), first_rows // 2))
+
         total_chunks = math.ceil(total_rows / chunk_size) if chunk_size > 0 else 1
         logger.info(f"Starting upload of {total_rows} rows in {total_chunks} initial chunk(s).")
 
-        for i in range(total_chunks):
+        def _send_chunk(i: int):
             start_idx = i * chunk_size
             end_idx = min((i + 1) * chunk_size, total_rows)
             chunk_df = serialized_data_frame.iloc[start_idx:end_idx]
 
-            _send_chunk_recursively(chunk_df, i, total_chunks)
+            _send_chunk_recursively(
+                chunk_df,
+                i,
+                total_chunks,
+                row_offset=start_idx,
+                encoded=first_encoded if i == 0 else None,
+            )
+
+        def _send_all_chunks():
+            if max_in_flight <= 1 or total_chunks <= 2:
+                for i in range(total_chunks):
+                    _send_chunk(i)
+                return
+
+            # The first and last chunks bracket the upload, so only the ones between overlap.
+            _send_chunk(0)
+            pending = set()
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_in_flight, thread_name_prefix="chunk-upload"
+            ) as pool:
+                try:
+                    for i in range(1, total_chunks - 1):
+                        if len(pending) >= max_in_flight:
+                            done, pending = concurrent.futures.wait(
+                                pending, return_when=concurrent.futures.FIRST_COMPLETED
+                            )
+                            for future in done:
+                                future.result()
+                        pending.add(pool.submit(_send_chunk, i))
+                    for future in concurrent.futures.as_completed(pending):
+                        future.result()
+                except BaseException:
+                    cancelled.set()
+                    for future in pending:
+                        future.cancel()
+                    raise
+            _send_chunk(total_chunks - 1)
+
+        try:
+            _send_all_chunks()
+        finally:
+            sizer.save()
+        logger.info(
+            f"Uploaded {total_rows} rows in {sizer.requests} request(s) totaling "
+            f"{sizer.bytes_sent} bytes from {total_chunks} planned chunk(s): "
+            f"{sizer.retries} 413 retries, {sizer.splits} pre-upload splits or re-plans."
+        )
 
     @classmethod
     def get_data_nodes_and_set_updates(
@@ -2986,13 +3550,13 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
         if not data[time_index_name].is_monotonic_increasing:
             data = data.sort_values(time_index_name)
 
-        duplicates_exist = data.duplicated(subset=index_names).any()
-        if duplicates_exist:
+        ingest_stats = compute_ingest_stats(
+            data, time_index_name=time_index_name, index_names=index_names
+        )
+        if ingest_stats.has_duplicates:
             raise Exception(f"Duplicates found in columns: {index_names}")
 
-        index_stats, grouped_dates = get_index_progress_chunk_stats(
-            chunk_df=data, index_names=index_names, time_index_name=time_index_name
-        )
+        index_stats = ingest_stats.chunk_stats()
         index_min_max_stats = combine_index_min_max_stats(
             index_min=index_stats["index_min"],
             index_progress=index_stats["index_progress"],
@@ -3007,8 +3571,9 @@ class DataNodeUpdate(TableUpdateNode, BaseObjectOrm):
             overwrite=overwrite,
             time_index_name=time_index_name,
             index_names=index_names,
-            grouped_dates=grouped_dates,
+            grouped_dates=ingest_stats.grouped_dates(),
             column_dtypes_map=column_dtypes_map,
+            ingest_stats=ingest_stats,
         )
 
         data_node_update = self.set_last_update_index_time_from_update_stats(
@@ -3510,16 +4075,7 @@ class TimeIndexMetaTable(MetaTable):
         time_index_name: str,
         index_names: list[str],
     ) -> pd.DataFrame:
-        columns_to_loop = column_dtypes_map.keys()
-        for c, c_type in column_dtypes_map.items():
-            if c not in columns_to_loop:
-                continue
-            if c in df.columns:
-                df[c] = token_to_pandas_series(
-                    df[c],
-                    c_type,
-                    is_time_index=c == time_index_name,
-                )
+        compile_codec_plan(column_dtypes_map, time_index_name=time_index_name).decode_frame(df)
         df = df.set_index(index_names)
         return df
 
@@ -3590,8 +4146,52 @@ class TimeIndexMetaTable(MetaTable):
         if "get-data-between-dates-from-node-identifier" in url:
             return_storage_node = True
 
-        def fetch_one_batch(chunk_dimension_range_map):
-            all_results_chunk = []
+        all_results = []
+        response_data = None
+        for page_results, page_response in cls._iter_data_between_dates_pages(
+            url=url,
+            start_date=start_date,
+            end_date=end_date,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+            node_identifier=node_identifier,
+        ):
+            all_results.extend(page_results)
+            response_data = page_response
+        if not return_storage_node:
+            return pd.DataFrame(all_results)
+        else:
+            storage_node = (
+                cls(**response_data["storage_node"]) if response_data is not None else None
+            )
+            return pd.DataFrame(all_results), storage_node
+
+    @classmethod
+    def _iter_data_between_dates_pages(
+        cls,
+        url: str,
+        start_date: datetime.datetime = None,
+        end_date: datetime.datetime = None,
+        great_or_equal: bool = None,
+        less_or_equal: bool = None,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list = None,
+        node_identifier: str | None = None,
+    ):
+        """
+        Yield ``(results, response_data)`` for every page of a between-dates read.
+
+        Pages follow the server's ``next_offset`` pagination; a `dimension_range_map` is
+        sent in chunks of 100 entries, each paginated on its own.
+        """
+
+        def fetch_pages(chunk_dimension_range_map):
             offset = 0
 
             while True:
@@ -3628,9 +4228,7 @@ class TimeIndexMetaTable(MetaTable):
                     raise_for_response(r, payload=payload)
 
                 response_data = r.json()
-                # Accumulate results
-                chunk = response_data.get("results", [])
-                all_results_chunk.extend(chunk)
+                yield response_data.get("results", []), response_data
 
                 # Retrieve next offset; if None, we've got all the data in this chunk
                 next_offset = response_data.get("next_offset")
@@ -3640,31 +4238,16 @@ class TimeIndexMetaTable(MetaTable):
                 # Update offset for the next iteration
                 offset = next_offset
 
-            return all_results_chunk, response_data
-
         s = cls.build_session()
 
-        all_results = []
-        response_data = None
         if dimension_range_map:
             chunk_size = 100
             for start_idx in range(0, len(dimension_range_map), chunk_size):
                 chunk_range_map = dimension_range_map[start_idx : start_idx + chunk_size]
-
-                # Fetch data (including any pagination via next_offset)
-                chunk_results, response_data = fetch_one_batch(chunk_range_map)
-                all_results.extend(chunk_results)
+                yield from fetch_pages(chunk_range_map)
         else:
             # If dimension_range_map is None, do a single batch with offset-based pagination.
-            chunk_results, response_data = fetch_one_batch(None)
-            all_results.extend(chunk_results)
-        if not return_storage_node:
-            return pd.DataFrame(all_results)
-        else:
-            storage_node = (
-                cls(**response_data["storage_node"]) if response_data is not None else None
-            )
-            return pd.DataFrame(all_results), storage_node
+            yield from fetch_pages(None)
 
     def get_data_between_dates_from_api(
         self,
@@ -3698,6 +4281,52 @@ class TimeIndexMetaTable(MetaTable):
             node_identifier=None,
         )
 
+    def iter_data_between_dates_from_api(
+        self,
+        start_date: datetime.datetime = None,
+        end_date: datetime.datetime = None,
+        great_or_equal: bool = None,
+        less_or_equal: bool = None,
+        dimension_filters: dict[str, list[Any]] | None = None,
+        index_coordinates: list[dict[str, Any]] | None = None,
+        dimension_range_map: list[dict[str, Any]] | None = None,
+        columns: list = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ):
+        """
+        Stream `get_data_between_dates_from_api` as untyped DataFrames of `batch_rows` rows.
+
+        Server pages are fetched lazily and re-batched, so at most one page plus one batch
+        is held in memory.
+        """
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be positive, got {batch_rows}")
+        url = self.get_object_url() + f"/{self._public_uid()}/get-data-between-dates-from-remote/"
+        dimension_payload = self._build_dimension_payload(
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+        )
+
+        pending: list[dict[str, Any]] = []
+        for page_results, _ in self._iter_data_between_dates_pages(
+            url=url,
+            start_date=start_date,
+            end_date=end_date,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            dimension_filters=dimension_payload.get("dimension_filters"),
+            index_coordinates=dimension_payload.get("index_coordinates"),
+            dimension_range_map=dimension_payload.get("dimension_range_map"),
+            columns=columns,
+        ):
+            pending.extend(page_results)
+            while len(pending) >= batch_rows:
+                yield pd.DataFrame(pending[:batch_rows])
+                del pending[:batch_rows]
+        if pending:
+            yield pd.DataFrame(pending)
+
     @classmethod
     def get_data_between_dates_from_node_identifier(
         cls,
@@ -3929,6 +4558,12 @@ class BaseUpdateStatistics(BaseModel):
 class UpdateStatistics(BaseUpdateStatistics):
     """
     Time-series-specific update statistics used by DataNode updaters.
+
+    Replace `index_progress` and the per-column entries of `multi_index_column_stats`
+    instead of mutating them in place: the columnar view of `index_progress` is cached
+    until the mapping is replaced, and columns validated with equal stats share their
+    nested per-identity values. Item access returns read-only views of nested branches;
+    assign a new branch with `stats[key] = ...` instead.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
@@ -3944,6 +4579,9 @@ class UpdateStatistics(BaseUpdateStatistics):
 
     _max_time_in_update_statistics: datetime.datetime | None = None  # include filter
     _initial_fallback_date: datetime.datetime | None = None
+    # Columnar leaves of the current index_progress, and the watermarks derived from them
+    _progress_leaves: _ProgressLeaves | None = None
+    _progress_watermarks: tuple[_ProgressLeaves, tuple[str, ...], pd.Series] | None = None
 
     # when working with DuckDb and column based storage we want to have also stats by  column
     multi_index_column_stats: dict[str, Any] | None = None
@@ -3994,22 +4632,32 @@ class UpdateStatistics(BaseUpdateStatistics):
         return value
 
     @classmethod
-    def _normalize_nested(cls, obj: Any):
+    def _normalize_nested(cls, obj: Any, _parsed: dict[str, Any] | None = None):
+        # The same timestamps recur across identities and columns, so each distinct
+        # string is parsed once per walk and the resulting datetime is shared.
+        if _parsed is None:
+            _parsed = {}
         if obj is None:
             return None
-        if isinstance(obj, dict):
-            return {k: cls._normalize_nested(v) for k, v in obj.items()}
+        if isinstance(obj, Mapping):
+            return {k: cls._normalize_nested(v, _parsed) for k, v in obj.items()}
         if isinstance(obj, list):
-            return [cls._normalize_nested(v) for v in obj]
+            return [cls._normalize_nested(v, _parsed) for v in obj]
         if isinstance(obj, tuple):
-            return tuple(cls._normalize_nested(v) for v in obj)
+            return tuple(cls._normalize_nested(v, _parsed) for v in obj)
+        if isinstance(obj, str):
+            parsed = _parsed.get(obj)
+            if parsed is None:
+                parsed = _parsed[obj] = cls._to_utc_datetime(obj)
+            return parsed
+        if type(obj) is datetime.datetime and obj.tzinfo is datetime.UTC:
+            return obj
         return cls._to_utc_datetime(obj)
 
     @field_validator(
         "global_index_progress",
         "index_progress",
         "index_min",
-        "multi_index_column_stats",
         mode="before",
     )
     @classmethod
@@ -4017,6 +4665,26 @@ class UpdateStatistics(BaseUpdateStatistics):
         # Normalize before standard parsing so ints/strings become datetimes
         return cls._normalize_nested(v)
 
+    @field_validator("multi_index_column_stats", mode="before")
+    @classmethod
+    def _coerce_multi_index_column_stats(cls, v):
+        # Columns written together carry identical per-identity stats; normalize each
+        # run of equal column mappings once and share its values, giving each column
+        # its own top-level mapping.
+        if not isinstance(v, dict):
+            return cls._normalize_nested(v)
+        parsed: dict[str, Any] = {}
+        normalized: dict[str, Any] = {}
+        previous_raw = previous = None
+        for column_name, column_stats in v.items():
+            if previous is None or not (
+                column_stats is previous_raw or column_stats == previous_raw
+            ):
+                previous_raw = column_stats
+                previous = cls._normalize_nested(column_stats, parsed)
+            normalized[column_name] = dict(previous) if isinstance(previous, dict) else previous
+        return normalized
+
     @field_validator("max_time_index_value", mode="before")
     @classmethod
     def _coerce_max_time_index_value(cls, v):
@@ -4092,10 +4760,6 @@ class UpdateStatistics(BaseUpdateStatistics):
         multi_index_column_stats = self.multi_index_column_stats or {}
         if column_filter is None:
             column_filter = list(multi_index_column_stats.keys())
-        column_stats_by_column = {
-            column_name: copy.deepcopy(multi_index_column_stats.get(column_name, {}))
-            for column_name in column_filter
-        }
 
         def _start_dt(bounds):
             dt = (
@@ -4105,19 +4769,22 @@ class UpdateStatistics(BaseUpdateStatistics):
                 dt = dt + extra_time_delta
             return dt
 
-        range_map = {
-            col: {
-                identity_value: DateInfo(
-                    {
-                        "start_date_operand": ">=",
-                        "start_date": _start_dt(bounds),
-                    }
-                )
-                for identity_value, bounds in col_stats.items()
+        # Stats are only read here, and columns written together share one mapping, so
+        # start dates are resolved once per distinct mapping rather than per column.
+        start_dates_by_stats: dict[int, list[tuple[Any, Any]]] = {}
+        range_map = {}
+        for col in column_filter:
+            col_stats = multi_index_column_stats.get(col, {})
+            start_dates = start_dates_by_stats.get(id(col_stats))
+            if start_dates is None:
+                start_dates = start_dates_by_stats[id(col_stats)] = [
+                    (identity_value, _start_dt(bounds))
+                    for identity_value, bounds in col_stats.items()
+                ]
+            range_map[col] = {
+                identity_value: DateInfo({"start_date_operand": ">=", "start_date": start_date})
+                for identity_value, start_date in start_dates
             }
-            for col, col_stats in column_stats_by_column.items()
-            if col in column_filter
-        }
 
         return range_map
 
@@ -4156,43 +4823,64 @@ class UpdateStatistics(BaseUpdateStatistics):
         stats. Callers must pass it explicitly; UpdateStatistics does not infer
         identity dimension names.
         """
-        progress_stats = self._progress_stats()
-        if not progress_stats:
+        if not self._progress_stats():
             return []
 
         dimensions = list(identity_dimensions)
-        coordinates: list[tuple[dict[str, Any], Any]] = []
+        leaves = self._index_progress_leaves(identity_dimensions=dimensions)
+        return [
+            (dict(zip(dimensions, path, strict=False)), value)
+            for path, value in zip(leaves.paths, leaves.values, strict=True)
+        ]
 
-        def _visit(node: Any, depth: int, coordinate: dict[str, Any]) -> None:
-            if isinstance(node, dict):
-                if depth >= len(dimensions):
-                    raise ValueError(
-                        "identity_dimensions must include a name for every "
-                        "nested index_progress level."
-                    )
-                dimension_name = dimensions[depth]
-                for key, value in node.items():
-                    _visit(value, depth + 1, {**coordinate, dimension_name: key})
-                return
+    def _index_progress_leaves(
+        self, identity_dimensions: Sequence[str] | None = None
+    ) -> _ProgressLeaves:
+        """
+        Columnar leaves of `index_progress`, cached until it is replaced. With
+        `identity_dimensions`, also check that every nested level has a name.
+        """
+        progress_stats = self._progress_stats()
+        leaves = self._progress_leaves
+        if leaves is None or leaves.source is not progress_stats:
+            leaves = self._progress_leaves = _ProgressLeaves.from_nested(progress_stats)
+        if (
+            identity_dimensions is not None
+            and progress_stats
+            and leaves.max_mapping_depth >= len(identity_dimensions)
+        ):
+            raise ValueError(
+                "identity_dimensions must include a name for every nested index_progress level."
+            )
+        return leaves
 
-            coordinates.append((coordinate, node))
+    def _index_progress_watermarks(self, identity_dimensions: Sequence[str]) -> pd.Series:
+        """
+        Return the `index_progress` leaves as a Series of UTC timestamps keyed by
+        identity coordinate, one level per name in `identity_dimensions`.
 
-        _visit(progress_stats, 0, {})
-        return coordinates
+        Branches that stop above the last dimension or end in `None` have no
+        watermark and are left out. The result is cached until `index_progress`
+        is replaced.
+        """
+        dimensions = tuple(identity_dimensions)
+        leaves = self._index_progress_leaves(identity_dimensions=dimensions)
+        cached = self._progress_watermarks
+        if cached is not None and cached[0] is leaves and cached[1] == dimensions:
+            return cached[2]
+
+        rows = np.flatnonzero((leaves.depths == len(dimensions)) & leaves.times.notna())
+        levels = [[leaves.paths[row][depth] for row in rows] for depth in range(len(dimensions))]
+        if len(dimensions) == 1:
+            index = pd.Index(levels[0], dtype=object, name=dimensions[0])
+        else:
+            index = pd.MultiIndex.from_arrays(levels, names=list(dimensions))
+        watermarks = pd.Series(leaves.times[rows], index=index)
+        self._progress_watermarks = (leaves, dimensions, watermarks)
+        return watermarks
 
     def get_index_progress_leaf_values(self) -> list[Any]:
-        values: list[Any] = []
-
-        def _visit(node: Any) -> None:
-            if isinstance(node, dict):
-                for value in node.values():
-                    _visit(value)
-                return
-            if node is not None:
-                values.append(node)
-
-        _visit(self._progress_stats())
-        return values
+        return [value for value in self._index_progress_leaves().values if value is not None]
 
     def get_dimension_range_map_great_or_equal(
         self,
@@ -4265,20 +4953,18 @@ class UpdateStatistics(BaseUpdateStatistics):
         #   0 == first identity level, 1 == second identity level, etc.
         target_depth = level - 1
 
+        allowed = set(filters)
+        default = self._initial_fallback_date
+
         # Special-case: filtering on the first identity level.
         if target_depth == 0:
-            self._set_progress_stats(
-                {
-                    identity_value: stats
-                    for identity_value, stats in self._progress_stats().items()
-                    if identity_value in filters
-                }
-            )
+            self.index_progress = {
+                identity_value: stats
+                for identity_value, stats in self._progress_stats().items()
+                if identity_value in allowed
+            }
             return self
 
-        allowed = set(filters)
-        default = self._initial_fallback_date
-
         def _prune(node: Any, current_depth: int) -> Any:
             # leaf timestamp
             if not isinstance(node, dict):
@@ -4325,37 +5011,29 @@ class UpdateStatistics(BaseUpdateStatistics):
         init_fallback_date=None,
     ):
         new_update_statistics = {}
-        progress_stats = self.index_progress
+        progress_stats = self.index_progress or {}
         if identity_values is None:
-            identity_values = list((progress_stats or {}).keys())
+            identity_values = list(progress_stats.keys())
 
+        missing_identity = False
         for identity_value in identity_values:
-            if progress_stats and identity_value in progress_stats:
+            if identity_value in progress_stats:
                 new_update_statistics[identity_value] = progress_stats[identity_value]
             else:
                 new_update_statistics[identity_value] = init_fallback_date
+                missing_identity = True
 
-        def _max_in_nested(d):
-            """
-            Recursively find the max leaf value in a nested dict-of-dicts,
-            where the leaves are comparable (e.g. datetime objects).
-            Returns None if there are no leaves.
-            """
-            max_val = None
-            for v in d.values():
-                if isinstance(v, dict):
-                    candidate = _max_in_nested(v)
-                else:
-                    candidate = v
-                if candidate is not None and (max_val is None or candidate > max_val):
-                    max_val = candidate
-            return max_val
-
-        _max_time_in_identity_statistics = (
-            _max_in_nested(new_update_statistics)
-            if len(new_update_statistics) > 0
-            else init_fallback_date
-        )
+        if not new_update_statistics:
+            return new_update_statistics, init_fallback_date
+
+        # Max over the scoped identities' leaves, selected from the columnar leaves at once.
+        leaves = self._index_progress_leaves()
+        selected = np.flatnonzero(leaves.first_keys.isin(list(new_update_statistics)))
+        candidates = [leaves.values[row] for row in selected]
+        if missing_identity:
+            candidates.append(init_fallback_date)
+        candidates = [value for value in candidates if value is not None]
+        _max_time_in_identity_statistics = max(candidates) if candidates else None
 
         return new_update_statistics, _max_time_in_identity_statistics
 
@@ -4390,7 +5068,8 @@ class UpdateStatistics(BaseUpdateStatistics):
                 if k in new_update_statistics.keys()
             }
 
-        du = UpdateStatistics(
+        # Everything here is already normalized; skip re-walking it through validation.
+        du = UpdateStatistics.model_construct(
             index_progress=new_update_statistics,
             max_time_index_value=self.max_time_index_value,
             multi_index_column_stats=new_multi_index_column_stats,
@@ -4402,19 +5081,20 @@ class UpdateStatistics(BaseUpdateStatistics):
     def __getitem__(self, key: str) -> Any:
         if self.index_progress is None:
             raise KeyError(f"{key} not found (index_progress is None).")
-        return self.index_progress[key]
+        return _read_only_progress(self.index_progress[key])
 
     def __setitem__(self, key: str, value: Any) -> None:
+        # Only the new branch needs normalizing; the rest already is.
         progress_stats = dict(self._progress_stats())
         progress_stats[key] = self._normalize_nested(value)
-        self._set_progress_stats(progress_stats)
+        self.index_progress = progress_stats
 
     def __delitem__(self, key: str) -> None:
         if not self.index_progress or key not in self.index_progress:
             raise KeyError(f"{key} not found in index_progress.")
         progress_stats = dict(self.index_progress)
         del progress_stats[key]
-        self._set_progress_stats(progress_stats)
+        self.index_progress = progress_stats
 
     def __iter__(self):
         """Iterate over keys."""
@@ -4435,12 +5115,12 @@ class UpdateStatistics(BaseUpdateStatistics):
     def values(self):
         if not self.index_progress:
             return []
-        return self.index_progress.values()
+        return _ReadOnlyProgress(self.index_progress).values()
 
     def items(self):
         if not self.index_progress:
             return []
-        return self.index_progress.items()
+        return _ReadOnlyProgress(self.index_progress).items()
 
     def filter_df_by_latest_value(self, df: pd.DataFrame) -> pd.DataFrame:
         names = list(df.index.names)
@@ -4455,30 +5135,15 @@ class UpdateStatistics(BaseUpdateStatistics):
             else:
                 return df
 
-        # Build a mask by iterating over each row tuple + its timestamp
-        mask = []
-        progress_stats = self._progress_stats()
-        for idx_tuple, ts in zip(df.index, df.index.get_level_values(time_level), strict=False):
-            if not isinstance(idx_tuple, tuple):
-                idx_tuple = (idx_tuple,)
-            # map level names → values
-            level_vals = dict(zip(names, idx_tuple, strict=False))
-
-            nested = progress_stats
-            for lvl in identity_levels:
-                key = level_vals[lvl]
-                if not isinstance(nested, dict) or key not in nested:
-                    # no prior stats for this subgroup → keep row
-                    nested = None
-                    break
-                nested = nested[key]
-
-            # if we couldn’t find a prior timestamp, or this ts is newer, keep it
-            if nested is None or ts > nested:
-                mask.append(True)
-            else:
-                # ts ≤ last seen → filter out
-                mask.append(False)
+        # Look up every row's identity coordinate in the flattened watermarks at once;
+        # rows without a prior timestamp are kept, the rest only if they are newer.
+        watermarks = self._index_progress_watermarks(identity_levels)
+        positions = watermarks.index.get_indexer(df.index.droplevel(time_level))
+        matched = positions >= 0
+        mask = ~matched
+        if matched.any():
+            time_values = df.index.get_level_values(time_level)[matched]
+            mask[matched] = time_values > watermarks.iloc[positions[matched]].array
 
         # apply the mask
         df = df[mask]
@@ -4492,6 +5157,82 @@ class UpdateStatistics(BaseUpdateStatistics):
         return df
 
 
+@dataclass(frozen=True)
+class _ProgressLeaves:
+    """
+    Columnar form of a nested progress mapping, one row per leaf in insertion order.
+
+    `paths` holds each leaf's key path and `values` the leaf itself; `depths` and
+    `first_keys` are those paths' lengths and top-level keys, and `times` the leaves
+    as UTC timestamps (NaT for `None` and non-datetime leaves). `max_mapping_depth` is
+    the deepest level holding a mapping, counting empty ones.
+    """
+
+    source: Any
+    paths: list[tuple[Any, ...]]
+    values: list[Any]
+    depths: np.ndarray
+    first_keys: pd.Index
+    times: pd.DatetimeIndex
+    max_mapping_depth: int
+
+    @classmethod
+    def from_nested(cls, nested: Mapping[Any, Any]) -> _ProgressLeaves:
+        paths: list[tuple[Any, ...]] = []
+        values: list[Any] = []
+        max_mapping_depth = 0
+
+        def _visit(node: Any, path: tuple[Any, ...]) -> None:
+            nonlocal max_mapping_depth
+            if isinstance(node, dict):
+                max_mapping_depth = max(max_mapping_depth, len(path))
+                for key, value in node.items():
+                    _visit(value, (*path, key))
+                return
+            paths.append(path)
+            values.append(node)
+
+        _visit(nested, ())
+        times = pd.to_datetime(
+            [value if isinstance(value, datetime.datetime) else None for value in values],
+            utc=True,
+        )
+        return cls(
+            source=nested,
+            paths=paths,
+            values=values,
+            depths=np.fromiter(map(len, paths), dtype=np.int64, count=len(paths)),
+            first_keys=pd.Index([path[0] for path in paths], dtype=object),
+            times=pd.DatetimeIndex(times),
+            max_mapping_depth=max_mapping_depth,
+        )
+
+
+class _ReadOnlyProgress(Mapping):
+    """Read-only view of a nested progress mapping; nested mappings are returned as views."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[Any, Any]):
+        self._data = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return _read_only_progress(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+
+def _read_only_progress(value: Any) -> Any:
+    return _ReadOnlyProgress(value) if isinstance(value, dict) else value
+
+
 def _assign_nested_coordinate(root: dict[Any, Any], keys: list[Any], value: Any) -> None:
     if not keys:
         return
@@ -4542,9 +5283,20 @@ def _normalize_update_stat_key(key: Any) -> str:
     return str(normalized_key)
 
 
-def _normalize_update_stat_mapping_keys(value: Any) -> Any:
+def _normalize_update_stat_mapping_keys(
+    value: Any, _normalized_by_id: dict[int, Any] | None = None
+) -> Any:
+    # Per-column stats usually reference one shared mapping; normalize it once per call.
+    if _normalized_by_id is None:
+        _normalized_by_id = {}
+    if not isinstance(value, Mapping | list | tuple):
+        return value
+    cached = _normalized_by_id.get(id(value))
+    if cached is not None:
+        return cached[1]
+
     if isinstance(value, Mapping):
-        normalized: dict[str, Any] = {}
+        normalized: Any = {}
         for key, item in value.items():
             normalized_key = _normalize_update_stat_key(key)
             if normalized_key in normalized:
@@ -4552,44 +5304,197 @@ def _normalize_update_stat_mapping_keys(value: Any) -> Any:
                     "Update statistics coordinate keys collide after JSON normalization: "
                     f"{normalized_key!r}."
                 )
-            normalized[normalized_key] = _normalize_update_stat_mapping_keys(item)
-        return normalized
-    if isinstance(value, list):
-        return [_normalize_update_stat_mapping_keys(item) for item in value]
-    if isinstance(value, tuple):
-        return [_normalize_update_stat_mapping_keys(item) for item in value]
-    return value
+            normalized[normalized_key] = _normalize_update_stat_mapping_keys(
+                item, _normalized_by_id
+            )
+    else:
+        normalized = [
+            _normalize_update_stat_mapping_keys(item, _normalized_by_id) for item in value
+        ]
+    # Keep `value` alive alongside its id so the id cannot be reused within this call.
+    _normalized_by_id[id(value)] = (value, normalized)
+    return normalized
 
 
-def get_index_progress_chunk_stats(chunk_df, time_index_name, index_names):
-    index_names = list(index_names)
-    chunk_stats = {
-        "_GLOBAL_": {
-            "max": UpdateStatistics._to_utc_datetime(chunk_df[time_index_name].max()),
-            "min": UpdateStatistics._to_utc_datetime(chunk_df[time_index_name].min()),
-        },
-        "index_progress": {},
-        "index_min": {},
-    }
-    grouped_dates = None
-    if len(index_names) > 1:
-        identity_dimensions = index_names[1:]
-        grouped_dates = chunk_df.groupby(identity_dimensions)[time_index_name].agg(["min", "max"])
-        df = grouped_dates.reset_index()
-
-        for _, row in df.iterrows():
-            keys = [row[level] for level in identity_dimensions]
-            _assign_nested_coordinate(
-                chunk_stats["index_progress"],
-                keys,
-                UpdateStatistics._to_utc_datetime(row["max"]),
+_NAT_INT = np.iinfo(np.int64).min
+
+
+def _group_time_bounds(
+    codes: np.ndarray, times: np.ndarray, group_count: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Min/max time per group code, skipping rows with a -1 code or a NaT time."""
+    valid = (codes >= 0) & (times != _NAT_INT)
+    codes, times = codes[valid], times[valid]
+    group_min = np.full(group_count, np.iinfo(np.int64).max, dtype=np.int64)
+    group_max = np.full(group_count, _NAT_INT, dtype=np.int64)
+    np.minimum.at(group_min, codes, times)
+    np.maximum.at(group_max, codes, times)
+    present = np.flatnonzero(np.bincount(codes, minlength=group_count))
+    return present, group_min[present], group_max[present]
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    """
+    Time-index statistics of a frame about to be written, from `compute_ingest_stats`.
+
+    Rows keep their frame order: `time_values` holds each row's UTC timestamp as int64
+    (NaT as the int64 minimum) in `time_unit`, and `identity_codes` its position in
+    `identity_keys`, or -1 when a coordinate is null. `chunk_stats` slices these
+    arrays, so per-chunk payloads never go back to the frame.
+    """
+
+    time_index_name: str
+    identity_dimensions: tuple[str, ...]
+    time_unit: str
+    time_tz: Any
+    time_values: np.ndarray
+    identity_codes: np.ndarray
+    identity_keys: list[tuple[Any, ...]]
+    group_codes: np.ndarray
+    group_min: np.ndarray
+    group_max: np.ndarray
+    has_duplicates: bool
+
+    def __len__(self) -> int:
+        return len(self.time_values)
+
+    def _to_datetimes(self, values: np.ndarray) -> list[Any]:
+        index = pd.DatetimeIndex(values.view(f"M8[{self.time_unit}]")).tz_localize("UTC")
+        return [UpdateStatistics._to_utc_datetime(value) for value in index]
+
+    def _time_bounds(self, times: np.ndarray) -> tuple[Any, Any]:
+        times = times[times != _NAT_INT]
+        bounds = np.array([times.min(), times.max()] if len(times) else [_NAT_INT] * 2)
+        return tuple(self._to_datetimes(bounds))
+
+    def chunk_stats(self, start: int = 0, stop: int | None = None) -> dict[str, Any]:
+        """The `get_index_progress_chunk_stats` payload for rows `[start, stop)`."""
+        whole = start == 0 and (stop is None or stop >= len(self))
+        times = self.time_values[start:stop]
+        global_min, global_max = self._time_bounds(times)
+        chunk_stats = {
+            "_GLOBAL_": {"max": global_max, "min": global_min},
+            "index_progress": {},
+            "index_min": {},
+        }
+        if not self.identity_dimensions:
+            return chunk_stats
+
+        if whole:
+            group_codes, group_min, group_max = self.group_codes, self.group_min, self.group_max
+        else:
+            group_codes, group_min, group_max = _group_time_bounds(
+                self.identity_codes[start:stop], times, len(self.identity_keys)
             )
-            _assign_nested_coordinate(
-                chunk_stats["index_min"],
-                keys,
-                UpdateStatistics._to_utc_datetime(row["min"]),
+
+        for code, min_value, max_value in zip(
+            group_codes.tolist(),
+            self._to_datetimes(group_min),
+            self._to_datetimes(group_max),
+            strict=True,
+        ):
+            keys = list(self.identity_keys[code])
+            _assign_nested_coordinate(chunk_stats["index_progress"], keys, max_value)
+            _assign_nested_coordinate(chunk_stats["index_min"], keys, min_value)
+        return chunk_stats
+
+    def grouped_dates(self) -> pd.DataFrame | None:
+        """Per-identity time bounds, shaped like `groupby(identity)[time].agg(["min", "max"])`."""
+        if not self.identity_dimensions:
+            return None
+        keys = [self.identity_keys[code] for code in self.group_codes.tolist()]
+        if len(self.identity_dimensions) == 1:
+            index = pd.Index([key[0] for key in keys], name=self.identity_dimensions[0])
+        else:
+            index = pd.MultiIndex.from_arrays(
+                [[key[depth] for key in keys] for depth in range(len(self.identity_dimensions))],
+                names=list(self.identity_dimensions),
             )
-    return chunk_stats, grouped_dates
+
+        def _column(values: np.ndarray) -> pd.DatetimeIndex:
+            column = pd.DatetimeIndex(values.view(f"M8[{self.time_unit}]"))
+            if self.time_tz is not None:
+                column = column.tz_localize("UTC").tz_convert(self.time_tz)
+            return column
+
+        return pd.DataFrame(
+            {"min": _column(self.group_min), "max": _column(self.group_max)}, index=index
+        )
+
+
+def compute_ingest_stats(
+    df: pd.DataFrame, time_index_name: str, index_names: Sequence[str]
+) -> IngestStats:
+    """
+    Compute global and per-identity time bounds and the full-index duplicate flag of
+    `df` in one pass.
+
+    `index_names[0]` is the time index and the rest are identity dimensions, all read
+    from columns. Each dimension is factorized once and folded into a dense group code
+    (in sorted coordinate order, like `groupby`); the per-identity min/max are scattered
+    from those codes, and duplicates are repeated (group, time) pairs. Rows with a null
+    coordinate count for duplicates and global bounds only, as `groupby` drops them.
+    """
+    identity_dimensions = tuple(str(name) for name in list(index_names)[1:])
+    times = pd.DatetimeIndex(df[time_index_name])
+    time_tz = times.tz
+    if time_tz is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    time_unit = times.unit
+    time_values = times.asi8
+    row_count = len(time_values)
+
+    group_ids = np.zeros(row_count, dtype=np.int64)
+    dimension_codes = []
+    dimension_uniques = []
+    for dimension in identity_dimensions:
+        codes, uniques = pd.factorize(df[dimension], sort=True, use_na_sentinel=False)
+        codes = codes.astype(np.int64, copy=False)
+        dimension_codes.append(codes)
+        dimension_uniques.append(np.asarray(uniques, dtype=object))
+        # Re-densify after every fold so the next product stays far below int64 range.
+        group_ids = pd.factorize(group_ids * len(uniques) + codes, sort=True)[0]
+    group_count = int(group_ids.max()) + 1 if row_count else 0
+
+    time_codes, time_uniques = pd.factorize(time_values)
+    has_duplicates = len(pd.unique(group_ids * len(time_uniques) + time_codes)) < row_count
+
+    identity_codes = np.full(row_count, -1, dtype=np.int64)
+    identity_keys: list[tuple[Any, ...]] = []
+    group_codes = group_min = group_max = np.empty(0, dtype=np.int64)
+    if identity_dimensions and row_count:
+        first_rows = np.empty(group_count, dtype=np.int64)
+        first_rows[group_ids[::-1]] = np.arange(row_count - 1, -1, -1)
+        key_columns = [
+            uniques[codes[first_rows]]
+            for codes, uniques in zip(dimension_codes, dimension_uniques, strict=True)
+        ]
+        group_valid = ~np.any([pd.isna(column) for column in key_columns], axis=0)
+        identity_keys = list(zip(*(column[group_valid] for column in key_columns), strict=True))
+        identity_codes = np.where(group_valid, np.cumsum(group_valid) - 1, -1)[group_ids]
+        group_codes, group_min, group_max = _group_time_bounds(
+            identity_codes, time_values, len(identity_keys)
+        )
+
+    return IngestStats(
+        time_index_name=time_index_name,
+        identity_dimensions=identity_dimensions,
+        time_unit=time_unit,
+        time_tz=time_tz,
+        time_values=time_values,
+        identity_codes=identity_codes,
+        identity_keys=identity_keys,
+        group_codes=group_codes,
+        group_min=group_min,
+        group_max=group_max,
+        has_duplicates=has_duplicates,
+    )
+
+
+def get_index_progress_chunk_stats(chunk_df, time_index_name, index_names):
+    ingest_stats = compute_ingest_stats(chunk_df, time_index_name, index_names)
+    return ingest_stats.chunk_stats(), ingest_stats.grouped_dates()
 
 
 def combine_index_min_max_stats(index_min: dict[str, Any], index_progress: dict[str, Any]):
@@ -5305,6 +6210,7 @@ __all__ = [
     "DataSource",
     "DUCK_DB",
     "HistoricalUpdateRecord",
+    "IngestStats",
     "LastUpdateIndexTimePayload",
     "LastUpdateMultiIndexStatsPayload",
     "LOCAL_DATA_SOURCE_CLASS_TYPES",
@@ -5354,8 +6260,10 @@ __all__ = [
     "TimeIndexMetaTableRegistrationRequest",
     "UpdateBatchResponse",
     "UpdateStatistics",
+    "UPLOAD_WIRE_FORMATS",
     "build_last_update_index_time_payload",
     "combine_index_min_max_stats",
+    "compute_ingest_stats",
     "get_index_progress_chunk_stats",
     "get_session_data_source",
     "request_to_datetime",
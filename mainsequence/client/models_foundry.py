@@ -14,10 +14,8 @@ from pydantic import Field, SecretStr
 from mainsequence.logconf import logger
 
 from .base import BaseObjectOrm, BasePydanticModel, LabelableObjectMixin, ShareableObjectMixin
-from .dtype_codec import (
-    TIMESTAMP_TZ,
-    token_to_pandas_series,
-)
+from .data_sources_interfaces import READ_OUTPUTS, arrow_to_read_output
+from .dtype_codec import compile_codec_plan
 from .exceptions import raise_for_response
 from .metatables import DataSource as _DataSource
 from .utils import (
@@ -786,6 +784,7 @@ class TimeScaleDB(_DataSource):
         index_names: list,
         grouped_dates: dict,
         column_dtypes_map: Mapping[str, Any] | None = None,
+        ingest_stats: Any | None = None,
     ):
         from .metatables import DataNodeUpdate
 
@@ -797,6 +796,7 @@ class TimeScaleDB(_DataSource):
             time_index_name=time_index_name,
             overwrite=overwrite,
             column_dtypes_map=column_dtypes_map,
+            ingest_stats=ingest_stats,
         )
 
     def get_data_by_time_index(
@@ -810,7 +810,10 @@ class TimeScaleDB(_DataSource):
         dimension_filters: dict[str, list[Any]] | None = None,
         index_coordinates: list[dict[str, Any]] | None = None,
         dimension_range_map: list[dict[str, Any]] | None = None,
-    ) -> pd.DataFrame:
+        output: Literal["pandas", "arrow", "polars"] = "pandas",
+    ) -> Any:
+        if output not in READ_OUTPUTS:
+            raise ValueError(f"output must be one of {READ_OUTPUTS}, got {output!r}")
         df = data_node_update.get_data_between_dates_from_api(
             start_date=start_date,
             end_date=end_date,
@@ -826,25 +829,22 @@ class TimeScaleDB(_DataSource):
                 logger.warning(
                     f"No data returned from remote API for {data_node_update.update_hash}"
                 )
+        else:
+            time_index_name, index_names, column_dtypes_map = (
+                data_node_update.data_node_storage._require_time_indexed_table_contract()
+            )
+            compile_codec_plan(column_dtypes_map, time_index_name=time_index_name).decode_frame(df)
+            df = df.set_index(index_names)
+        if output == "pandas":
             return df
 
-        time_index_name, index_names, column_dtypes_map = (
-            data_node_update.data_node_storage._require_time_indexed_table_contract()
-        )
-        df[time_index_name] = token_to_pandas_series(
-            df[time_index_name],
-            TIMESTAMP_TZ,
-            is_time_index=True,
+        import pyarrow as pa
+
+        if len(df) == 0:
+            return arrow_to_read_output(pa.table({}), output)
+        return arrow_to_read_output(
+            pa.Table.from_pandas(df.reset_index(), preserve_index=False), output
         )
-        for c, c_type in column_dtypes_map.items():
-            if c in df.columns:
-                df[c] = token_to_pandas_series(
-                    df[c],
-                    c_type,
-                    is_time_index=c == time_index_name,
-                )
-        df = df.set_index(index_names)
-        return df
 
 
 class DynamicResource(BasePydanticModel, BaseObjectOrm):
@@ -757,15 +757,13 @@ def is_process_running(pid: int) -> bool:
 
 
 def set_types_in_table(df, column_types):
-    from mainsequence.client.dtype_codec import token_to_pandas_series
+    from mainsequence.client.dtype_codec import compile_codec_plan
 
     index_cols = [name for name in df.index.names if name is not None]
     if index_cols:
         df = df.reset_index()
 
-    for c, col_type in column_types.items():
-        if c in df.columns:
-            df[c] = token_to_pandas_series(df[c], col_type)
+    compile_codec_plan(column_types).decode_frame(df)
 
     if index_cols:
         df = df.set_index(index_cols)
@@ -773,6 +771,10 @@ def set_types_in_table(df, column_types):
 
 
 def serialize_to_json(kwargs):
+    # Containers referenced more than once (e.g. stats shared by every column) are
+    # converted once; the (value, result) pairs keep the ids valid for the call.
+    converted_by_id = {}
+
     def to_jsonable(v):
         if isinstance(v, Decimal):
             return str(v)
@@ -794,10 +796,16 @@ def serialize_to_json(kwargs):
             except TypeError:
                 return v.model_dump()
 
-        if isinstance(v, dict):
-            return {to_json_key(k): to_jsonable(x) for k, x in v.items()}
-        if isinstance(v, (list, tuple)):
-            return [to_jsonable(x) for x in v]
+        if isinstance(v, (dict, list, tuple)):
+            cached = converted_by_id.get(id(v))
+            if cached is not None:
+                return cached[1]
+            if isinstance(v, dict):
+                converted = {to_json_key(k): to_jsonable(x) for k, x in v.items()}
+            else:
+                converted = [to_jsonable(x) for x in v]
+            converted_by_id[id(v)] = (v, converted)
+            return converted
 
         return v
 
@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import asdict
 from functools import wraps
 from typing import Any, Union
@@ -14,6 +14,7 @@ import structlog.contextvars as cvars
 
 import mainsequence.meta_tables.data_nodes.build_operations as build_operations
 import mainsequence.meta_tables.data_nodes.run_operations as run_operations
+from mainsequence.client.data_sources_interfaces import DEFAULT_BATCH_ROWS
 from mainsequence.client.metatables import (
     BaseUpdateStatistics,
     DataNodeUpdate,
@@ -112,12 +113,16 @@ class DataAccessMixin:
         index_coordinates: list[dict] | None = None,
         dimension_range_map: list[dict] | None = None,
         columns: list[str] | None = None,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+    ) -> Any:
         """Retrieve rows using time bounds and explicit time-index dimensions.
 
         `dimension_filters`, `index_coordinates`, and `dimension_range_map`
         are the only identity-scoping inputs accepted by the MetaTables core.
         Domain specific helpers should live outside the package core.
+
+        `output="arrow"` returns a `pyarrow.Table` and `output="polars"` a Polars
+        DataFrame, both with the index columns as regular columns.
         """
         return self.local_persist_manager.get_df_between_dates(
             start_date=start_date,
@@ -128,6 +133,40 @@ class DataAccessMixin:
             index_coordinates=index_coordinates,
             dimension_range_map=dimension_range_map,
             columns=columns,
+            output=output,
+        )
+
+    def iter_df_between_dates(
+        self,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        great_or_equal: bool = True,
+        less_or_equal: bool = True,
+        dimension_filters: dict[str, list] | None = None,
+        index_coordinates: list[dict] | None = None,
+        dimension_range_map: list[dict] | None = None,
+        columns: list[str] | None = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        output: str = "pandas",
+    ) -> Iterator[Any]:
+        """Stream the rows of `get_df_between_dates` in batches of at most `batch_rows`.
+
+        Only one batch is held in memory at a time and, unlike `get_df_between_dates`,
+        local reads are not truncated by the read row limit. Pandas batches are typed and
+        indexed like `get_df_between_dates`; `output="arrow"` yields `pyarrow.RecordBatch`
+        objects with the index columns as regular columns.
+        """
+        return self.local_persist_manager.iter_df_between_dates(
+            start_date=start_date,
+            end_date=end_date,
+            great_or_equal=great_or_equal,
+            less_or_equal=less_or_equal,
+            dimension_filters=dimension_filters,
+            index_coordinates=index_coordinates,
+            dimension_range_map=dimension_range_map,
+            columns=columns,
+            batch_rows=batch_rows,
+            output=output,
         )
 
 
@@ -435,6 +474,8 @@ class DataNode(DataAccessMixin, ABC):
 
     OFFSET_START = datetime.datetime(2018, 1, 1, tzinfo=datetime.UTC)
     DATA_NODE_UPDATE_CLASS = DataNodeUpdate
+    # "full" or "sampled"; see ``UpdateRunner.validate_data_frame``.
+    VALIDATION_LEVEL = "full"
 
     def __init__(
         self,
@@ -1053,6 +1094,7 @@ class DataNode(DataAccessMixin, ABC):
             temp_df,
             class_type,
             meta_table=self.storage_metadata,
+            validation_level=self.VALIDATION_LEVEL,
         )
 
     def _execute_local_update(
@@ -3,16 +3,21 @@ from __future__ import annotations
 import hashlib
 import inspect
 import threading
+from collections.abc import Iterator
 from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Any, ClassVar
 
 import pandas as pd
 
+from mainsequence.client.data_sources_interfaces import (
+    BATCH_OUTPUTS,
+    READ_OUTPUTS,
+    arrow_to_read_output,
+)
 from mainsequence.client.dtype_codec import (
-    TIMESTAMP_TZ,
+    compile_codec_plan,
     sqlalchemy_type_to_token,
-    token_to_pandas_series,
 )
 from mainsequence.client.metatables import (
     DUCK_DB,
@@ -711,13 +716,20 @@ class BasePersistManager:
     def protect_from_deletion(self, protect_from_deletion: bool = True) -> None:
         self.storage_metadata.patch(protect_from_deletion=protect_from_deletion)
 
-    def get_df_between_dates(self, *args, **kwargs) -> pd.DataFrame:
+    def get_df_between_dates(self, *args, **kwargs) -> Any:
         return self.data_source.get_data_by_time_index(
             *args,
             data_node_update=self.data_node_update,
             **kwargs,
         )
 
+    def iter_df_between_dates(self, *args, **kwargs) -> Iterator[Any]:
+        return self.data_source.iter_data_by_time_index(
+            *args,
+            data_node_update=self.data_node_update,
+            **kwargs,
+        )
+
     def get_last_observation(
         self,
         *,
@@ -735,14 +747,14 @@ class BasePersistManager:
         class_type = self.data_source.class_type
         if class_type in LOCAL_DATA_SOURCE_CLASS_TYPES:
             from mainsequence.client.data_sources_interfaces import (
-                get_duckdb_interface_class,
-                get_sqlite_interface_class,
+                get_duckdb_interface,
+                get_sqlite_interface,
             )
 
             if class_type == DUCK_DB:
-                db_interface = get_duckdb_interface_class()()
+                db_interface = get_duckdb_interface()
             elif class_type == SQLITE:
-                db_interface = get_sqlite_interface_class()()
+                db_interface = get_sqlite_interface()
             else:
                 raise ValueError(f"Unsupported local DataSource class_type: {class_type!r}")
             db_interface.drop_table(self.storage_metadata.physical_table_name)
@@ -849,28 +861,48 @@ class APIPersistManager:
         )
         return last_observation
 
-    def get_df_between_dates(self, *args, **kwargs) -> pd.DataFrame:
+    def get_df_between_dates(self, *args, output: str = "pandas", **kwargs) -> Any:
+        if output not in READ_OUTPUTS:
+            raise ValueError(f"output must be one of {READ_OUTPUTS}, got {output!r}")
         filtered_data = self.storage_table.get_data_between_dates_from_api(*args, **kwargs)
-        if filtered_data.empty:
+        if not filtered_data.empty:
+            filtered_data = self._type_filtered_data(filtered_data, columns=kwargs.get("columns"))
+        if output == "pandas":
             return filtered_data
 
+        import pyarrow as pa
+
+        if filtered_data.empty:
+            return arrow_to_read_output(pa.table({}), output)
+        return arrow_to_read_output(
+            pa.Table.from_pandas(filtered_data.reset_index(), preserve_index=False), output
+        )
+
+    def iter_df_between_dates(
+        self,
+        *args,
+        output: str = "pandas",
+        **kwargs,
+    ) -> Iterator[Any]:
+        if output not in BATCH_OUTPUTS:
+            raise ValueError(f"output must be one of {BATCH_OUTPUTS}, got {output!r}")
+        for batch in self.storage_table.iter_data_between_dates_from_api(*args, **kwargs):
+            batch = self._type_filtered_data(batch, columns=kwargs.get("columns"))
+            if output == "arrow":
+                import pyarrow as pa
+
+                yield pa.RecordBatch.from_pandas(batch.reset_index(), preserve_index=False)
+            else:
+                yield batch
+
+    def _type_filtered_data(
+        self, filtered_data: pd.DataFrame, columns: list[str] | None = None
+    ) -> pd.DataFrame:
         time_index_name, index_names, column_dtypes_map = (
             self.storage_table._require_time_indexed_table_contract()
         )
-        filtered_data[time_index_name] = token_to_pandas_series(
-            filtered_data[time_index_name],
-            TIMESTAMP_TZ,
-            is_time_index=True,
-        )
-        column_filter = kwargs.get("columns") or column_dtypes_map.keys()
-        for c in column_filter:
-            c_type = column_dtypes_map[c]
-            if c in filtered_data.columns:
-                filtered_data[c] = token_to_pandas_series(
-                    filtered_data[c],
-                    c_type,
-                    is_time_index=c == time_index_name,
-                )
+        plan = compile_codec_plan(column_dtypes_map, time_index_name=time_index_name)
+        plan.decode_frame(filtered_data, columns=columns)
         filtered_data = filtered_data.set_index(index_names)
 
         return filtered_data
@@ -4,8 +4,10 @@ from __future__ import annotations
 import datetime
 import gc
 import json
+import os
 import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -43,6 +45,16 @@ class DependencyUpdateError(Exception):
 LocalUpdateResult = None | pd.DataFrame | Sequence[Any]
 
 
+# `validate_data_frame` levels: "full" checks every value of every declared column;
+# "sampled" checks at most VALIDATION_SAMPLE_ROWS rows of each, for trusted producers.
+VALIDATION_LEVELS = ("full", "sampled")
+VALIDATION_SAMPLE_ROWS = 10_000
+# Frames with at least this many rows validate their declared columns on a thread pool.
+VALIDATION_PARALLEL_MIN_ROWS = 100_000
+_JSON_VALIDATION_CHUNK_ROWS = 50_000
+_UUID_HEX_RE = r"[0-9a-fA-F]{32}"
+
+
 def _is_nullish(value: Any) -> bool:
     if value is None:
         return True
@@ -55,23 +67,48 @@ def _is_nullish(value: Any) -> bool:
     return False
 
 
-def _validate_json_compatible_values(column_name: str, values: Sequence[Any]) -> None:
-    for value in values:
-        if _is_nullish(value):
-            continue
-        try:
-            json.dumps(value, allow_nan=False)
-        except (TypeError, ValueError) as exc:
-            raise TypeError(
-                f"Column '{column_name}' is declared as json/jsonb but contains "
-                f"a non-JSON-serializable value: {value!r}"
-            ) from exc
+def _non_null_values(values: pd.Series) -> np.ndarray:
+    """Values `_is_nullish` keeps, as an object array in their original order."""
+    array = values.to_numpy(dtype=object)
+    return array[~pd.isna(array)]
 
 
-def _validate_uuid_compatible_values(column_name: str, values: Sequence[Any]) -> None:
-    for value in values:
-        if _is_nullish(value) or isinstance(value, UUID):
+def _validate_json_compatible_values(column_name: str, values: pd.Series) -> None:
+    candidates = _non_null_values(values)
+    for offset in range(0, len(candidates), _JSON_VALIDATION_CHUNK_ROWS):
+        chunk = candidates[offset : offset + _JSON_VALIDATION_CHUNK_ROWS].tolist()
+        try:
+            json.dumps(chunk, allow_nan=False)
             continue
+        except (TypeError, ValueError):
+            pass
+        # Some value in this chunk fails: find the first one for the error message.
+        for value in chunk:
+            try:
+                json.dumps(value, allow_nan=False)
+            except (TypeError, ValueError) as exc:
+                raise TypeError(
+                    f"Column '{column_name}' is declared as json/jsonb but contains "
+                    f"a non-JSON-serializable value: {value!r}"
+                ) from exc
+
+
+def _validate_uuid_compatible_values(column_name: str, values: pd.Series) -> None:
+    candidates = _non_null_values(values)
+    if pd.api.types.infer_dtype(candidates, skipna=False) not in {"string", "empty"}:
+        candidates = candidates[[not isinstance(value, UUID) for value in candidates]]
+    if not len(candidates):
+        return
+    # The normalization `UUID(str(value))` applies before requiring 32 hex digits.
+    hex_digits = (
+        pd.Series(candidates, dtype=object)
+        .astype(str)
+        .str.replace("urn:", "", regex=False)
+        .str.replace("uuid:", "", regex=False)
+        .str.strip("{}")
+        .str.replace("-", "", regex=False)
+    )
+    for value in candidates[~hex_digits.str.fullmatch(_UUID_HEX_RE).to_numpy(dtype=bool)]:
         try:
             UUID(str(value))
         except (TypeError, ValueError, AttributeError) as exc:
@@ -81,10 +118,13 @@ def _validate_uuid_compatible_values(column_name: str, values: Sequence[Any]) ->
             ) from exc
 
 
-def _validate_string_compatible_values(column_name: str, values: Sequence[Any]) -> None:
-    for value in values:
-        if _is_nullish(value):
-            continue
+def _validate_string_compatible_values(column_name: str, values: pd.Series) -> None:
+    if isinstance(values.dtype, pd.StringDtype):
+        return
+    candidates = _non_null_values(values)
+    if pd.api.types.infer_dtype(candidates, skipna=False) in {"string", "empty"}:
+        return
+    for value in candidates:
         if not isinstance(value, str):
             raise TypeError(
                 f"Column '{column_name}' is declared as string but contains "
@@ -92,12 +132,29 @@ def _validate_string_compatible_values(column_name: str, values: Sequence[Any])
             )
 
 
+def _validate_temporal_values(
+    column_name: str, declared_dtype: str, normalized_declared_dtype: str, values: pd.Series
+) -> None:
+    if normalized_declared_dtype == TIMESTAMP_TZ and isinstance(values.dtype, pd.DatetimeTZDtype):
+        return
+    if normalized_declared_dtype == DATE and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return
+    for value in values.tolist():
+        try:
+            serialize_remote_value(value, normalized_declared_dtype)
+        except Exception as exc:
+            raise TypeError(
+                f"Column '{column_name}' is declared as {declared_dtype} "
+                f"but contains an incompatible temporal value: {value!r}"
+            ) from exc
+
+
 def _validate_declared_record_dtype(
     *,
     column_name: str,
     declared_dtype: str,
     actual_dtype: Any,
-    values: Sequence[Any],
+    values: pd.Series,
     remote_dtypes: bool = True,
     allow_naive_datetime: bool = False,
 ) -> None:
@@ -113,14 +170,7 @@ def _validate_declared_record_dtype(
         _validate_uuid_compatible_values(column_name, values)
         return
     if normalized_declared_dtype in {DATE, TIMESTAMP_TZ}:
-        for value in values:
-            try:
-                serialize_remote_value(value, normalized_declared_dtype)
-            except Exception as exc:
-                raise TypeError(
-                    f"Column '{column_name}' is declared as {declared_dtype} "
-                    f"but contains an incompatible temporal value: {value!r}"
-                ) from exc
+        _validate_temporal_values(column_name, declared_dtype, normalized_declared_dtype, values)
         return
 
     try:
@@ -425,16 +475,25 @@ class UpdateRunner:
         df: pd.DataFrame,
         storage_class_type,
         meta_table: Any | None = None,
+        validation_level: str = "full",
     ) -> None:
         """
         Performs a series of critical checks on the DataFrame before persistence.
 
         Args:
             df: The DataFrame returned from the DataNode's update method.
+            validation_level: ``"full"`` checks every value of each declared column;
+                ``"sampled"`` checks at most ``VALIDATION_SAMPLE_ROWS`` rows (the first,
+                the last and a fixed random draw in between). Dtype, index and column-name
+                checks always cover the whole frame.
 
         Raises:
             AssertionError or Exception if any validation check fails.
         """
+        if validation_level not in VALIDATION_LEVELS:
+            raise ValueError(
+                f"validation_level must be one of {VALIDATION_LEVELS}, got {validation_level!r}"
+            )
         # Check for infinite values
         df.replace([np.inf, -np.inf], np.nan, inplace=True)
 
@@ -483,15 +542,26 @@ class UpdateRunner:
                 f"{missing_record_columns}"
             )
 
-        for column_name, declared_dtype in column_dtypes_map.items():
+        rows = None
+        if validation_level == "sampled" and len(df) > VALIDATION_SAMPLE_ROWS:
+            edge = VALIDATION_SAMPLE_ROWS // 4
+            middle = edge + np.random.default_rng(0).choice(
+                len(df) - 2 * edge,
+                size=VALIDATION_SAMPLE_ROWS - 2 * edge,
+                replace=False,
+            )
+            rows = np.concatenate(
+                [np.arange(edge), np.sort(middle), np.arange(len(df) - edge, len(df))]
+            )
+
+        def validate_column(column_name: str, declared_dtype: str) -> None:
             if column_name in frame_columns:
-                frame_column_name = frame_column_lookup[column_name]
-                values = df[frame_column_name].tolist()
-                actual_dtype = df[frame_column_name].dtype
+                values = df[frame_column_lookup[column_name]]
             else:
-                index_values = df.index.get_level_values(column_name)
-                values = index_values.tolist()
-                actual_dtype = index_values.dtype
+                values = pd.Series(df.index.get_level_values(column_name), copy=False)
+            actual_dtype = values.dtype
+            if rows is not None:
+                values = values.iloc[rows]
 
             _validate_declared_record_dtype(
                 column_name=column_name,
@@ -502,6 +572,23 @@ class UpdateRunner:
                 allow_naive_datetime=is_local_storage,
             )
 
+        if len(df) < VALIDATION_PARALLEL_MIN_ROWS or len(column_dtypes_map) < 2:
+            for column_name, declared_dtype in column_dtypes_map.items():
+                validate_column(column_name, declared_dtype)
+            return
+
+        # Columns are independent; results are read in declaration order so the same
+        # column's error is raised as in a sequential pass.
+        with ThreadPoolExecutor(
+            max_workers=min(len(column_dtypes_map), os.cpu_count() or 1, 8)
+        ) as executor:
+            futures = [
+                executor.submit(validate_column, column_name, declared_dtype)
+                for column_name, declared_dtype in column_dtypes_map.items()
+            ]
+            for future in futures:
+                future.result()
+
     @tracer.start_as_current_span("UpdateRunner._update_local")
     def _update_local(
         self,
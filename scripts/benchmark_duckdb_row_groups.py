@@ -0,0 +1,105 @@
+"""Measure Parquet row-group skipping for per-asset reads under each DuckDB row order.
+
+Builds the same multi-asset table once per `PartitionSpec.row_order` and reports, for a
+sample of single-asset reads, the share of row groups whose `asset_uid` min/max statistics
+exclude the asset (so the reader can skip them) and the mean read time.
+
+    python scripts/benchmark_duckdb_row_groups.py --assets 2000 --days 30 --row-group-size 20000
+"""
+
+import argparse
+import datetime
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from mainsequence.client.data_sources_interfaces.duckdb import DuckDBInterface
+from mainsequence.client.data_sources_interfaces.partitioning import ROW_ORDERS, PartitionSpec
+
+INDEX_NAMES = ["time_index", "asset_uid"]
+
+
+def multi_asset_frame(assets: int, days: int, bars_per_day: int) -> pd.DataFrame:
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    times = pd.date_range(start, periods=days * bars_per_day, freq=f"{1440 // bars_per_day}min")
+    asset_uids = np.array([f"asset-{i:05d}" for i in range(assets)])
+    return pd.DataFrame(
+        {
+            "time_index": np.repeat(times, assets),
+            "asset_uid": np.tile(asset_uids, len(times)),
+            "close": np.random.default_rng(0).random(len(times) * assets),
+        }
+    )
+
+
+def row_group_skip_rate(table_root: Path, column: str, values: list[str]) -> float:
+    """Share of (row group, value) pairs that min/max statistics on `column` rule out."""
+    skipped = total = 0
+    for path in table_root.rglob("*.parquet"):
+        metadata = pq.ParquetFile(path).metadata
+        col_idx = metadata.schema.names.index(column)
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(col_idx).statistics
+            for value in values:
+                total += 1
+                if (
+                    stats is not None
+                    and stats.has_min_max
+                    and not (stats.min <= value <= stats.max)
+                ):
+                    skipped += 1
+    return skipped / total if total else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--bars-per-day", type=int, default=24)
+    parser.add_argument("--row-group-size", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    df = multi_asset_frame(args.assets, args.days, args.bars_per_day)
+    sample = random.Random(0).sample(sorted(df["asset_uid"].unique()), args.samples)
+    print(f"{len(df):,} rows, {args.assets} assets, row groups of {args.row_group_size:,} rows")
+    print(f"{'row_order':<10} {'files':>6} {'row groups':>11} {'skip rate':>10} {'read ms':>9}")
+
+    for row_order in ROW_ORDERS:
+        with tempfile.TemporaryDirectory() as tmp:
+            interface = DuckDBInterface(db_path=tmp)
+            spec = PartitionSpec(row_order=row_order, row_group_size=args.row_group_size)
+            interface.upsert(
+                df,
+                table="bench",
+                index_names=INDEX_NAMES,
+                time_index_name="time_index",
+                partition_spec=spec,
+            )
+            table_root = Path(tmp) / "bench"
+            files = list(table_root.rglob("*.parquet"))
+            row_groups = sum(pq.ParquetFile(path).metadata.num_row_groups for path in files)
+            skip_rate = row_group_skip_rate(table_root, "asset_uid", sample)
+
+            started = time.perf_counter()
+            for asset_uid in sample:
+                interface.read(
+                    table="bench",
+                    index_names=INDEX_NAMES,
+                    time_index_name="time_index",
+                    dimension_filters={"asset_uid": [asset_uid]},
+                )
+            read_ms = (time.perf_counter() - started) * 1000 / len(sample)
+            interface.close()
+        print(
+            f"{row_order:<10} {len(files):>6} {row_groups:>11} {skip_rate:>10.1%} {read_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Time prepare_dataframe_for_remote_write against the former per-value serialization.
+
+Builds a wide multi-asset frame with UTC timestamps, dates, UUID and string identifiers,
+nullable integers and floats, then times the vectorized codec-plan encoding and, for
+reference, the loop that called `serialize_remote_value` on every cell.
+
+    python scripts/benchmark_remote_write_encoding.py --rows 1000000 --float-columns 20
+"""
+
+import argparse
+import datetime
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from mainsequence.client.dtype_codec import (
+    normalize_column_dtypes_map,
+    prepare_dataframe_for_remote_write,
+    serialize_remote_value,
+)
+
+
+def wide_frame(rows: int, assets: int, float_columns: int) -> tuple[pd.DataFrame, dict]:
+    rng = np.random.default_rng(0)
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    times = pd.date_range(start, periods=-(-rows // assets), freq="1min")
+    asset_ids = [uuid.UUID(int=i) for i in range(assets)]
+    volume = pd.array(rng.integers(0, 1_000, rows), dtype="Int64")
+    volume[::17] = pd.NA
+    df = pd.DataFrame(
+        {
+            "time_index": np.repeat(times, assets)[:rows],
+            "asset_uid": np.tile(np.array(asset_ids, dtype=object), len(times))[:rows],
+            "venue": np.tile(["XNYS", "XNAS", None], -(-rows // 3))[:rows],
+            "session": np.repeat(times.normalize().tz_localize(None), assets)[:rows],
+            "volume": volume,
+        }
+    )
+    for i in range(float_columns):
+        df[f"f{i}"] = rng.random(rows)
+    column_dtypes_map = {
+        "time_index": "timestamp with time zone",
+        "asset_uid": "uuid",
+        "venue": "string",
+        "session": "date",
+        "volume": "bigint",
+        **{f"f{i}": "float64" for i in range(float_columns)},
+    }
+    return df, column_dtypes_map
+
+
+def legacy_prepare(df: pd.DataFrame, column_dtypes_map: dict) -> pd.DataFrame:
+    """The per-cell serialization `prepare_dataframe_for_remote_write` used to run."""
+    normalized_map = normalize_column_dtypes_map(column_dtypes_map, remote=True)
+    prepared = df.copy()
+    for column_name, token in normalized_map.items():
+        if column_name in prepared.columns:
+            prepared[column_name] = [
+                serialize_remote_value(value, token) for value in prepared[column_name].tolist()
+            ]
+    return prepared
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--float-columns", type=int, default=10)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    df, column_dtypes_map = wide_frame(args.rows, args.assets, args.float_columns)
+    print(f"{len(df):,} rows x {len(df.columns)} columns")
+    print(f"{'path':<12} {'seconds':>9} {'rows/s':>12}")
+
+    runs = [("vectorized", prepare_dataframe_for_remote_write)]
+    if not args.skip_legacy:
+        runs.append(("per-value", legacy_prepare))
+    for label, prepare in runs:
+        started = time.perf_counter()
+        if prepare is legacy_prepare:
+            prepare(df, column_dtypes_map)
+        else:
+            prepare(df, column_dtypes_map=column_dtypes_map, time_index_name="time_index")
+        elapsed = time.perf_counter() - started
+        print(f"{label:<12} {elapsed:>9.2f} {len(df) / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Time the main SQLiteInterface read shapes with and without the identity-leading index.
+
+Builds one multi-asset table, then times each read shape twice: with only the time-leading
+UNIQUE index and no planner statistics, and with the `(identity..., time)` index plus
+`ANALYZE`, as `upsert` now maintains them.
+
+    python scripts/benchmark_sqlite_reads.py --assets 2000 --bars 500
+"""
+
+import argparse
+import datetime
+import random
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from mainsequence.client.data_sources_interfaces.sqlite import SQLiteInterface
+
+INDEX_NAMES = ["time_index", "asset_uid"]
+
+
+def multi_asset_frame(assets: int, bars: int) -> pd.DataFrame:
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    times = pd.date_range(start, periods=bars, freq="1h")
+    return pd.DataFrame(
+        {
+            "time_index": np.repeat(times, assets),
+            "asset_uid": np.tile([f"asset-{i:05d}" for i in range(assets)], bars),
+            "close": np.random.default_rng(0).random(bars * assets),
+        }
+    )
+
+
+def read_shapes(df: pd.DataFrame, samples: int) -> dict[str, dict]:
+    times = df["time_index"].drop_duplicates().sort_values().tolist()
+    assets = random.Random(0).sample(sorted(df["asset_uid"].unique()), samples)
+    window_start, window_end = times[len(times) // 2], times[len(times) // 2 + 24]
+    return {
+        "time window": {"start": window_start, "end": window_end},
+        "one asset": {"dimension_filters": {"asset_uid": assets[:1]}},
+        "asset list": {"dimension_filters": {"asset_uid": assets}},
+        "coordinates": {"index_coordinates": [{"asset_uid": asset} for asset in assets]},
+        "range map": {
+            "dimension_range_map": [
+                {"coordinate": {"asset_uid": asset}, "start_date": window_start} for asset in assets
+            ]
+        },
+    }
+
+
+def time_reads(interface: SQLiteInterface, shapes: dict[str, dict], repeat: int) -> dict:
+    timings = {}
+    for label, filters in shapes.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            interface.read(
+                table="bench", index_names=INDEX_NAMES, time_index_name="time_index", **filters
+            )
+        timings[label] = (time.perf_counter() - started) * 1000 / repeat
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=2000)
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = multi_asset_frame(args.assets, args.bars)
+    shapes = read_shapes(df, args.samples)
+    print(f"{len(df):,} rows, {args.assets} assets, {args.bars} bars")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        interface = SQLiteInterface(db_path=tmp)
+        interface.upsert(df, table="bench", index_names=INDEX_NAMES, time_index_name="time_index")
+        con = interface.con
+        index_name = interface._qident(interface._identity_index_name("bench"))
+
+        con.execute(f"DROP INDEX {index_name}")
+        con.execute("DELETE FROM sqlite_stat1")
+        con.execute("ANALYZE sqlite_schema")
+        baseline = time_reads(interface, shapes, args.repeat)
+
+        interface._indexed_tables.discard("bench")
+        interface._ensure_identity_index(
+            "bench", index_names=INDEX_NAMES, time_index_name="time_index"
+        )
+        con.execute('ANALYZE "bench"')
+        indexed = time_reads(interface, shapes, args.repeat)
+        interface.close()
+
+    print(f"{'shape':<12} {'unique only ms':>15} {'identity idx ms':>16} {'speedup':>8}")
+    for label in shapes:
+        speedup = baseline[label] / indexed[label]
+        print(f"{label:<12} {baseline[label]:>15.1f} {indexed[label]:>16.1f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Measure SQLiteInterface.upsert throughput against the former row-by-row conversion.
+
+Builds a multi-asset frame with float, nullable integer, boolean and string columns, then
+times `upsert` into a fresh table and, for reference, the pre-vectorization path that
+converted every cell with `_sqlite_value` inside a `df.iterrows()` loop.
+
+    python scripts/benchmark_sqlite_upsert.py --rows 1000000
+"""
+
+import argparse
+import datetime
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from mainsequence.client.data_sources_interfaces.sqlite import SQLiteInterface
+
+INDEX_NAMES = ["time_index", "asset_uid"]
+
+
+def multi_asset_frame(rows: int, assets: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    times = pd.date_range(start, periods=-(-rows // assets), freq="1min")
+    volume = pd.array(rng.integers(0, 1_000, rows), dtype="Int64")
+    volume[::17] = pd.NA
+    return pd.DataFrame(
+        {
+            "time_index": np.repeat(times, assets)[:rows],
+            "asset_uid": np.tile([f"asset-{i:05d}" for i in range(assets)], len(times))[:rows],
+            "close": rng.random(rows),
+            "volume": volume,
+            "halted": rng.random(rows) < 0.01,
+        }
+    )
+
+
+def legacy_upsert(interface: SQLiteInterface, df: pd.DataFrame, table: str) -> None:
+    """The row-by-row conversion `upsert` used before it converted whole columns."""
+    df = df.copy()
+    df["time_index"] = df["time_index"].map(interface._to_time_storage)
+    with interface.con:
+        interface._ensure_table(
+            table=table, df=df, index_names=INDEX_NAMES, time_index_name="time_index"
+        )
+        columns = list(df.columns)
+        value_columns = [column for column in columns if column not in INDEX_NAMES]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(INDEX_NAMES)}) DO UPDATE SET "
+            + ", ".join(f"{column} = excluded.{column}" for column in value_columns)
+        )
+        rows = [
+            tuple(interface._sqlite_value(row[column]) for column in columns)
+            for _, row in df.iterrows()
+        ]
+        interface.con.executemany(sql, rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    df = multi_asset_frame(args.rows, args.assets)
+    print(f"{len(df):,} rows, {args.assets} assets")
+    print(f"{'path':<12} {'seconds':>9} {'rows/s':>12}")
+
+    runs = [("vectorized", None)]
+    if not args.skip_legacy:
+        runs.append(("row-by-row", legacy_upsert))
+    for label, legacy in runs:
+        with tempfile.TemporaryDirectory() as tmp:
+            interface = SQLiteInterface(db_path=tmp)
+            started = time.perf_counter()
+            if legacy is None:
+                interface.upsert(
+                    df, table="bench", index_names=INDEX_NAMES, time_index_name="time_index"
+                )
+            else:
+                legacy(interface, df, "bench")
+            elapsed = time.perf_counter() - started
+            interface.close()
+        print(f"{label:<12} {elapsed:>9.2f} {len(df) / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare upload chunk size and encode time across the insert-data-into-table wire formats.
+
+Builds a wide multi-asset frame, then encodes it chunk by chunk as
+`post_data_frame_in_chunks` would for each wire format: codec-plan JSON records streamed
+through gzip into a base64 request body, and the zstd Arrow IPC stream and Parquet bodies.
+
+    python scripts/benchmark_upload_wire_formats.py --rows 1000000 --float-columns 20
+"""
+
+import argparse
+import datetime
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from mainsequence.client.metatables.core import (
+    UPLOAD_WIRE_FORMATS,
+    _encode_binary_upload_chunk,
+    _gzip_json_records,
+    _JSONUploadBody,
+)
+
+
+def wide_frame(rows: int, assets: int, float_columns: int) -> tuple[pd.DataFrame, dict]:
+    rng = np.random.default_rng(0)
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    times = pd.date_range(start, periods=-(-rows // assets), freq="1min")
+    asset_ids = [uuid.UUID(int=i) for i in range(assets)]
+    volume = pd.array(rng.integers(0, 1_000, rows), dtype="Int64")
+    volume[::17] = pd.NA
+    df = pd.DataFrame(
+        {
+            "time_index": np.repeat(times, assets)[:rows],
+            "asset_uid": np.tile(np.array(asset_ids, dtype=object), len(times))[:rows],
+            "session": np.repeat(times.normalize().tz_localize(None), assets)[:rows],
+            "volume": volume,
+        }
+    )
+    for i in range(float_columns):
+        df[f"f{i}"] = rng.random(rows)
+    column_dtypes_map = {
+        "time_index": "timestamp with time zone",
+        "asset_uid": "uuid",
+        "session": "date",
+        "volume": "bigint",
+        **{f"f{i}": "float64" for i in range(float_columns)},
+    }
+    return df, column_dtypes_map
+
+
+def encode_json(df_chunk: pd.DataFrame, column_dtypes_map: dict) -> int:
+    compressed = _gzip_json_records(
+        df_chunk, column_dtypes_map=column_dtypes_map, time_index_name="time_index"
+    )
+    return sum(len(piece) for piece in _JSONUploadBody(compressed, {"overwrite": False}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--float-columns", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    df, column_dtypes_map = wide_frame(args.rows, args.assets, args.float_columns)
+    chunks = [df.iloc[i : i + args.chunk_size] for i in range(0, len(df), args.chunk_size)]
+    print(f"{len(df):,} rows x {len(df.columns)} columns in {len(chunks)} chunk(s)")
+    print(f"{'format':<8} {'seconds':>9} {'rows/s':>12} {'MiB':>9} {'bytes/row':>10}")
+
+    for wire_format in UPLOAD_WIRE_FORMATS:
+        started = time.perf_counter()
+        total_bytes = 0
+        for chunk in chunks:
+            if wire_format == "json":
+                total_bytes += encode_json(chunk, column_dtypes_map)
+            else:
+                total_bytes += len(
+                    _encode_binary_upload_chunk(
+                        chunk,
+                        wire_format=wire_format,
+                        column_dtypes_map=column_dtypes_map,
+                        time_index_name="time_index",
+                    )
+                )
+        elapsed = time.perf_counter() - started
+        print(
+            f"{wire_format:<8} {elapsed:>9.2f} {len(df) / elapsed:>12,.0f} "
+            f"{total_bytes / 2**20:>9.1f} {total_bytes / len(df):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
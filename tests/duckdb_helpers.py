@@ -0,0 +1,48 @@
+"""Frames and table helpers shared by the DuckDB storage tests; every table is named "node"."""
+
+import datetime
+import json
+
+import pandas as pd
+
+from mainsequence.client.data_sources_interfaces.duckdb import MANIFEST_FILE_NAME, DuckDBInterface
+
+INDEX_NAMES = ["time_index", "asset_uid"]
+
+
+def dt(day: int, hour: int = 0) -> datetime.datetime:
+    return datetime.datetime(2026, 5, day, hour, tzinfo=datetime.UTC)
+
+
+def frame(
+    days: list[int], assets: list[str] = ("asset-1",), value: float = 1.0, hour: int = 0
+) -> pd.DataFrame:
+    rows = [(dt(day, hour), asset) for day in days for asset in assets]
+    return pd.DataFrame(
+        {
+            "time_index": [ts for ts, _ in rows],
+            "asset_uid": [asset for _, asset in rows],
+            "value": [value] * len(rows),
+        }
+    )
+
+
+def upsert(interface: DuckDBInterface, df: pd.DataFrame, **kwargs) -> None:
+    interface.upsert(
+        df, table="node", index_names=INDEX_NAMES, time_index_name="time_index", **kwargs
+    )
+
+
+def read(interface: DuckDBInterface, **kwargs) -> pd.DataFrame:
+    return interface.read(
+        table="node", index_names=INDEX_NAMES, time_index_name="time_index", **kwargs
+    )
+
+
+def parquet_fragments(tmp_path) -> list[str]:
+    root = tmp_path / "duckdb" / "node"
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*.parquet"))
+
+
+def read_manifest(tmp_path) -> dict:
+    return json.loads((tmp_path / "duckdb" / "node" / MANIFEST_FILE_NAME).read_text())
@@ -7391,6 +7391,60 @@ def test_data_node_storage_list(cli_mod, runner, monkeypatch):
     assert "Total data node storages: 1" in result.output
 
 
+def test_data_node_compact_local_runs_over_stored_tables(cli_mod, runner, monkeypatch):
+    calls = []
+
+    class _Interface:
+        db_path = "/tmp/duck_db"
+
+        def stored_tables(self):
+            return ["node_a", "node_b"]
+
+        def is_table_write_locked(self, table):
+            return False
+
+        def compact(self, table, *, min_fragments, target_file_rows):
+            calls.append((table, min_fragments, target_file_rows))
+            return {"partitions_compacted": 1, "files_deleted": 4, "files_written": 1}
+
+    from mainsequence.client import data_sources_interfaces
+
+    monkeypatch.setattr(
+        data_sources_interfaces, "get_duckdb_interface", lambda db_path: _Interface()
+    )
+
+    result = runner.invoke(cli_mod.app, ["data-node", "compact-local", "--min-fragments", "8"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [("node_a", 8, 5_000_000), ("node_b", 8, 5_000_000)]
+    assert "Compacted 2 local DuckDB table(s)" in result.output
+
+
+def test_data_node_compact_local_refuses_tables_being_written(cli_mod, runner, monkeypatch):
+    class _Interface:
+        db_path = "/tmp/duck_db"
+
+        def stored_tables(self):
+            return ["node_a", "node_b"]
+
+        def is_table_write_locked(self, table):
+            return table == "node_b"
+
+        def compact(self, table, **kwargs):
+            raise AssertionError("compaction must not start")
+
+    from mainsequence.client import data_sources_interfaces
+
+    monkeypatch.setattr(
+        data_sources_interfaces, "get_duckdb_interface", lambda db_path: _Interface()
+    )
+
+    result = runner.invoke(cli_mod.app, ["data-node", "compact-local"])
+
+    assert result.exit_code == 1
+    assert "node_b" in result.output
+
+
 def test_meta_table_list_uses_canonical_command(cli_mod, runner, monkeypatch):
     captured = {}
 
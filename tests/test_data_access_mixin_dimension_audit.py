@@ -201,6 +201,7 @@ def test_data_access_mixin_uses_explicit_dimension_filters(monkeypatch):
             "index_coordinates": None,
             "dimension_range_map": None,
             "columns": None,
+            "output": "pandas",
         }
     ]
 
@@ -335,3 +335,51 @@ def test_delete_after_date_sends_canonical_coordinate_scope(monkeypatch):
         },
         "timeout": 30,
     }
+
+
+def test_iter_data_between_dates_from_api_rebatches_pages_lazily(monkeypatch):
+    pages = {
+        0: {
+            "results": [{"time_index": "2026-05-01T00:00:00Z", "value": 1.0}] * 3,
+            "next_offset": 3,
+        },
+        3: {
+            "results": [{"time_index": "2026-05-01T01:00:00Z", "value": 2.0}] * 3,
+            "next_offset": 6,
+        },
+        6: {"results": [{"time_index": "2026-05-01T02:00:00Z", "value": 3.0}], "next_offset": None},
+    }
+    requested_offsets = []
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+        def __init__(self, body):
+            self._body = body
+
+        def json(self):
+            return self._body
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url):
+        requested_offsets.append(payload["json"]["offset"])
+        return FakeResponse(pages[payload["json"]["offset"]])
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.TimeIndexMetaTable,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+
+    batches = _storage(["time_index", "unique_identifier"]).iter_data_between_dates_from_api(
+        batch_rows=2
+    )
+    first = next(batches)
+    assert requested_offsets == [0]
+    assert len(first) == 2
+
+    rest = list(batches)
+    assert requested_offsets == [0, 3, 6]
+    assert [len(batch) for batch in rest] == [2, 2, 1]
+    assert rest[-1]["value"].tolist() == [3.0]
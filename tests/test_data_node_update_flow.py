@@ -1,15 +1,29 @@
 import base64
 import datetime
+import email.parser
+import email.policy
 import gzip
+import http.server
 import json
+import threading
+import time
+import tracemalloc
 from types import SimpleNamespace
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 import pytest
+import requests
 from pydantic import ValidationError
 
 from mainsequence.client import metatables as models_metatables
+from mainsequence.client.dtype_codec import prepare_dataframe_for_remote_write
+
+
+@pytest.fixture(autouse=True)
+def _isolated_upload_sizing(monkeypatch, tmp_path):
+    monkeypatch.setenv("TDAG_ROOT_PATH", str(tmp_path))
 
 
 def _dt(hour: int) -> datetime.datetime:
@@ -67,11 +81,26 @@ def _storage_with_source_config(
     )
 
 
+def _posted_json(captured_payload):
+    """The JSON document of a chunk upload, as the backend receives it."""
+    return json.loads(b"".join(captured_payload["data"]))
+
+
+def _decode_records(posted):
+    compressed = base64.b64decode(posted["data"])
+    return json.loads(gzip.decompress(compressed).decode("utf-8"))
+
+
 def _decode_compressed_payload(captured_payload):
     compressed = base64.b64decode(captured_payload["json"]["data"])
     return json.loads(gzip.decompress(compressed).decode("utf-8"))
 
 
+def _decode_chunk_upload(captured_payload):
+    """The records of a streamed JSON chunk upload."""
+    return _decode_records(_posted_json(captured_payload))
+
+
 def test_post_data_frame_in_chunks_serializes_remote_temporal_payload_columns(monkeypatch):
     captured = {}
 
@@ -117,7 +146,7 @@ def test_post_data_frame_in_chunks_serializes_remote_temporal_payload_columns(mo
         },
     )
 
-    decoded = _decode_compressed_payload(captured["payload"])
+    decoded = _decode_chunk_upload(captured["payload"])
     assert decoded == [
         {
             "time_index": "2026-05-01T00:00:00Z",
@@ -175,7 +204,7 @@ def test_post_data_frame_in_chunks_serializes_remote_uuid_payload_columns(monkey
         },
     )
 
-    decoded = _decode_compressed_payload(captured["payload"])
+    decoded = _decode_chunk_upload(captured["payload"])
     assert decoded == [
         {
             "time_index": "2026-05-29T13:40:00Z",
@@ -184,11 +213,12 @@ def test_post_data_frame_in_chunks_serializes_remote_uuid_payload_columns(monkey
             "quantity": 12.0,
         }
     ]
-    json.dumps(captured["payload"]["json"], allow_nan=False)
-    assert captured["payload"]["json"]["chunk_stats"]["index_progress"] == {
+    posted = _posted_json(captured["payload"])
+    json.dumps(posted, allow_nan=False)
+    assert posted["chunk_stats"]["index_progress"] == {
         str(account_uid): {"AAPL": "2026-05-29T13:40:00Z"}
     }
-    assert captured["payload"]["json"]["chunk_stats"]["index_min"] == {
+    assert posted["chunk_stats"]["index_min"] == {
         str(account_uid): {"AAPL": "2026-05-29T13:40:00Z"}
     }
 
@@ -466,6 +496,480 @@ def test_get_index_progress_chunk_stats_normalizes_uuid_coordinate_keys():
     assert grouped_dates is not None
 
 
+def test_compute_ingest_stats_matches_per_chunk_stats_and_flags_duplicates():
+    df = pd.DataFrame(
+        {
+            "time_index": [_dt(0), _dt(1), _dt(1), _dt(2), _dt(3)],
+            "account_uid": ["account-a", "account-b", "account-a", None, "account-b"],
+            "unique_identifier": ["asset-1", "asset-1", "asset-2", "asset-1", "asset-1"],
+            "value": [1, 2, 3, 4, 5],
+        }
+    )
+    index_names = ["time_index", "account_uid", "unique_identifier"]
+
+    ingest_stats = models_metatables.compute_ingest_stats(
+        df, time_index_name="time_index", index_names=index_names
+    )
+
+    assert not ingest_stats.has_duplicates
+    assert ingest_stats.chunk_stats()["index_progress"] == {
+        "account-a": {"asset-1": _dt(0), "asset-2": _dt(1)},
+        "account-b": {"asset-1": _dt(3)},
+    }
+    for start, stop in [(0, 2), (2, 4), (4, 5), (1, 5)]:
+        expected, _ = models_metatables.get_index_progress_chunk_stats(
+            df.iloc[start:stop], time_index_name="time_index", index_names=index_names
+        )
+        assert ingest_stats.chunk_stats(start, stop) == expected
+
+    duplicated = pd.concat([df, df.iloc[[1]]], ignore_index=True)
+    assert models_metatables.compute_ingest_stats(
+        duplicated, time_index_name="time_index", index_names=index_names
+    ).has_duplicates
+    assert not models_metatables.compute_ingest_stats(
+        df.iloc[[1, 4]], time_index_name="time_index", index_names=["time_index"]
+    ).has_duplicates
+
+
+def test_post_data_frame_in_chunks_slices_precomputed_ingest_stats(monkeypatch):
+    chunk_stats = []
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url, time_out=None):
+        chunk_stats.append(_posted_json(payload)["chunk_stats"])
+        return FakeResponse()
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+    frame = pd.DataFrame(
+        {
+            "time_index": [_dt(0), _dt(1), _dt(2)],
+            "unique_identifier": ["asset-1", "asset-2", "asset-1"],
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+    index_names = ["time_index", "unique_identifier"]
+
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        chunk_size=2,
+        data_node_update=_minimal_update(),
+        index_names=index_names,
+        time_index_name="time_index",
+        ingest_stats=models_metatables.compute_ingest_stats(
+            frame, time_index_name="time_index", index_names=index_names
+        ),
+    )
+
+    assert chunk_stats == [
+        models_metatables.serialize_to_json(
+            models_metatables.get_index_progress_chunk_stats(
+                frame.iloc[start:stop], time_index_name="time_index", index_names=index_names
+            )[0]
+        )
+        for start, stop in [(0, 2), (2, 3)]
+    ]
+
+
+def test_post_data_frame_in_chunks_overlaps_middle_chunks(monkeypatch):
+    sent = []
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url, time_out=None):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+            posted = _posted_json(payload)
+            sent.append((posted["chunk_index"], posted["total_chunks"]))
+        return FakeResponse()
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+    frame = pd.DataFrame(
+        {"time_index": [_dt(hour) for hour in range(8)], "value": [float(v) for v in range(8)]}
+    )
+
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        chunk_size=1,
+        data_node_update=_minimal_update(),
+        index_names=["time_index"],
+        time_index_name="time_index",
+        max_in_flight=3,
+    )
+
+    assert sent[0] == (0, 8)
+    assert sent[-1] == (7, 8)
+    assert sorted(sent) == [(i, 8) for i in range(8)]
+    assert in_flight["peak"] == 3
+
+
+def test_post_data_frame_in_chunks_stops_after_first_failure(monkeypatch):
+    sent = []
+
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = "boom"
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url, time_out=None):
+        chunk_index = _posted_json(payload)["chunk_index"]
+        sent.append(chunk_index)
+        if chunk_index == 2:
+            raise requests.exceptions.ConnectionError("connection reset")
+        return FakeResponse(200)
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+    frame = pd.DataFrame(
+        {"time_index": [_dt(hour) for hour in range(12)], "value": [float(v) for v in range(12)]}
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+            serialized_data_frame=frame,
+            chunk_size=1,
+            data_node_update=_minimal_update(),
+            index_names=["time_index"],
+            time_index_name="time_index",
+            max_in_flight=2,
+        )
+
+    assert 2 in sent
+    assert 11 not in sent
+    assert len(sent) < 12
+
+
+class _InsertDataHandler(http.server.BaseHTTPRequestHandler):
+    """Stand-in insert-data-into-table endpoint that records each decoded chunk."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        content_type = self.headers["Content-Type"]
+        if not content_type.startswith("multipart/form-data"):
+            self.server.received.append(("json", json.loads(body)))
+        elif not self.server.accepts_binary:
+            self.send_response(415)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + body
+            )
+            parts = {
+                part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+                for part in message.iter_parts()
+            }
+            self.server.received.append(("binary", parts))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def insert_data_server(monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _InsertDataHandler)
+    server.accepts_binary = True
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "get_object_url",
+        classmethod(lambda cls: f"http://127.0.0.1:{server.server_port}/data-node-update"),
+    )
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: requests.Session()),
+    )
+    monkeypatch.setattr(models_metatables, "_JSON_ONLY_UPLOAD_ENDPOINTS", set())
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _wire_format_frame() -> tuple[pd.DataFrame, dict[str, str]]:
+    frame = pd.DataFrame(
+        {
+            "time_index": [_dt(hour) for hour in range(5)],
+            "account_uid": [UUID(int=i) for i in range(5)],
+            "session": [datetime.date(2026, 5, 1)] * 5,
+            "quantity": [1.0, None, 3.0, 4.0, 5.0],
+            "lots": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+        }
+    )
+    column_dtypes_map = {
+        "time_index": "timestamp with time zone",
+        "account_uid": "uuid",
+        "session": "date",
+        "quantity": "float64",
+        "lots": "bigint",
+    }
+    return frame, column_dtypes_map
+
+
+@pytest.mark.parametrize("wire_format", ["arrow", "parquet"])
+def test_post_data_frame_in_chunks_round_trips_binary_wire_formats(insert_data_server, wire_format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    frame, column_dtypes_map = _wire_format_frame()
+    index_names = ["time_index", "account_uid"]
+
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        chunk_size=2,
+        data_node_update=_minimal_update(),
+        index_names=index_names,
+        time_index_name="time_index",
+        column_dtypes_map=column_dtypes_map,
+        wire_format=wire_format,
+    )
+
+    chunks = sorted(
+        (fields for _, fields in insert_data_server.received),
+        key=lambda fields: int(fields["chunk_index"]),
+    )
+    assert [kind for kind, _ in insert_data_server.received] == ["binary"] * 3
+    assert [int(fields["total_chunks"]) for fields in chunks] == [3, 3, 3]
+    assert {fields["format"].decode() for fields in chunks} == {wire_format}
+    assert {fields["overwrite"].decode() for fields in chunks} == {"false"}
+    assert json.loads(chunks[1]["chunk_stats"]) == models_metatables.serialize_to_json(
+        models_metatables.get_index_progress_chunk_stats(
+            frame.iloc[2:4], time_index_name="time_index", index_names=index_names
+        )[0]
+    )
+    if wire_format == "arrow":
+        tables = [pa.ipc.open_stream(fields["data"]).read_all() for fields in chunks]
+    else:
+        tables = [pq.read_table(pa.BufferReader(fields["data"])) for fields in chunks]
+    expected = pa.table(
+        {
+            "time_index": pa.array(
+                [_dt(hour) for hour in range(5)], type=pa.timestamp("ns", tz="UTC")
+            ),
+            "account_uid": pa.array([str(UUID(int=i)) for i in range(5)]),
+            "session": pa.array([datetime.date(2026, 5, 1)] * 5, type=pa.date32()),
+            "quantity": pa.array([1.0, None, 3.0, 4.0, 5.0]),
+            "lots": pa.array([1, None, 3, 4, 5], type=pa.int64()),
+        }
+    )
+    assert pa.concat_tables(tables).equals(expected)
+
+
+def test_post_data_frame_in_chunks_falls_back_to_json_on_415(insert_data_server):
+    pytest.importorskip("pyarrow")
+    insert_data_server.accepts_binary = False
+    frame, column_dtypes_map = _wire_format_frame()
+
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        chunk_size=2,
+        data_node_update=_minimal_update(),
+        index_names=["time_index", "account_uid"],
+        time_index_name="time_index",
+        column_dtypes_map=column_dtypes_map,
+        wire_format="arrow",
+    )
+
+    assert [kind for kind, _ in insert_data_server.received] == ["json"] * 3
+    records = [
+        row
+        for _, fields in sorted(
+            insert_data_server.received, key=lambda item: item[1]["chunk_index"]
+        )
+        for row in _decode_records(fields)
+    ]
+    assert [row["account_uid"] for row in records] == [str(UUID(int=i)) for i in range(5)]
+    assert records[0]["time_index"] == "2026-05-01T00:00:00Z"
+    assert models_metatables._JSON_ONLY_UPLOAD_ENDPOINTS == {
+        models_metatables.DataNodeUpdate.get_object_url()
+    }
+    with pytest.raises(ValueError, match="Unsupported upload wire format"):
+        models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+            serialized_data_frame=frame,
+            data_node_update=_minimal_update(),
+            wire_format="csv",
+        )
+
+
+def _sized_upload(monkeypatch, frame, *, chunk_bytes, reject_over=None):
+    bodies = []
+
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = ""
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url, time_out=None):
+        body_bytes = len(_posted_json(payload)["data"])
+        if reject_over is not None and body_bytes > reject_over:
+            bodies.append((413, body_bytes))
+            return FakeResponse(413)
+        bodies.append((200, body_bytes))
+        return FakeResponse(200)
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        data_node_update=_minimal_update(),
+        index_names=["time_index"],
+        time_index_name="time_index",
+        chunk_bytes=chunk_bytes,
+        max_in_flight=1,
+    )
+    return bodies
+
+
+def _sizing_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time_index": pd.date_range("2026-05-01", periods=rows, freq="1min", tz="UTC"),
+            "label": [f"row-{i * 7919 % 100_003:06d}" for i in range(rows)],
+        }
+    )
+
+
+def test_post_data_frame_in_chunks_sizes_chunks_to_byte_budget(monkeypatch, tmp_path):
+    frame = _sizing_frame(6_000)
+
+    bodies = _sized_upload(monkeypatch, frame, chunk_bytes=20_000)
+
+    assert len(bodies) > 2
+    assert all(status == 200 and size <= 20_000 * 1.25 for status, size in bodies)
+    stored = json.loads((tmp_path / "upload_sizing.json").read_text())
+    assert stored["data-node-storage-44:json"]["bytes_per_row"] > 0
+    assert stored["data-node-storage-44:json"]["request_limit"] is None
+
+
+def test_post_data_frame_in_chunks_learns_request_limit_from_413(monkeypatch, tmp_path):
+    frame = _sizing_frame(6_000)
+
+    first = _sized_upload(monkeypatch, frame, chunk_bytes=60_000, reject_over=25_000)
+    second = _sized_upload(monkeypatch, frame, chunk_bytes=60_000, reject_over=25_000)
+
+    assert any(status == 413 for status, _ in first)
+    stored = json.loads((tmp_path / "upload_sizing.json").read_text())["data-node-storage-44:json"]
+    assert stored["request_limit"] > 25_000
+    assert stored["largest_accepted"] <= 25_000
+    assert all(status == 200 for status, _ in second)
+
+
+def test_post_data_frame_in_chunks_replans_an_oversized_first_chunk(monkeypatch, tmp_path):
+    frame = _sizing_frame(6_000)
+    (tmp_path / "upload_sizing.json").write_text(
+        json.dumps({"data-node-storage-44:json": {"bytes_per_row": 1.0}})
+    )
+    sent = []
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    def _fake_make_request(*, s, loaders, payload, r_type, url, time_out=None):
+        posted = _posted_json(payload)
+        sent.append((posted["chunk_index"], posted["total_chunks"], len(posted["data"])))
+        return FakeResponse()
+
+    monkeypatch.setattr(models_metatables, "make_request", _fake_make_request)
+    monkeypatch.setattr(
+        models_metatables.DataNodeUpdate,
+        "build_session",
+        classmethod(lambda cls: object()),
+    )
+    models_metatables.DataNodeUpdate.post_data_frame_in_chunks(
+        serialized_data_frame=frame,
+        data_node_update=_minimal_update(),
+        index_names=["time_index"],
+        time_index_name="time_index",
+        chunk_bytes=10_000,
+        max_in_flight=1,
+    )
+
+    total_chunks = sent[0][1]
+    assert total_chunks > 2
+    assert [(index, total) for index, total, _ in sent] == [
+        (index, total_chunks) for index in range(total_chunks)
+    ]
+    assert all(size <= 10_000 * 1.25 for _, _, size in sent)
+
+
+def test_json_upload_body_streams_within_the_compressed_size(monkeypatch):
+    # Small slices keep the per-slice working set well below the compressed size, so an
+    # extra copy of the compressed bytes would exceed the bound.
+    monkeypatch.setattr(models_metatables, "_STREAM_SLICE_BYTES", 2**15)
+    rows = 100_000
+    frame = pd.DataFrame(
+        {
+            "time_index": pd.date_range("2026-01-01", periods=rows, freq="1min", tz="UTC"),
+            "asset": [f"asset-{i % 100:03d}" for i in range(rows)],
+            "close": np.random.default_rng(0).random(rows),
+            "volume": pd.array([i % 1_000 for i in range(rows)], dtype="Int64"),
+        }
+    )
+    column_dtypes_map = {
+        "time_index": "timestamp with time zone",
+        "asset": "string",
+        "close": "float64",
+        "volume": "bigint",
+    }
+    raw_json = prepare_dataframe_for_remote_write(
+        frame, column_dtypes_map=column_dtypes_map, time_index_name="time_index"
+    ).to_json(orient="records", date_format="iso")
+
+    tracemalloc.start()
+    try:
+        compressed = models_metatables._gzip_json_records(
+            frame, column_dtypes_map=column_dtypes_map, time_index_name="time_index"
+        )
+        body = models_metatables._JSONUploadBody(compressed, {"overwrite": False})
+        sent_bytes = sum(len(piece) for piece in body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert sent_bytes == len(body)
+    # About 1 MiB of fixed compressor and pandas state, plus a few slices in flight.
+    assert peak < len(compressed) + 2**20 + 16 * models_metatables._STREAM_SLICE_BYTES
+    assert peak < len(raw_json) / 2
+    posted = json.loads(b"".join(body))
+    assert posted["overwrite"] is False
+    assert _decode_records(posted) == json.loads(raw_json)
+
+
 def test_upsert_data_into_table_computes_canonical_stats(monkeypatch):
     calls = {}
 
@@ -0,0 +1,135 @@
+import datetime
+import uuid
+
+import pandas as pd
+import pytest
+
+from mainsequence.client.dtype_codec import (
+    TIMESTAMP_TZ,
+    compile_codec_plan,
+    serialize_remote_value,
+    token_to_pandas_series,
+)
+
+COLUMN_DTYPES_MAP = {
+    "time_index": "datetime64[ns, UTC]",
+    "asset_uid": "varchar",
+    "close": "double precision",
+    "volume": "bigint",
+    "halted": "boolean",
+    "session": "date",
+}
+
+
+def _raw_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time_index": ["2026-05-25T00:00:00Z", "2026-05-25T01:00:00+00:00"],
+            "asset_uid": ["asset-1", None],
+            "close": [1.5, None],
+            "volume": [10, None],
+            "halted": [True, None],
+            "session": ["2026-05-25", "2026-05-26"],
+        }
+    )
+
+
+def test_compile_codec_plan_caches_by_contract():
+    plan = compile_codec_plan(COLUMN_DTYPES_MAP, time_index_name="time_index")
+
+    assert compile_codec_plan(dict(COLUMN_DTYPES_MAP), time_index_name="time_index") is plan
+    assert (
+        compile_codec_plan(COLUMN_DTYPES_MAP, time_index_name="time_index", remote=True) is not plan
+    )
+    assert plan.column_dtypes_map == {
+        "time_index": TIMESTAMP_TZ,
+        "asset_uid": "string",
+        "close": "float64",
+        "volume": "int64",
+        "halted": "bool",
+        "session": "date",
+    }
+    assert plan["time_index"].is_time_index
+    assert "time_index" in compile_codec_plan({"close": "float"}, time_index_name="time_index")
+
+
+def test_codec_plan_decodes_like_per_column_token_conversion():
+    plan = compile_codec_plan(COLUMN_DTYPES_MAP, time_index_name="time_index")
+    expected = _raw_frame()
+    for column, token in COLUMN_DTYPES_MAP.items():
+        expected[column] = token_to_pandas_series(
+            expected[column], token, is_time_index=column == "time_index"
+        )
+
+    decoded = plan.decode_frame(_raw_frame())
+
+    pd.testing.assert_frame_equal(decoded, expected)
+    assert all(plan[c].is_decoded(decoded[c]) for c in ["time_index", "close", "volume"])
+    partial = plan.decode_frame(_raw_frame(), columns=["close"])
+    assert partial["close"].dtype == "float64"
+    assert partial["volume"].dtype == "float64"  # not converted to Int64
+    assert isinstance(partial["time_index"].dtype, pd.DatetimeTZDtype)
+
+
+@pytest.mark.parametrize(
+    ("token", "values"),
+    [
+        (
+            "timestamp with time zone",
+            pd.to_datetime(
+                [
+                    "2026-05-25T00:00:00Z",
+                    "2026-05-25T01:00:00.123Z",
+                    "2026-05-25T02:00:00.000000001+02:00",
+                    "1960-01-01T00:00:00.5Z",
+                    None,
+                ],
+                utc=True,
+                format="ISO8601",
+            ).tz_convert("America/Mexico_City"),
+        ),
+        ("timestamp with time zone", ["2026-05-25T00:00:00+01:00", None]),
+        ("date", pd.to_datetime(["2026-05-25T23:30:00", None])),
+        ("date", pd.to_datetime(["2026-05-25T23:30:00Z", None]).tz_convert("Asia/Tokyo")),
+        ("date", [datetime.date(2026, 5, 25), "2026-05-26", None]),
+        ("varchar", [uuid.UUID(int=1), "asset-2", None, float("nan")]),
+        ("varchar", pd.array(["asset-1", None], dtype="string")),
+        ("bigint", pd.array([10, None], dtype="Int64")),
+        ("bigint", [10, 20]),
+        ("float32", pd.array([1.25, None], dtype="float32")),
+        ("double precision", [1.5, float("nan")]),
+        ("boolean", pd.array([True, None], dtype="boolean")),
+        ("jsonb", [{"a": 1}, None]),
+    ],
+)
+def test_codec_plan_encodes_like_per_value_serialization(token, values):
+    plan = compile_codec_plan({"value": token}, time_index_name="time_index", remote=True)
+    df = pd.DataFrame({"value": values})
+    original = df.copy()
+
+    encoded = plan.encode_frame(df)
+
+    expected = df.copy()
+    expected["value"] = [serialize_remote_value(value, token) for value in df["value"].tolist()]
+    pd.testing.assert_frame_equal(encoded, expected)
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_codec_plan_encodes_timestamps_as_utc_iso_strings():
+    plan = compile_codec_plan({}, time_index_name="time_index", remote=True)
+    df = pd.DataFrame(
+        {
+            "time_index": pd.to_datetime(
+                ["2026-05-25T02:00:00+02:00", "2026-05-25T01:00:00.5Z"], utc=True, format="ISO8601"
+            )
+        }
+    )
+
+    assert plan.encode_frame(df)["time_index"].tolist() == [
+        "2026-05-25T00:00:00Z",
+        "2026-05-25T01:00:00.500000Z",
+    ]
+    with pytest.raises(ValueError, match="Timezone-naive"):
+        compile_codec_plan({"ts": "timestamp"}, remote=True)
+    with pytest.raises(ValueError, match="must be timezone-aware"):
+        plan.encode_frame(df.assign(time_index=df["time_index"].dt.tz_localize(None)))
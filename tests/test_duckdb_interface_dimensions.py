@@ -1,9 +1,13 @@
 import datetime
+import time
 from types import SimpleNamespace
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from mainsequence.client import metatables as models_metatables
+from mainsequence.client.data_sources_interfaces import duckdb as duckdb_interface
 from mainsequence.client.data_sources_interfaces.duckdb import DuckDBInterface
 
 INDEX_NAMES = ["time_index", "account_uid", "asset_uid"]
@@ -180,6 +184,41 @@ def test_duckdb_read_supports_dimension_range_map(tmp_path):
     assert df["value"].tolist() == [30.0]
 
 
+def test_duckdb_long_coordinate_lists_join_like_or_expansion(tmp_path, monkeypatch):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface)
+    filters = {
+        "index_coordinates": [
+            {"account_uid": "acct-a", "asset_uid": "asset-1"},
+            {"asset_uid": "asset-2"},
+        ],
+        "dimension_range_map": [
+            {"coordinate": {"account_uid": "acct-a", "asset_uid": "asset-1"}, "start_date": _dt(0)},
+            {
+                "coordinate": {"account_uid": "acct-a", "asset_uid": "asset-2"},
+                "start_date": _dt(1),
+                "start_date_operand": ">",
+            },
+            {
+                "coordinate": {"account_uid": "acct-b", "asset_uid": "asset-1"},
+                "end_date": _dt(0),
+            },
+        ],
+    }
+
+    def read(**kwargs):
+        return interface.read(
+            table="node", index_names=INDEX_NAMES, time_index_name="time_index", **kwargs
+        )
+
+    expanded = {name: read(**{name: value}) for name, value in filters.items()}
+    monkeypatch.setattr(duckdb_interface, "COORDINATE_JOIN_MIN_ENTRIES", 1)
+
+    for name, value in filters.items():
+        pd.testing.assert_frame_equal(read(**{name: value}), expanded[name])
+    assert read(**filters)["value"].tolist() == [10.0]
+
+
 def test_duckdb_insert_uses_existing_update_key_metadata_without_storage_config_lookup(
     monkeypatch,
 ):
@@ -297,3 +336,202 @@ def test_duckdb_read_dispatch_uses_adjusted_constrain_read_outputs(monkeypatch):
     assert calls["read"]["time_index_name"] == "time_index"
     assert result.index.names == INDEX_NAMES
     assert result["value"].tolist() == [10.0]
+
+
+def test_duckdb_parallel_upsert_matches_sequential_partition_writes(tmp_path):
+    months = [datetime.datetime(2025, month, 1, tzinfo=datetime.UTC) for month in range(1, 13)]
+    df = pd.DataFrame(
+        {
+            "time_index": months * 2,
+            "account_uid": ["acct-a"] * 12 + ["acct-b"] * 12,
+            "asset_uid": ["asset-1"] * 24,
+            "value": [float(i) for i in range(24)],
+        }
+    )
+    sequential = DuckDBInterface(db_path=tmp_path / "sequential")
+    parallel = DuckDBInterface(db_path=tmp_path / "parallel")
+
+    for interface, workers in ((sequential, 1), (parallel, 4)):
+        interface.upsert(
+            df,
+            table="node",
+            index_names=INDEX_NAMES,
+            time_index_name="time_index",
+            max_workers=workers,
+        )
+        # Second pass overlaps every partition and takes the rewrite path.
+        interface.upsert(
+            df.assign(value=df["value"] + 100),
+            table="node",
+            index_names=INDEX_NAMES,
+            time_index_name="time_index",
+            max_workers=workers,
+        )
+
+    def _rows(interface):
+        out = interface.read(table="node", index_names=INDEX_NAMES, time_index_name="time_index")
+        return out.sort_values(INDEX_NAMES).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(_rows(parallel), _rows(sequential))
+    assert len(_rows(parallel)) == 24
+    assert len(list((tmp_path / "parallel" / "node").rglob("*.parquet"))) == 12
+
+
+def test_duckdb_parallel_upsert_starts_no_partition_after_a_failure(tmp_path, monkeypatch):
+    months = [datetime.datetime(2025, month, 1, tzinfo=datetime.UTC) for month in range(1, 13)]
+    df = pd.DataFrame(
+        {
+            "time_index": months,
+            "account_uid": ["acct-a"] * 12,
+            "asset_uid": ["asset-1"] * 12,
+            "value": [float(i) for i in range(12)],
+        }
+    )
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    original_upsert_partition = DuckDBInterface._upsert_partition
+    started = []
+
+    def _failing_upsert_partition(self, con, table, keys, sub, **kwargs):
+        started.append(int(keys["month"]))
+        if int(keys["month"]) == 1:
+            raise RuntimeError("partition write failed")
+        time.sleep(0.2)
+        return original_upsert_partition(self, con, table, keys, sub, **kwargs)
+
+    monkeypatch.setattr(DuckDBInterface, "_upsert_partition", _failing_upsert_partition)
+
+    with pytest.raises(RuntimeError, match="partition write failed"):
+        interface.upsert(
+            df,
+            table="node",
+            index_names=INDEX_NAMES,
+            time_index_name="time_index",
+            max_workers=2,
+        )
+
+    assert len(started) < 12
+    stored = interface.read(table="node", index_names=INDEX_NAMES, time_index_name="time_index")
+    assert len(stored) == len(started) - 1
+
+
+def test_duckdb_iter_batches_streams_read_in_index_order(tmp_path):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface)
+    interface.upsert(
+        pd.DataFrame(
+            {
+                "time_index": [_dt(2), _dt(3)],
+                "account_uid": ["acct-a", "acct-b"],
+                "asset_uid": ["asset-1", "asset-2"],
+                "value": [40.0, 50.0],
+            }
+        ),
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+    )
+    filters = dict(
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        dimension_filters={"account_uid": ["acct-a", "acct-b"]},
+    )
+
+    batches = list(interface.iter_batches(batch_rows=2, **filters))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), interface.read(**filters))
+
+    arrow_batches = list(interface.iter_batches(batch_rows=4, output="arrow", **filters))
+    assert all(isinstance(batch, pa.RecordBatch) for batch in arrow_batches)
+    assert sum(batch.num_rows for batch in arrow_batches) == 5
+
+    assert list(interface.iter_batches(**{**filters, "table": "missing"})) == []
+    with pytest.raises(ValueError, match="batch_rows"):
+        list(interface.iter_batches(batch_rows=0, **filters))
+
+
+def test_duckdb_read_arrow_maps_schema_to_read_dtypes(tmp_path):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface)
+    filters = dict(table="node", index_names=INDEX_NAMES, time_index_name="time_index")
+
+    data = interface.read_arrow(**filters)
+
+    assert isinstance(data, pa.Table)
+    assert data.schema.field("time_index").type.tz == "UTC"
+    assert data.schema.field("account_uid").type == pa.string()
+    assert data.schema.field("value").type == pa.float64()
+    df = interface.read(**filters)
+    assert str(df["time_index"].dtype).endswith(", UTC]")
+    assert df["account_uid"].dtype == "string"
+    pd.testing.assert_frame_equal(
+        df, data.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+    )
+    assert interface.read_arrow(**{**filters, "table": "missing"}).num_rows == 0
+
+
+def test_duckdb_read_dispatch_serves_arrow_output_without_pandas(monkeypatch):
+    calls = {}
+
+    class FakeDuckDBInterface:
+        def constrain_read(self, **kwargs):
+            return kwargs["start"], kwargs["end"], kwargs["dimension_range_map"], {}
+
+        def read(self, **kwargs):
+            raise AssertionError("arrow output must not read through pandas")
+
+        def read_arrow(self, **kwargs):
+            calls["read_arrow"] = kwargs
+            return pa.table({"time_index": [_dt(0)], "value": [10.0]})
+
+    update = SimpleNamespace(
+        update_hash="update-hash",
+        data_node_storage=SimpleNamespace(
+            storage_hash="storage-hash",
+            physical_table_name="node_table",
+            time_indexed_profile=SimpleNamespace(
+                index_names=["time_index"],
+                time_index_name="time_index",
+                column_dtypes_map={"time_index": "datetime64[ns, UTC]", "value": "float64"},
+            ),
+        ),
+    )
+    data_source = models_metatables.DataSource.model_construct(class_type=models_metatables.DUCK_DB)
+    monkeypatch.setattr(models_metatables, "_duckdb_interface", lambda: FakeDuckDBInterface())
+
+    result = data_source.get_data_by_time_index(data_node_update=update, output="arrow")
+
+    assert isinstance(result, pa.Table)
+    assert result.column("value").to_pylist() == [10.0]
+    assert calls["read_arrow"]["table"] == "node_table"
+    assert calls["read_arrow"]["time_index_name"] == "time_index"
+    with pytest.raises(ValueError, match="output"):
+        data_source.get_data_by_time_index(data_node_update=update, output="numpy")
+
+
+def test_timescale_reads_convert_the_typed_frame_to_arrow():
+    from mainsequence.client.models_foundry import TimeScaleDB
+
+    update = SimpleNamespace(
+        update_hash="update-hash",
+        get_data_between_dates_from_api=lambda **kwargs: pd.DataFrame(
+            {"time_index": ["2026-05-25T00:00:00Z"], "value": [10.0]}
+        ),
+        data_node_storage=SimpleNamespace(
+            _require_time_indexed_table_contract=lambda: (
+                "time_index",
+                ["time_index"],
+                {"time_index": "datetime64[ns, UTC]", "value": "float64"},
+            )
+        ),
+    )
+    data_source = TimeScaleDB.model_construct()
+
+    result = data_source.get_data_by_time_index(data_node_update=update, output="arrow")
+
+    assert isinstance(result, pa.Table)
+    assert result.column_names == ["time_index", "value"]
+    assert result.column("value").to_pylist() == [10.0]
+    assert data_source.get_data_by_time_index(data_node_update=update).index.names == ["time_index"]
+    with pytest.raises(ValueError, match="output"):
+        data_source.get_data_by_time_index(data_node_update=update, output="numpy")
@@ -0,0 +1,377 @@
+import datetime
+import shutil
+import subprocess
+import sys
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from duckdb_helpers import INDEX_NAMES, dt, frame, parquet_fragments, read, read_manifest, upsert
+
+from mainsequence.client.data_sources_interfaces import duckdb as duckdb_module
+from mainsequence.client.data_sources_interfaces.duckdb import MANIFEST_FILE_NAME, DuckDBInterface
+
+
+def _upsert(interface: DuckDBInterface, df: pd.DataFrame) -> None:
+    upsert(interface, df, partition_spec="time:month")
+
+
+def test_upsert_keeps_manifest_in_sync_with_fragments(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+
+    _upsert(interface, frame([1, 2]))
+    _upsert(interface, frame([3]))
+    assert set(read_manifest(tmp_path)["files"]) == set(parquet_fragments(tmp_path))
+    assert len(set(parquet_fragments(tmp_path))) == 2
+
+    # Overlapping keys take the rewrite path; only the colliding fragment is replaced.
+    third_fragment = {
+        path for path, entry in read_manifest(tmp_path)["files"].items() if entry["num_rows"] == 1
+    }
+    _upsert(interface, frame([2], value=5.0))
+    manifest = read_manifest(tmp_path)
+    assert set(manifest["files"]) == set(parquet_fragments(tmp_path))
+    assert len(manifest["files"]) == 2
+    assert third_fragment < set(manifest["files"])
+
+    (entry,) = (manifest["files"][path] for path in set(manifest["files"]) - third_fragment)
+    assert entry["num_rows"] == 2
+    assert entry["stats_complete"] is True
+    assert entry["row_groups"] == [[pd.Timestamp(dt(1)).value, pd.Timestamp(dt(2)).value, 2]]
+    assert ["value", "DOUBLE"] in entry["columns"]
+    assert entry["keys"]["kinds"] == ["time", "str"]
+
+
+def test_constrain_read_and_minima_use_manifest_without_opening_footers(tmp_path, monkeypatch):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame(list(range(1, 11))))
+
+    def _no_footer_reads(*args, **kwargs):
+        raise AssertionError("footer read")
+
+    monkeypatch.setattr(duckdb_module.pq, "ParquetFile", _no_footer_reads)
+
+    _, adjusted_end, _, diagnostics = interface.constrain_read(
+        table="node",
+        start=dt(1),
+        end=dt(10),
+        time_index_name="time_index",
+        index_names=INDEX_NAMES,
+        max_rows=4,
+    )
+    global_min, per_coordinate = interface.time_index_minima(
+        "node", index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+
+    assert diagnostics["limited"] is True
+    assert diagnostics["files_considered"] == 1
+    assert adjusted_end < dt(10)
+    assert global_min == pd.Timestamp(dt(1))
+    assert per_coordinate == {"asset-1": pd.Timestamp(dt(1))}
+
+
+def test_reads_and_upserts_trust_a_fresh_manifest_without_listing(tmp_path, monkeypatch):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame([1]))
+
+    def _no_listing(*args, **kwargs):
+        raise AssertionError("directory listing")
+
+    monkeypatch.setattr(interface, "_list_table_parquet_files", _no_listing)
+
+    _upsert(interface, frame([2]))
+    _, _, _, diagnostics = interface.constrain_read(
+        table="node", time_index_name="time_index", index_names=INDEX_NAMES, now=dt(3)
+    )
+    df = read(interface)
+
+    assert diagnostics["files_considered"] == 2
+    assert len(df) == 2
+
+
+def test_manifest_reconciles_external_changes_and_rebuilds(tmp_path, monkeypatch):
+    writer = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(writer, frame([1]))
+    (fragment,) = (tmp_path / "duckdb" / "node").rglob("*.parquet")
+    shutil.copy(fragment, fragment.with_name("part-external.parquet"))
+
+    def _files_considered() -> int:
+        _, _, _, diagnostics = writer.constrain_read(
+            table="node",
+            time_index_name="time_index",
+            index_names=INDEX_NAMES,
+            now=dt(2),
+        )
+        return diagnostics["files_considered"]
+
+    # Within the reconcile window the manifest is trusted as written.
+    assert _files_considered() == 1
+    monkeypatch.setenv("DUCKDB_MANIFEST_RECONCILE_SECONDS", "0")
+    assert _files_considered() == 2
+    assert set(read_manifest(tmp_path)["files"]) == set(parquet_fragments(tmp_path))
+
+    (tmp_path / "duckdb" / "node" / MANIFEST_FILE_NAME).unlink()
+    summary = writer.rebuild_manifest("node", time_index_name="time_index")
+
+    assert summary == {"files": 2, "rows": 2}
+    assert set(read_manifest(tmp_path)["files"]) == set(parquet_fragments(tmp_path))
+
+
+def test_upsert_dedupes_against_fragments_missing_from_the_manifest(tmp_path, monkeypatch):
+    writer = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(writer, frame([1]))
+
+    # Another writer's fragment whose manifest update was lost.
+    other = DuckDBInterface(db_path=tmp_path / "duckdb")
+    monkeypatch.setattr(other, "_update_manifest", lambda *args, **kwargs: None)
+    _upsert(other, frame([2], value=2.0))
+    assert len(read_manifest(tmp_path)["files"]) == 1
+
+    _upsert(writer, frame([2], value=3.0))
+    df = read(writer)
+
+    assert df["value"].tolist() == [1.0, 3.0]
+    assert set(read_manifest(tmp_path)["files"]) == set(parquet_fragments(tmp_path))
+
+
+def test_remove_columns_refreshes_manifest_schema(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    df = frame([1, 2])
+    df["extra"] = [1, 2]
+    _upsert(interface, df)
+
+    result = interface.remove_columns(
+        "node", ["extra"], index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+
+    assert result["dropped"] == ["extra"]
+    manifest = read_manifest(tmp_path)
+    assert set(manifest["files"]) == set(parquet_fragments(tmp_path))
+    for entry in manifest["files"].values():
+        assert "extra" not in {name for name, _ in entry["columns"]}
+    df = read(interface)
+    assert "extra" not in df.columns
+
+
+def test_compact_merges_fragments_into_sorted_files(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    for day in (5, 3, 1, 4, 2):
+        _upsert(interface, frame([day], value=float(day)))
+    assert len(set(parquet_fragments(tmp_path))) == 5
+
+    summary = interface.compact("node", target_file_rows=3)
+
+    assert summary == {"partitions_compacted": 1, "files_deleted": 5, "files_written": 2}
+    assert set(read_manifest(tmp_path)["files"]) == set(parquet_fragments(tmp_path))
+    assert len(set(parquet_fragments(tmp_path))) == 2
+    df = read(interface)
+    assert sorted(df["value"].tolist()) == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert interface.compact("node")["partitions_compacted"] == 1
+    assert interface.compact("node")["partitions_compacted"] == 0
+
+
+def test_compact_keeps_duplicated_keys_from_the_latest_written_fragment(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame([1, 2], value=1.0))
+    (fragment,) = (tmp_path / "duckdb" / "node").rglob("*.parquet")
+    # Written later, but its name sorts before every `part-<timestamp>` fragment.
+    newer = pq.read_table(fragment).slice(0, 1)
+    newer = newer.set_column(newer.schema.get_field_index("value"), "value", pa.array([9.0]))
+    pq.write_table(newer, fragment.with_name("part-0.parquet"))
+
+    interface.compact("node")
+
+    df = read(interface)
+    assert df["value"].tolist() == [9.0, 1.0]
+    assert len(set(parquet_fragments(tmp_path))) == 1
+
+
+def test_reads_never_see_a_half_swapped_compaction(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    for day in range(1, 7):
+        _upsert(interface, frame([day], value=float(day)))
+
+    stop = threading.Event()
+    observed: list[list[float]] = []
+    errors: list[Exception] = []
+
+    def _reader(window: dict) -> None:
+        while not stop.is_set():
+            try:
+                df = interface.read(
+                    table="node", index_names=INDEX_NAMES, time_index_name="time_index", **window
+                )
+                observed.append(sorted(df["value"].tolist()))
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+    readers = [
+        threading.Thread(target=_reader, args=({},)),
+        threading.Thread(target=_reader, args=({"start": dt(2), "end": dt(4)},)),
+    ]
+    for thread in readers:
+        thread.start()
+    try:
+        for round_number in range(20):
+            interface.compact("node", target_file_rows=1 + round_number % 3)
+    finally:
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+    assert errors == []
+    assert observed
+    assert {tuple(values) for values in observed} <= {
+        (1.0, 2.0, 3.0, 4.0, 5.0, 6.0),
+        (2.0, 3.0, 4.0),
+    }
+
+
+def test_writers_in_other_processes_wait_for_the_table_write_lock(tmp_path):
+    pytest.importorskip("fcntl")
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame([1]))
+    lock_path = tmp_path / "duckdb" / "node" / duckdb_module.TABLE_WRITE_LOCK_FILE_NAME
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, sys\n"
+            f"lock = open({str(lock_path)!r}, 'a+b')\n"
+            "fcntl.flock(lock, fcntl.LOCK_EX)\n"
+            "print('locked', flush=True)\n"
+            "sys.stdin.read()\n",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    try:
+        assert holder.stdout.readline() == b"locked\n"
+        assert interface.is_table_write_locked("node")
+
+        writer = threading.Thread(target=_upsert, args=(interface, frame([2])))
+        writer.start()
+        writer.join(timeout=0.5)
+        assert writer.is_alive()
+        assert len(read_manifest(tmp_path)["files"]) == 1
+    finally:
+        holder.stdin.close()
+        holder.wait(timeout=10)
+    writer.join(timeout=30)
+
+    assert not writer.is_alive()
+    assert not interface.is_table_write_locked("node")
+    assert len(read_manifest(tmp_path)["files"]) == 2
+
+
+def test_upsert_compacts_partitions_past_fragment_threshold(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_COMPACT_MIN_FRAGMENTS", "3")
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+
+    _upsert(interface, frame([1]))
+    _upsert(interface, frame([2]))
+    assert len(set(parquet_fragments(tmp_path))) == 2
+    _upsert(interface, frame([3]))
+
+    assert len(set(parquet_fragments(tmp_path))) == 1
+    assert interface.stored_tables() == ["node"]
+
+
+def test_key_index_skips_overlap_scans_and_limits_rewrites(tmp_path, monkeypatch):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame([1, 3]))
+    _upsert(interface, frame([2, 4]))
+    fragments = set(parquet_fragments(tmp_path))
+    assert all((tmp_path / "duckdb" / "node" / f"{path}.keys").exists() for path in fragments)
+
+    executed = []
+    original_upsert_partition = DuckDBInterface._upsert_partition
+
+    def _recording_upsert_partition(self, con, *args, **kwargs):
+        class _Recorder:
+            def __getattr__(self, name):
+                return getattr(con, name)
+
+            def execute(self, sql, *params):
+                executed.append(sql)
+                return con.execute(sql, *params)
+
+        return original_upsert_partition(self, _Recorder(), *args, **kwargs)
+
+    monkeypatch.setattr(DuckDBInterface, "_upsert_partition", _recording_upsert_partition)
+
+    # Interleaved times, disjoint keys: appended without scanning existing fragments.
+    interface.upsert(
+        frame([5]).assign(asset_uid="asset-2"),
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+    )
+    assert not any("*.parquet" in sql for sql in executed)
+    assert len(set(parquet_fragments(tmp_path))) == 3
+
+    # A collision on day 3 rewrites only the fragment holding it.
+    _upsert(interface, frame([3], value=9.0))
+    remaining = set(parquet_fragments(tmp_path))
+    assert len(remaining) == 3
+    assert len(fragments & remaining) == 1
+    assert not any(path.endswith(".keys") for path in remaining)
+    sidecars = {p.name for p in (tmp_path / "duckdb" / "node").rglob("*.keys")}
+    assert sidecars == {f"{path.rpartition('/')[2]}.keys" for path in remaining}
+
+    df = read(interface)
+    assert len(df) == 5
+    assert df.loc[df["time_index"] == dt(3), "value"].tolist() == [9.0]
+
+
+def test_key_index_proof_requires_the_manifest_to_list_every_fragment(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    _upsert(interface, frame([1]))
+    manifest = interface._table_manifest("node", time_index_name="time_index")
+    part_path = f"{interface.db_path}/node/year=2026/month=05"
+    incoming = frame([2]).assign(asset_uid="asset-2")
+
+    def _colliding():
+        return interface._colliding_fragments(
+            "node", part_path, incoming, index_names=INDEX_NAMES, manifest=manifest
+        )
+
+    assert _colliding() == []
+    (fragment,) = (tmp_path / "duckdb" / "node").rglob("*.parquet")
+    shutil.copy(fragment, fragment.with_name("part-unrecorded.parquet"))
+    assert _colliding() is None
+
+
+def test_read_prunes_fragments_outside_requested_windows(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    months = [datetime.datetime(2025, month, 15, tzinfo=datetime.UTC) for month in (1, 2, 3)]
+    _upsert(
+        interface,
+        pd.DataFrame(
+            {"time_index": months, "asset_uid": ["asset-1"] * 3, "value": [1.0, 2.0, 3.0]}
+        ),
+    )
+    # Corrupt February: only reads that still open it can fail.
+    (february,) = (tmp_path / "duckdb" / "node" / "year=2025" / "month=02").rglob("*.parquet")
+    february.write_bytes(b"not parquet")
+
+    def _read(**kwargs):
+        return interface.read(
+            table="node", index_names=INDEX_NAMES, time_index_name="time_index", **kwargs
+        )
+
+    assert _read(start=months[2])["value"].tolist() == [3.0]
+    ranged = _read(
+        dimension_range_map=[
+            {
+                "coordinate": {"asset_uid": "asset-1"},
+                "start_date": months[0],
+                "end_date": months[0],
+            },
+            {"coordinate": {"asset_uid": "asset-1"}, "start_date": months[2]},
+        ]
+    )
+    assert ranged["value"].tolist() == [1.0, 3.0]
+    assert _read(start=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)).empty
@@ -0,0 +1,255 @@
+import datetime
+from types import SimpleNamespace
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from duckdb_helpers import (
+    INDEX_NAMES,
+    frame,
+    parquet_fragments,
+    read,
+    read_manifest,
+    upsert,
+)
+
+from mainsequence.client import metatables as models_metatables
+from mainsequence.client.data_sources_interfaces.duckdb import (
+    DuckDBInterface,
+    _partition_bounds_from_path,
+)
+from mainsequence.client.data_sources_interfaces.partitioning import PartitionSpec
+from mainsequence.client.utils import DataFrequency
+
+ASSETS = [f"asset-{i}" for i in range(12)]
+
+
+def test_partition_spec_parses_strategy_strings():
+    spec = PartitionSpec.parse("time:day, bucket:Asset_UID:32")
+
+    assert spec == PartitionSpec("day", "Asset_UID", 32)
+    assert PartitionSpec.parse(str(spec)) == spec
+    assert PartitionSpec.parse(spec.to_dict()) == spec
+    assert PartitionSpec.parse("backend_default") is None
+    assert PartitionSpec.parse(None) is None
+    assert spec.partition_columns == ("year", "month", "day", "bucket")
+    with pytest.raises(ValueError):
+        PartitionSpec.parse("time:week")
+    with pytest.raises(ValueError):
+        PartitionSpec.parse("time:day,bucket:asset_uid")
+
+    clustered = PartitionSpec.parse("time:month,order:identity,row_group:1000")
+    assert clustered == PartitionSpec("month", row_order="identity", row_group_size=1000)
+    assert str(clustered) == "time:month,order:identity,row_group:1000"
+    assert clustered.same_directories(PartitionSpec("month"))
+    with pytest.raises(ValueError):
+        PartitionSpec.parse("time:month,order:hilbert")
+
+    assert PartitionSpec.for_cadence("5m") == PartitionSpec("day")
+    assert PartitionSpec.for_cadence(DataFrequency.one_m) == PartitionSpec("day")
+    assert PartitionSpec.for_cadence("1d") == PartitionSpec("month")
+    assert PartitionSpec.for_cadence(None) == PartitionSpec("month")
+
+
+def test_partition_bounds_cover_hour_and_year_layouts():
+    start, end = _partition_bounds_from_path("node/year=2026/month=05/day=03/hour=07/f.parquet")
+    assert start == pd.Timestamp("2026-05-03 07:00", tz="UTC")
+    assert end == pd.Timestamp("2026-05-03 08:00", tz="UTC") - pd.Timedelta(nanoseconds=1)
+
+    start, end = _partition_bounds_from_path("node/year=2026/bucket=03/f.parquet")
+    assert start == pd.Timestamp("2026-01-01", tz="UTC")
+    assert end == pd.Timestamp("2027-01-01", tz="UTC") - pd.Timedelta(nanoseconds=1)
+
+
+def test_default_layout_follows_data_frequency(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+
+    upsert(interface, frame([1]))
+    assert parquet_fragments(tmp_path)[0].startswith("year=2026/month=05/day=01/")
+    assert read_manifest(tmp_path)["partition_spec"]["time_granularity"] == "day"
+
+    interface.upsert(
+        frame([1]),
+        table="daily",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        data_frequency=DataFrequency.one_d,
+    )
+    (daily,) = (tmp_path / "duckdb" / "daily").rglob("*.parquet")
+    assert daily.parent.name == "month=05"
+
+
+def test_bucketed_layout_prunes_reads_to_matching_buckets(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    spec = PartitionSpec("month", "asset_uid", 4)
+    upsert(interface, frame([1, 2], ASSETS), partition_spec=spec)
+
+    fragments = parquet_fragments(tmp_path)
+    assert {path.split("/")[2] for path in fragments} == {f"bucket={b:02d}" for b in range(4)}
+    (target_bucket,) = spec.buckets_for(["asset-3"])
+    # Corrupt every other bucket: only reads that still open them can fail.
+    for path in fragments:
+        if f"bucket={target_bucket:02d}" not in path:
+            (tmp_path / "duckdb" / "node" / path).write_bytes(b"not parquet")
+
+    filtered = read(interface, dimension_filters={"asset_uid": ["asset-3"]})
+    assert filtered["asset_uid"].tolist() == ["asset-3", "asset-3"]
+    coordinates = read(
+        interface,
+        index_coordinates=[{"asset_uid": "asset-3"}],
+        start=datetime.datetime(2026, 5, 2, tzinfo=datetime.UTC),
+    )
+    assert len(coordinates) == 1
+    assert "bucket" not in filtered.columns
+
+
+def test_bucketed_layout_supports_minima_and_column_removal(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    df = frame([1, 2], ASSETS, hour=12).assign(extra=1)
+    upsert(interface, df, partition_spec="time:day,bucket:asset_uid:3")
+
+    global_min, per_coordinate = interface.time_index_minima(
+        "node", index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+    result = interface.remove_columns(
+        "node", ["extra", "bucket"], index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+
+    assert global_min == pd.Timestamp("2026-05-01 12:00", tz="UTC")
+    assert set(per_coordinate) == set(ASSETS)
+    assert result["dropped"] == ["extra"]
+    assert result["skipped"] == ["bucket"]
+    assert all("/bucket=" in path for path in parquet_fragments(tmp_path))
+    assert list(read(interface).columns) == ["time_index", "asset_uid", "value"]
+
+
+def test_bucket_dimension_must_be_an_identity_dimension(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+
+    with pytest.raises(ValueError, match="identity dimensions"):
+        upsert(interface, frame([1], ASSETS), partition_spec="time:month,bucket:value:4")
+
+
+def test_repartition_migrates_existing_table_and_governs_later_writes(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    upsert(interface, frame([1, 2], ASSETS), partition_spec="time:month")
+    upsert(interface, frame([3], ASSETS), partition_spec="time:month")
+    before = read(interface)
+
+    # Existing tables keep their layout when another spec is requested.
+    upsert(interface, frame([4], ASSETS), partition_spec="time:day,bucket:asset_uid:4")
+    assert all(path.count("/") == 2 for path in parquet_fragments(tmp_path))
+
+    summary = interface.repartition("node", "time:day,bucket:asset_uid:4")
+
+    assert summary["files_deleted"] == 3
+    assert summary["partition_spec"] == "time:day,bucket:asset_uid:4"
+    fragments = parquet_fragments(tmp_path)
+    assert summary["files_written"] == len(fragments)
+    assert all(path.count("/") == 4 and "/bucket=" in path for path in fragments)
+    assert PartitionSpec.from_dict(read_manifest(tmp_path)["partition_spec"]) == PartitionSpec(
+        "day", "asset_uid", 4
+    )
+    after = read(interface)
+    assert len(after) == len(before) + len(ASSETS)
+    pd.testing.assert_frame_equal(after.iloc[: len(before)], before)
+
+    upsert(interface, frame([2], value=7.0))
+    df = read(interface, dimension_filters={"asset_uid": ["asset-1"]})
+    assert df["value"].tolist() == [1.0, 7.0, 1.0, 1.0]
+    assert all("/bucket=" in path for path in parquet_fragments(tmp_path))
+    assert interface.repartition("node", "time:day,bucket:asset_uid:4")["files_written"] == 0
+
+
+def _minute_frame(day: int, value: float = 1.0) -> pd.DataFrame:
+    # DuckDB sizes row groups in 2048-row vectors: 2048 minutes x 12 assets → 12 groups.
+    times = pd.date_range(f"2026-05-{day:02d}", periods=2048, freq="min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "time_index": times.repeat(len(ASSETS)),
+            "asset_uid": ASSETS * len(times),
+            "value": value,
+        }
+    )
+
+
+def _assets_per_row_group(tmp_path) -> list[int]:
+    counts = []
+    for path in (tmp_path / "duckdb" / "node").rglob("*.parquet"):
+        metadata = pq.ParquetFile(path).metadata
+        col_idx = metadata.schema.names.index("asset_uid")
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(col_idx).statistics
+            counts.append(sum(stats.min <= asset <= stats.max for asset in ASSETS))
+    return counts
+
+
+@pytest.mark.parametrize(
+    ("row_order", "max_assets_per_row_group"), [("identity", 1), ("zorder", 6), ("time", 12)]
+)
+def test_row_order_clusters_identities_into_row_groups(
+    tmp_path, row_order, max_assets_per_row_group
+):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    spec = PartitionSpec("month", row_order=row_order, row_group_size=2048)
+    upsert(interface, _minute_frame(1), partition_spec=spec)
+
+    counts = _assets_per_row_group(tmp_path)
+    assert len(counts) == len(ASSETS)
+    assert max(counts) <= max_assets_per_row_group
+    df = read(interface, dimension_filters={"asset_uid": ["asset-3"]})
+    assert len(df) == 2048
+    assert df["time_index"].is_monotonic_increasing
+
+
+def test_rewrites_and_compaction_keep_recorded_row_order(tmp_path):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    upsert(interface, _minute_frame(1), partition_spec="time:month,order:identity,row_group:2048")
+    upsert(interface, _minute_frame(3))
+    upsert(interface, _minute_frame(1, value=5.0))
+    assert max(_assets_per_row_group(tmp_path)) == 1
+
+    assert interface.compact("node")["files_written"] == 1
+    assert max(_assets_per_row_group(tmp_path)) == 1
+    df = read(interface, dimension_filters={"asset_uid": ["asset-3"]})
+    assert df["value"].value_counts().to_dict() == {5.0: 2048, 1.0: 2048}
+
+
+def test_storage_partition_spec_reads_time_indexed_profile():
+    def storage(**profile):
+        return {"time_indexed_profile": {"time_index_name": "time_index", **profile}}
+
+    assert models_metatables.core._storage_partition_spec(
+        storage(partition_strategy="time:hour,bucket:asset_uid:8", cadence="1d")
+    ) == PartitionSpec("hour", "asset_uid", 8)
+    assert (
+        models_metatables.core._storage_partition_spec(
+            storage(partition_strategy="backend_default", cadence="1m")
+        )
+        is None
+    )
+    assert models_metatables.core._storage_partition_spec(storage()) is None
+
+
+def test_insert_without_partition_strategy_keeps_existing_layout(tmp_path, monkeypatch):
+    interface = DuckDBInterface(db_path=tmp_path / "duckdb")
+    upsert(interface, frame([1]), partition_spec=PartitionSpec("month"))
+    monkeypatch.setattr(models_metatables.core, "_duckdb_interface", lambda: interface)
+
+    storage = SimpleNamespace(
+        physical_table_name="node",
+        time_indexed_profile={"partition_strategy": "backend_default", "cadence": "1m"},
+    )
+    data_source = models_metatables.DataSource.model_construct(class_type=models_metatables.DUCK_DB)
+    data_source.insert_data_into_table(
+        serialized_data_frame=frame([2]),
+        data_node_update=SimpleNamespace(data_node_storage=storage),
+        overwrite=False,
+        time_index_name="time_index",
+        index_names=INDEX_NAMES,
+        grouped_dates={},
+    )
+
+    assert len(parquet_fragments(tmp_path)) == 2
+    assert all("/day=" not in path for path in parquet_fragments(tmp_path))
+    assert read_manifest(tmp_path)["partition_spec"]["time_granularity"] == "month"
@@ -0,0 +1,131 @@
+import datetime
+import importlib
+import threading
+
+import pandas as pd
+import pytest
+
+from mainsequence.client import data_sources_interfaces
+from mainsequence.client import metatables as models_metatables
+
+INDEX_NAMES = ["time_index", "asset_uid"]
+
+
+@pytest.fixture(autouse=True)
+def _close_pool():
+    yield
+    data_sources_interfaces.close_local_data_interfaces()
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time_index": [
+                datetime.datetime(2026, 5, 25, hour, tzinfo=datetime.UTC) for hour in range(4)
+            ],
+            "asset_uid": ["asset-1", "asset-2", "asset-1", "asset-2"],
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("getter", "module_name", "class_name"),
+    [
+        (data_sources_interfaces.get_duckdb_interface, "duckdb", "DuckDBInterface"),
+        (data_sources_interfaces.get_sqlite_interface, "sqlite", "SQLiteInterface"),
+    ],
+)
+def test_pooled_interface_is_reused_per_resolved_path(tmp_path, getter, module_name, class_name):
+    first = getter(tmp_path / "a")
+    second = getter(tmp_path / "a")
+    other = getter(tmp_path / "b")
+
+    # Resolved at call time: other tests purge sys.modules, so the getter may build
+    # instances of a re-imported class.
+    module = importlib.import_module(f"mainsequence.client.data_sources_interfaces.{module_name}")
+    assert isinstance(first, getattr(module, class_name))
+    assert first is second
+    assert other is not first
+
+
+def test_local_data_interface_dispatch_uses_pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("DUCKDB_PATH", str(tmp_path / "duck"))
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "sqlite"))
+
+    duck = models_metatables._local_data_interface(models_metatables.DUCK_DB)
+    sqlite = models_metatables._local_data_interface(models_metatables.SQLITE)
+
+    assert duck is models_metatables._local_data_interface(models_metatables.DUCK_DB)
+    assert sqlite is models_metatables._local_data_interface(models_metatables.SQLITE)
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [data_sources_interfaces.get_duckdb_interface, data_sources_interfaces.get_sqlite_interface],
+)
+def test_pooled_interface_hands_out_thread_local_connections(tmp_path, getter):
+    interface = getter(tmp_path / "store")
+    interface.upsert(
+        _frame(),
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+    )
+
+    connections = {}
+    results = {}
+    errors = []
+
+    def _reader(worker: int) -> None:
+        try:
+            connections[worker] = interface.con
+            assert interface.con is connections[worker]
+            results[worker] = interface.read(
+                table="node",
+                index_names=INDEX_NAMES,
+                time_index_name="time_index",
+                dimension_filters={"asset_uid": ["asset-1"]},
+            )
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_reader, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len({id(con) for con in connections.values()}) == 4
+    assert interface.con not in connections.values()
+    for df in results.values():
+        assert df["value"].tolist() == [1.0, 3.0]
+
+
+@pytest.mark.parametrize(
+    ("getter", "registry"),
+    [
+        (data_sources_interfaces.get_duckdb_interface, "_cursors"),
+        (data_sources_interfaces.get_sqlite_interface, "_connections"),
+    ],
+)
+def test_pooled_interface_releases_connections_of_exited_threads(tmp_path, getter, registry):
+    interface = getter(tmp_path / "store")
+    interface.con.execute("SELECT 1")
+
+    for _ in range(8):
+        thread = threading.Thread(target=lambda: interface.con.execute("SELECT 1"))
+        thread.start()
+        thread.join()
+
+    assert list(getattr(interface, registry).values()) == [interface.con]
+
+
+def test_close_local_data_interfaces_empties_pool(tmp_path):
+    interface = data_sources_interfaces.get_sqlite_interface(tmp_path / "store")
+    interface.con.execute("SELECT 1")
+
+    data_sources_interfaces.close_local_data_interfaces()
+
+    assert data_sources_interfaces.get_sqlite_interface(tmp_path / "store") is not interface
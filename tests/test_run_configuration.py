@@ -12,6 +12,7 @@ from pydantic import ValidationError
 import mainsequence.client.metatables as models_metatables
 import mainsequence.client.models_foundry as models_foundry
 import mainsequence.meta_tables.data_nodes.data_nodes as data_nodes_mod
+import mainsequence.meta_tables.data_nodes.run_operations as run_operations
 from mainsequence.client.metatables import (
     DataNodeUpdate,
     DataNodeUpdateDetails,
@@ -908,6 +909,49 @@ def test_data_node_update_output_rejects_non_string_values_for_declared_string()
         )
 
 
+def test_data_node_update_output_reports_first_invalid_uuid_value():
+    frame = pd.DataFrame(
+        {"asset_uid": ["0" * 32, "{%s}" % ("1" * 32), "not-a-uuid", "also-bad", None]},
+        index=pd.DatetimeIndex([pd.Timestamp("2026-04-13T00:00:00Z")] * 5, name="time_index"),
+    )
+
+    with pytest.raises(TypeError, match="non-UUID value: 'not-a-uuid'"):
+        UpdateRunner.validate_data_frame(
+            frame,
+            storage_class_type="timescale",
+            meta_table=_meta_table(columns=[{"name": "asset_uid", "data_type": "uuid"}]),
+        )
+
+
+def test_data_node_update_output_sampled_validation_checks_head_and_tail(monkeypatch):
+    monkeypatch.setattr(run_operations, "VALIDATION_SAMPLE_ROWS", 8)
+    monkeypatch.setattr(run_operations, "VALIDATION_PARALLEL_MIN_ROWS", 10)
+    rows = 100
+    frame = pd.DataFrame(
+        {"name": ["Asset"] * rows, "payload": [{"a": 1}] * rows},
+        index=pd.DatetimeIndex(
+            pd.date_range("2026-04-13", periods=rows, freq="1min", tz="UTC"), name="time_index"
+        ),
+    )
+    meta_table = _meta_table(
+        columns=[
+            {"name": "name", "data_type": "string"},
+            {"name": "payload", "data_type": "jsonb"},
+        ]
+    )
+    frame.iloc[-1, 1] = object()
+
+    for level in ("full", "sampled"):
+        with pytest.raises(TypeError, match="non-JSON-serializable"):
+            UpdateRunner.validate_data_frame(
+                frame, storage_class_type="timescale", meta_table=meta_table, validation_level=level
+            )
+    with pytest.raises(ValueError, match="validation_level"):
+        UpdateRunner.validate_data_frame(
+            frame, storage_class_type="timescale", validation_level="none"
+        )
+
+
 def test_data_node_update_output_validates_against_storage_table_contract():
     class SchemaNode(DataNode):
         def dependencies(self):
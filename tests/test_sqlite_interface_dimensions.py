@@ -2,8 +2,10 @@ import datetime
 from types import SimpleNamespace
 
 import pandas as pd
+import pytest
 
 from mainsequence.client import metatables as models_metatables
+from mainsequence.client.data_sources_interfaces import sqlite as sqlite_interface
 from mainsequence.client.data_sources_interfaces.sqlite import SQLiteInterface
 
 INDEX_NAMES = ["time_index", "account_uid", "asset_uid"]
@@ -70,6 +72,125 @@ def test_sqlite_local_backend_has_physical_unique_index_but_no_fk_constraints(tm
     assert interface.con.execute('PRAGMA foreign_key_list("node")').fetchall() == []
 
 
+def test_sqlite_upsert_converts_columns_like_per_value_storage(tmp_path, monkeypatch):
+    interface = _interface(tmp_path)
+    df = pd.DataFrame(
+        {
+            "time_index": [_dt(0), _dt(0), _dt(1)],
+            "account_uid": ["acct-a", "acct-b", "acct-a"],
+            "asset_uid": ["asset-1", "asset-1", "asset-2"],
+            "value": [10.5, float("nan"), 30.0],
+            "volume": pd.array([1, None, 3], dtype="Int64"),
+            "halted": pd.array([True, None, False], dtype="boolean"),
+            "note": ["x", None, "z"],
+            "as_of": [datetime.date(2026, 5, 24), None, datetime.date(2026, 5, 25)],
+        }
+    )
+    monkeypatch.setattr(sqlite_interface, "UPSERT_BATCH_ROWS", 2)
+
+    interface.upsert(df, table="node", index_names=INDEX_NAMES, time_index_name="time_index")
+
+    stored = [
+        tuple(row)
+        for row in interface.con.execute(
+            'SELECT * FROM "node" ORDER BY time_index, account_uid, asset_uid'
+        ).fetchall()
+    ]
+    expected = [
+        tuple(SQLiteInterface._sqlite_value(value) for value in row)
+        for row in df.itertuples(index=False)
+    ]
+    assert stored == expected
+    assert stored[0][0] == "2026-05-25T00:00:00.000000000Z"
+    assert stored[1][3:] == (None, None, None, None, None)
+
+    with pytest.raises(ValueError, match="Unsupported SQLite"):
+        interface.upsert(
+            df.assign(note=[{"a": 1}, None, "z"]),
+            table="node",
+            index_names=INDEX_NAMES,
+            time_index_name="time_index",
+        )
+
+
+def test_sqlite_epoch_ns_time_storage_reads_like_iso(tmp_path):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface, table="iso_node")
+    _seed_n_dimensional_table(interface, table="legacy_node")
+    interface.upsert(
+        pd.DataFrame(
+            {
+                "time_index": [_dt(0), _dt(0), _dt(1)],
+                "account_uid": ["acct-a", "acct-b", "acct-a"],
+                "asset_uid": ["asset-1", "asset-1", "asset-2"],
+                "value": [10.0, 20.0, 30.0],
+            }
+        ),
+        table="epoch_node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        time_storage="epoch_ns",
+    )
+    filters = dict(
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        start=_dt(0),
+        great_or_equal=False,
+        dimension_range_map=[
+            {"coordinate": {"account_uid": "acct-a", "asset_uid": "asset-2"}, "end_date": _dt(1)}
+        ],
+    )
+
+    assert interface.time_storage("epoch_node") == "epoch_ns"
+    assert interface.con.execute('SELECT typeof(time_index) FROM "epoch_node"').fetchone()[0] == (
+        "integer"
+    )
+    pd.testing.assert_frame_equal(
+        interface.read(table="epoch_node", **filters), interface.read(table="iso_node", **filters)
+    )
+    assert interface.time_index_minima(
+        "epoch_node", index_names=INDEX_NAMES, time_index_name="time_index"
+    ) == interface.time_index_minima(
+        "iso_node", index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+
+    assert interface.migrate_time_storage(
+        "legacy_node", index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+    assert not interface.migrate_time_storage(
+        "legacy_node", index_names=INDEX_NAMES, time_index_name="time_index"
+    )
+    assert interface.time_storage("legacy_node") == "epoch_ns"
+    pd.testing.assert_frame_equal(
+        interface.read(table="legacy_node", index_names=INDEX_NAMES, time_index_name="time_index"),
+        interface.read(table="iso_node", index_names=INDEX_NAMES, time_index_name="time_index"),
+    )
+    assert interface.list_tables() == ["epoch_node", "iso_node", "legacy_node"]
+
+
+def test_sqlite_identity_index_pragmas_and_analyze(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_interface, "ANALYZE_MIN_ROWS", 3)
+    interface = SQLiteInterface(db_path=tmp_path / "sqlite", pragma_profile="fast")
+    _seed_n_dimensional_table(interface)
+
+    index_columns = [
+        row["name"]
+        for row in interface.con.execute('PRAGMA index_info("node__identity_time")').fetchall()
+    ]
+    assert index_columns == ["account_uid", "asset_uid", "time_index"]
+    assert interface.con.execute("PRAGMA synchronous").fetchone()[0] == 0
+    assert interface.con.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert interface.con.execute("PRAGMA analysis_limit").fetchone()[0] == 400
+    assert interface.con.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+
+    interface.migrate_time_storage("node", index_names=INDEX_NAMES, time_index_name="time_index")
+    assert interface.con.execute('PRAGMA index_info("node__identity_time")').fetchall()
+    assert interface.list_tables() == ["node"]
+
+    with pytest.raises(ValueError, match="pragma profile"):
+        SQLiteInterface(db_path=tmp_path / "other", pragma_profile="reckless")
+
+
 def test_sqlite_upsert_rewrites_only_matching_full_index_tuple(tmp_path):
     interface = _interface(tmp_path)
     _seed_n_dimensional_table(interface)
@@ -167,6 +288,42 @@ def test_sqlite_read_supports_dimension_range_map(tmp_path):
     assert df["value"].tolist() == [30.0]
 
 
+def test_sqlite_long_coordinate_lists_join_like_or_expansion(tmp_path, monkeypatch):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface)
+    filters = {
+        "index_coordinates": [
+            {"account_uid": "acct-a", "asset_uid": "asset-1"},
+            {"asset_uid": "asset-2"},
+        ],
+        "dimension_range_map": [
+            {"coordinate": {"account_uid": "acct-a", "asset_uid": "asset-1"}, "start_date": _dt(0)},
+            {
+                "coordinate": {"account_uid": "acct-a", "asset_uid": "asset-2"},
+                "start_date": _dt(1),
+                "start_date_operand": ">",
+            },
+            {
+                "coordinate": {"account_uid": "acct-b", "asset_uid": "asset-1"},
+                "end_date": _dt(0),
+            },
+        ],
+    }
+
+    def read(**kwargs):
+        return interface.read(
+            table="node", index_names=INDEX_NAMES, time_index_name="time_index", **kwargs
+        )
+
+    expanded = {name: read(**{name: value}) for name, value in filters.items()}
+    monkeypatch.setattr(sqlite_interface, "COORDINATE_JOIN_MIN_ENTRIES", 1)
+
+    for name, value in filters.items():
+        pd.testing.assert_frame_equal(read(**{name: value}), expanded[name])
+    assert read(**filters)["value"].tolist() == [10.0]
+    assert interface.con.execute("SELECT name FROM temp.sqlite_master").fetchall() == []
+
+
 def test_sqlite_time_index_minima_groups_by_identity_coordinates(tmp_path):
     interface = _interface(tmp_path)
     _seed_n_dimensional_table(interface)
@@ -295,3 +452,119 @@ def test_sqlite_read_dispatch_uses_adjusted_constrain_read_outputs(monkeypatch):
     assert calls["read"]["time_index_name"] == "time_index"
     assert result.index.names == INDEX_NAMES
     assert result["value"].tolist() == [10.0]
+
+
+@pytest.mark.parametrize("time_storage", ["iso", "epoch_ns"])
+def test_sqlite_constrain_read_tightens_end_to_row_cap(tmp_path, time_storage):
+    interface = _interface(tmp_path)
+    times = pd.date_range(_dt(0), periods=10 * 24, freq="1h")
+    interface.upsert(
+        pd.DataFrame(
+            {
+                "time_index": times,
+                "account_uid": "acct-a",
+                "asset_uid": "asset-1",
+                "value": range(len(times)),
+            }
+        ),
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        time_storage=time_storage,
+    )
+    kwargs = {"table": "node", "index_names": INDEX_NAMES, "time_index_name": "time_index"}
+
+    start, end, range_map, diagnostics = interface.constrain_read(**kwargs, max_rows=500)
+    assert (start, end, range_map) == (None, None, None)
+    assert diagnostics["limited"] is False
+
+    range_map = [{"coordinate": {"asset_uid": "asset-1"}, "start_date": _dt(0)}]
+    start, end, adjusted_map, diagnostics = interface.constrain_read(
+        **kwargs,
+        end=_dt(0) + datetime.timedelta(days=20),
+        dimension_range_map=range_map,
+        max_rows=60,
+    )
+
+    # 24 rows per day: the 60th row falls at noon on the third day.
+    limit = pd.Timestamp(_dt(12) + datetime.timedelta(days=2))
+    assert diagnostics["limited"] is True
+    assert diagnostics["estimated_rows_full"] == 240
+    assert end == limit
+    assert adjusted_map == [{**range_map[0], "end_date": limit, "end_date_operand": "<="}]
+    assert "end_date" not in range_map[0]
+    assert len(interface.read(**kwargs, end=end, dimension_range_map=adjusted_map)) <= 61
+
+
+def test_sqlite_constrain_read_buckets_pre_epoch_days_by_floor(tmp_path):
+    interface = _interface(tmp_path)
+    times = pd.to_datetime(["1969-12-30 12:00", "1969-12-31 12:00", "1970-01-01 01:00"], utc=True)
+    interface.upsert(
+        pd.DataFrame(
+            {
+                "time_index": times,
+                "account_uid": "acct-a",
+                "asset_uid": "asset-1",
+                "value": [1.0, 2.0, 3.0],
+            }
+        ),
+        table="node",
+        index_names=INDEX_NAMES,
+        time_index_name="time_index",
+        time_storage="epoch_ns",
+    )
+    kwargs = {"table": "node", "index_names": INDEX_NAMES, "time_index_name": "time_index"}
+
+    _, end, _, diagnostics = interface.constrain_read(**kwargs, end=times[-1], max_rows=1)
+
+    assert diagnostics["limited"] is True
+    assert end == pd.Timestamp("1969-12-31", tz="UTC")
+    assert len(interface.read(**kwargs, end=end)) == 1
+
+def test_sqlite_iter_batches_streams_read_in_index_order(tmp_path):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface)
+    filters = dict(table="node", index_names=INDEX_NAMES, time_index_name="time_index")
+
+    batches = list(interface.iter_batches(batch_rows=2, **filters))
+    assert [len(batch) for batch in batches] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), interface.read(**filters))
+    assert str(batches[0]["time_index"].dtype).endswith("UTC]")
+    with pytest.raises(ValueError, match="output"):
+        list(interface.iter_batches(output="polars", **filters))
+
+
+def test_sqlite_iter_data_by_time_index_streams_typed_batches(tmp_path, monkeypatch):
+    interface = _interface(tmp_path)
+    _seed_n_dimensional_table(interface, table="storage-hash")
+    monkeypatch.setattr(models_metatables, "_sqlite_interface", lambda: interface)
+
+    def _no_row_cap(**kwargs):
+        raise AssertionError("streaming reads are not constrained")
+
+    monkeypatch.setattr(interface, "constrain_read", _no_row_cap)
+    update = SimpleNamespace(
+        update_hash="update-hash",
+        data_node_storage=SimpleNamespace(
+            physical_table_name="storage-hash",
+            time_indexed_profile=SimpleNamespace(
+                index_names=INDEX_NAMES,
+                time_index_name="time_index",
+                column_dtypes_map={
+                    "time_index": "datetime64[ns, UTC]",
+                    "account_uid": "object",
+                    "asset_uid": "object",
+                    "value": "float64",
+                },
+            ),
+        ),
+    )
+    data_source = models_metatables.DataSource.model_construct(class_type=models_metatables.SQLITE)
+
+    batches = list(data_source.iter_data_by_time_index(update, batch_rows=2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(batch.index.names == INDEX_NAMES for batch in batches)
+    assert pd.concat(batches)["value"].tolist() == [10.0, 20.0, 30.0]
+    (arrow_batch,) = data_source.iter_data_by_time_index(update, output="arrow")
+    assert arrow_batch.schema.names == [*INDEX_NAMES, "value"]
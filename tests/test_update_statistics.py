@@ -179,6 +179,43 @@ def test_update_statistics_scopes_by_generic_identity_values():
     assert scoped.get_max_time_in_update_statistics() == _dt(2)
 
 
+def test_update_statistics_shares_normalized_stats_across_equal_columns():
+    column_stats = {"asset-1": {"min": "2026-05-01T00:00:00Z", "max": "2026-05-01T02:00:00Z"}}
+    stats = UpdateStatistics(
+        index_progress={"asset-1": "2026-05-01T02:00:00Z", "asset-2": None},
+        multi_index_column_stats={
+            "open": dict(column_stats),
+            "close": dict(column_stats),
+            "volume": {"asset-1": {"min": "2026-05-01T01:00:00Z", "max": None}},
+        },
+    )
+    stats._initial_fallback_date = _dt(0)
+
+    column_stats = stats.multi_index_column_stats
+    assert column_stats["open"] == {"asset-1": {"min": _dt(0), "max": _dt(2)}}
+    assert column_stats["close"] == column_stats["open"]
+    assert column_stats["close"] is not column_stats["open"]
+    assert column_stats["volume"] == {"asset-1": {"min": _dt(1), "max": None}}
+
+    range_map = stats.get_columnar_identity_range_map_great_or_equal(
+        extra_time_delta=datetime.timedelta(hours=1)
+    )
+    assert range_map == {
+        "open": {"asset-1": {"start_date_operand": ">=", "start_date": _dt(3)}},
+        "close": {"asset-1": {"start_date_operand": ">=", "start_date": _dt(3)}},
+        "volume": {"asset-1": {"start_date_operand": ">=", "start_date": _dt(1)}},
+    }
+    assert range_map["open"]["asset-1"] is not range_map["close"]["asset-1"]
+
+    scoped = stats.update_identity_scope(["asset-2", "asset-3"], init_fallback_date=_dt(1))
+    assert scoped.index_progress == {"asset-2": None, "asset-3": _dt(1)}
+    assert scoped.get_max_time_in_update_statistics() == _dt(1)
+    assert stats.get_index_progress_leaf_values() == [_dt(2)]
+
+    column_stats["close"]["asset-1"] = {"min": _dt(1), "max": _dt(3)}
+    assert column_stats["open"]["asset-1"] == {"min": _dt(0), "max": _dt(2)}
+
+
 def test_update_statistics_has_no_domain_asset_scoping_api():
     assert not hasattr(UpdateStatistics, "update_assets")
     assert not hasattr(UpdateStatistics, "asset_identifier")
@@ -249,3 +286,57 @@ def test_update_statistics_three_index_normalizes_nested_stats_and_filters_dataf
         (_dt(3), "account-a", "asset-1"),
         (_dt(1), "account-b", "asset-1"),
     ]
+
+
+def test_update_statistics_filters_two_index_dataframe_against_identity_watermarks():
+    stats = UpdateStatistics(
+        index_progress={
+            "asset-1": "2026-05-01T02:00:00Z",
+            "asset-2": None,
+        }
+    )
+    index = pd.MultiIndex.from_tuples(
+        [
+            (_dt(1), "asset-1"),
+            (_dt(2), "asset-1"),
+            (_dt(3), "asset-1"),
+            (_dt(3), "asset-1"),
+            (_dt(0), "asset-2"),
+            (_dt(0), "asset-3"),
+        ],
+        names=["time_index", "unique_identifier"],
+    )
+    df = pd.DataFrame({"value": [1, 2, 3, 4, 5, 6]}, index=index)
+
+    filtered = stats.filter_df_by_latest_value(df)
+
+    assert filtered["value"].tolist() == [3, 5, 6]
+    assert stats._index_progress_watermarks(["unique_identifier"]).to_dict() == {
+        "asset-1": pd.Timestamp("2026-05-01T02:00:00Z")
+    }
+
+    stats["asset-3"] = "2026-05-01T00:00:00Z"
+    assert stats.filter_df_by_latest_value(df)["value"].tolist() == [3, 5]
+
+
+def test_update_statistics_nested_branches_are_read_only_views():
+    stats = UpdateStatistics(
+        index_progress={
+            "acct-a": {"asset-1": "2026-05-01T02:00:00Z"},
+            "acct-b": {"asset-1": "2026-05-01T01:00:00Z"},
+        }
+    )
+    assert stats.get_index_progress_leaf_values() == [_dt(2), _dt(1)]
+
+    branch = stats["acct-a"]
+    with pytest.raises(TypeError):
+        branch["asset-1"] = _dt(5)
+    with pytest.raises(TypeError):
+        dict(stats.items())["acct-b"]["asset-1"] = _dt(5)
+    assert branch == {"asset-1": _dt(2)}
+    assert stats.get_index_progress_leaf_values() == [_dt(2), _dt(1)]
+
+    stats["acct-a"] = {**branch, "asset-1": _dt(5)}
+    assert stats.get_index_progress_leaf_values() == [_dt(5), _dt(1)]
+    assert stats.index_progress["acct-a"] == {"asset-1": _dt(5)}
+    assert isinstance(stats.index_progress["acct-a"], dict)